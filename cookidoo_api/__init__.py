@@ -2,36 +2,187 @@
 
 __version__ = "0.7.0"
 
-from .const import DEFAULT_COOKIDOO_CONFIG
-from .cookidoo import Cookidoo
-from .exceptions import (
-    CookidooAuthException,
-    CookidooConfigException,
-    CookidooException,
-    CookidooParseException,
-    CookidooRequestException,
-    CookidooResponseException,
-    CookidooUnavailableException,
-)
-from .helpers import get_country_options, get_language_options, get_localization_options
-from .types import (
-    CookidooAdditionalItem,
-    CookidooAuthResponse,
-    CookidooConfig,
-    CookidooIngredientItem,
-    CookidooItem,
-    CookidooLocalizationConfig,
-    CookidooRecipe,
-    CookidooRecipeDetails,
-    CookidooSubscription,
-    CookidooUserInfo,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache import CookidooRecipeCache, CookidooRecipeCacheEntry
+    from .coalesce import CookidooWriteCoalescer
+    from .codec import CookidooJSONCodec, get_json_codec
+    from .const import DEFAULT_COOKIDOO_CONFIG
+    from .cookidoo import Cookidoo
+    from .exceptions import (
+        CookidooAuthException,
+        CookidooConfigException,
+        CookidooException,
+        CookidooParseException,
+        CookidooRequestException,
+        CookidooResponseException,
+        CookidooUnavailableException,
+    )
+    from .fake_server import CookidooFakeServer
+    from .helpers import (
+        get_country_options,
+        get_language_options,
+        get_localization,
+        get_localization_options,
+    )
+    from .localization import LOCALIZATIONS, CookidooLocalizationRegistry
+    from .mirror import CookidooMirrorWrite, CookidooShoppingListMirror
+    from .models import (
+        CookidooAdditionalItemModel,
+        CookidooCategoryModel,
+        CookidooCollectionModel,
+        CookidooIngredientItemModel,
+        CookidooIngredientModel,
+        CookidooModel,
+        CookidooRecipeDetailsModel,
+        CookidooRecipeModel,
+        CookidooShoppingListModel,
+        CookidooSubscriptionModel,
+        CookidooUserInfoModel,
+    )
+    from .pool import CookidooPool
+    from .ratelimit import CookidooRateLimiter
+    from .retry import CookidooCircuitBreaker, CookidooRetryPolicy
+    from .store import CookidooRecipeStore, CookidooStoredRecipe
+    from .sync import CookidooShoppingListPlan, CookidooShoppingListSync
+    from .tokens import (
+        CookidooFileTokenStore,
+        CookidooSQLiteTokenStore,
+        CookidooStoredToken,
+        CookidooTokenStore,
+    )
+    from .types import (
+        CookidooAdditionalItem,
+        CookidooAuthResponse,
+        CookidooCacheStats,
+        CookidooConfig,
+        CookidooIngredientItem,
+        CookidooItem,
+        CookidooLocalizationConfig,
+        CookidooMirrorStats,
+        CookidooPoolStats,
+        CookidooRecipe,
+        CookidooRecipeDetails,
+        CookidooShoppingList,
+        CookidooShoppingListChanges,
+        CookidooShoppingListState,
+        CookidooSubscription,
+        CookidooUserInfo,
+    )
+
+# the submodules are imported on first access, so that importing the package
+# does not import aiohttp for callers using only the types or helpers
+_LAZY_IMPORTS = {
+    "CookidooRecipeCache": "cache",
+    "CookidooRecipeCacheEntry": "cache",
+    "CookidooWriteCoalescer": "coalesce",
+    "CookidooJSONCodec": "codec",
+    "get_json_codec": "codec",
+    "DEFAULT_COOKIDOO_CONFIG": "const",
+    "Cookidoo": "cookidoo",
+    "CookidooAuthException": "exceptions",
+    "CookidooConfigException": "exceptions",
+    "CookidooException": "exceptions",
+    "CookidooParseException": "exceptions",
+    "CookidooRequestException": "exceptions",
+    "CookidooResponseException": "exceptions",
+    "CookidooUnavailableException": "exceptions",
+    "CookidooFakeServer": "fake_server",
+    "get_country_options": "helpers",
+    "get_language_options": "helpers",
+    "get_localization": "helpers",
+    "get_localization_options": "helpers",
+    "LOCALIZATIONS": "localization",
+    "CookidooLocalizationRegistry": "localization",
+    "CookidooMirrorWrite": "mirror",
+    "CookidooShoppingListMirror": "mirror",
+    "CookidooAdditionalItemModel": "models",
+    "CookidooCategoryModel": "models",
+    "CookidooCollectionModel": "models",
+    "CookidooIngredientItemModel": "models",
+    "CookidooIngredientModel": "models",
+    "CookidooModel": "models",
+    "CookidooRecipeDetailsModel": "models",
+    "CookidooRecipeModel": "models",
+    "CookidooShoppingListModel": "models",
+    "CookidooSubscriptionModel": "models",
+    "CookidooUserInfoModel": "models",
+    "CookidooPool": "pool",
+    "CookidooRateLimiter": "ratelimit",
+    "CookidooCircuitBreaker": "retry",
+    "CookidooRetryPolicy": "retry",
+    "CookidooRecipeStore": "store",
+    "CookidooStoredRecipe": "store",
+    "CookidooShoppingListPlan": "sync",
+    "CookidooShoppingListSync": "sync",
+    "CookidooFileTokenStore": "tokens",
+    "CookidooSQLiteTokenStore": "tokens",
+    "CookidooStoredToken": "tokens",
+    "CookidooTokenStore": "tokens",
+    "CookidooAdditionalItem": "types",
+    "CookidooAuthResponse": "types",
+    "CookidooCacheStats": "types",
+    "CookidooConfig": "types",
+    "CookidooIngredientItem": "types",
+    "CookidooItem": "types",
+    "CookidooLocalizationConfig": "types",
+    "CookidooMirrorStats": "types",
+    "CookidooPoolStats": "types",
+    "CookidooRecipe": "types",
+    "CookidooRecipeDetails": "types",
+    "CookidooShoppingList": "types",
+    "CookidooShoppingListChanges": "types",
+    "CookidooShoppingListState": "types",
+    "CookidooSubscription": "types",
+    "CookidooUserInfo": "types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the lazy ones."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     "Cookidoo",
     "get_country_options",
     "get_language_options",
     "get_localization_options",
+    "get_localization",
+    "get_json_codec",
+    "CookidooJSONCodec",
+    "CookidooRecipeCache",
+    "CookidooRecipeCacheEntry",
+    "CookidooCacheStats",
+    "CookidooRecipeStore",
+    "CookidooStoredRecipe",
+    "CookidooRetryPolicy",
+    "CookidooCircuitBreaker",
+    "CookidooRateLimiter",
+    "CookidooShoppingListSync",
+    "CookidooShoppingListPlan",
+    "CookidooWriteCoalescer",
+    "CookidooShoppingListMirror",
+    "CookidooMirrorWrite",
+    "CookidooMirrorStats",
+    "CookidooPool",
+    "CookidooPoolStats",
+    "CookidooTokenStore",
+    "CookidooFileTokenStore",
+    "CookidooSQLiteTokenStore",
+    "CookidooStoredToken",
+    "CookidooFakeServer",
     "CookidooLocalizationConfig",
     "CookidooConfig",
     "CookidooAuthResponse",
@@ -42,6 +193,20 @@ __all__ = [
     "CookidooIngredientItem",
     "CookidooRecipe",
     "CookidooRecipeDetails",
+    "CookidooShoppingList",
+    "CookidooShoppingListState",
+    "CookidooShoppingListChanges",
+    "CookidooModel",
+    "CookidooUserInfoModel",
+    "CookidooSubscriptionModel",
+    "CookidooIngredientModel",
+    "CookidooIngredientItemModel",
+    "CookidooAdditionalItemModel",
+    "CookidooRecipeModel",
+    "CookidooCategoryModel",
+    "CookidooCollectionModel",
+    "CookidooRecipeDetailsModel",
+    "CookidooShoppingListModel",
     "CookidooException",
     "CookidooConfigException",
     "CookidooAuthException",
@@ -50,4 +215,6 @@ __all__ = [
     "CookidooResponseException",
     "CookidooUnavailableException",
     "DEFAULT_COOKIDOO_CONFIG",
+    "CookidooLocalizationRegistry",
+    "LOCALIZATIONS",
 ]
@@ -0,0 +1,381 @@
+"""Cookidoo API localization options, generated from localization.json.
+
+Do not edit, run `scripts/generate-localization-module.py` instead.
+"""
+
+# (country_code, language, url)
+OPTIONS = (
+    ("ar", "en", "https://cookidoo.international/foundation/en"),
+    ("ar", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ar", "el", "https://cookidoo.international/foundation/el"),
+    ("ar", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ar", "id", "https://cookidoo.international/foundation/id"),
+    ("ar", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ar", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ar", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ar", "es", "https://cookidoo.international/foundation/es"),
+    ("ar", "vi", "https://cookidoo.international/foundation/vi"),
+    ("au", "en-AU", "https://cookidoo.com.au/foundation/en-AU"),
+    ("at", "de-AT", "https://cookidoo.at/foundation/de-AT"),
+    ("be", "nl-BE", "https://cookidoo.be/foundation/nl-BE"),
+    ("be", "en", "https://cookidoo.be/foundation/en"),
+    ("be", "fr-BE", "https://cookidoo.be/foundation/fr-BE"),
+    ("be", "de-BE", "https://cookidoo.be/foundation/de-BE"),
+    ("br", "en", "https://cookidoo.international/foundation/en"),
+    ("br", "fr", "https://cookidoo.international/foundation/fr"),
+    ("br", "el", "https://cookidoo.international/foundation/el"),
+    ("br", "hu", "https://cookidoo.international/foundation/hu"),
+    ("br", "id", "https://cookidoo.international/foundation/id"),
+    ("br", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("br", "ro", "https://cookidoo.international/foundation/ro"),
+    ("br", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("br", "es", "https://cookidoo.international/foundation/es"),
+    ("br", "vi", "https://cookidoo.international/foundation/vi"),
+    ("bn", "en", "https://cookidoo.international/foundation/en"),
+    ("bn", "fr", "https://cookidoo.international/foundation/fr"),
+    ("bn", "el", "https://cookidoo.international/foundation/el"),
+    ("bn", "hu", "https://cookidoo.international/foundation/hu"),
+    ("bn", "id", "https://cookidoo.international/foundation/id"),
+    ("bn", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("bn", "ro", "https://cookidoo.international/foundation/ro"),
+    ("bn", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("bn", "es", "https://cookidoo.international/foundation/es"),
+    ("bn", "vi", "https://cookidoo.international/foundation/vi"),
+    ("ca", "en-CA", "https://cookidoo.ca/foundation/en-CA"),
+    ("ca", "fr-CA", "https://cookidoo.ca/foundation/fr-CA"),
+    ("cl", "en", "https://cookidoo.international/foundation/en"),
+    ("cl", "fr", "https://cookidoo.international/foundation/fr"),
+    ("cl", "el", "https://cookidoo.international/foundation/el"),
+    ("cl", "hu", "https://cookidoo.international/foundation/hu"),
+    ("cl", "id", "https://cookidoo.international/foundation/id"),
+    ("cl", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("cl", "ro", "https://cookidoo.international/foundation/ro"),
+    ("cl", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("cl", "es", "https://cookidoo.international/foundation/es"),
+    ("cl", "vi", "https://cookidoo.international/foundation/vi"),
+    ("co", "en", "https://cookidoo.international/foundation/en"),
+    ("co", "fr", "https://cookidoo.international/foundation/fr"),
+    ("co", "el", "https://cookidoo.international/foundation/el"),
+    ("co", "hu", "https://cookidoo.international/foundation/hu"),
+    ("co", "id", "https://cookidoo.international/foundation/id"),
+    ("co", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("co", "ro", "https://cookidoo.international/foundation/ro"),
+    ("co", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("co", "es", "https://cookidoo.international/foundation/es"),
+    ("co", "vi", "https://cookidoo.international/foundation/vi"),
+    ("cy", "en", "https://cookidoo.international/foundation/en"),
+    ("cy", "fr", "https://cookidoo.international/foundation/fr"),
+    ("cy", "el", "https://cookidoo.international/foundation/el"),
+    ("cy", "hu", "https://cookidoo.international/foundation/hu"),
+    ("cy", "id", "https://cookidoo.international/foundation/id"),
+    ("cy", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("cy", "ro", "https://cookidoo.international/foundation/ro"),
+    ("cy", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("cy", "es", "https://cookidoo.international/foundation/es"),
+    ("cy", "vi", "https://cookidoo.international/foundation/vi"),
+    ("cz", "cs", "https://cookidoo.cz/foundation/cs"),
+    ("dk", "en", "https://cookidoo.international/foundation/en"),
+    ("dk", "fr", "https://cookidoo.international/foundation/fr"),
+    ("dk", "el", "https://cookidoo.international/foundation/el"),
+    ("dk", "hu", "https://cookidoo.international/foundation/hu"),
+    ("dk", "id", "https://cookidoo.international/foundation/id"),
+    ("dk", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("dk", "ro", "https://cookidoo.international/foundation/ro"),
+    ("dk", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("dk", "es", "https://cookidoo.international/foundation/es"),
+    ("dk", "vi", "https://cookidoo.international/foundation/vi"),
+    ("ee", "en", "https://cookidoo.international/foundation/en"),
+    ("ee", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ee", "el", "https://cookidoo.international/foundation/el"),
+    ("ee", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ee", "id", "https://cookidoo.international/foundation/id"),
+    ("ee", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ee", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ee", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ee", "es", "https://cookidoo.international/foundation/es"),
+    ("ee", "vi", "https://cookidoo.international/foundation/vi"),
+    ("fr", "fr-FR", "https://cookidoo.fr/foundation/fr-FR"),
+    ("de", "de-DE", "https://cookidoo.de/foundation/de-DE"),
+    ("gr", "en", "https://cookidoo.international/foundation/en"),
+    ("gr", "fr", "https://cookidoo.international/foundation/fr"),
+    ("gr", "el", "https://cookidoo.international/foundation/el"),
+    ("gr", "hu", "https://cookidoo.international/foundation/hu"),
+    ("gr", "id", "https://cookidoo.international/foundation/id"),
+    ("gr", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("gr", "ro", "https://cookidoo.international/foundation/ro"),
+    ("gr", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("gr", "es", "https://cookidoo.international/foundation/es"),
+    ("gr", "vi", "https://cookidoo.international/foundation/vi"),
+    ("gt", "en", "https://cookidoo.international/foundation/en"),
+    ("gt", "fr", "https://cookidoo.international/foundation/fr"),
+    ("gt", "el", "https://cookidoo.international/foundation/el"),
+    ("gt", "hu", "https://cookidoo.international/foundation/hu"),
+    ("gt", "id", "https://cookidoo.international/foundation/id"),
+    ("gt", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("gt", "ro", "https://cookidoo.international/foundation/ro"),
+    ("gt", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("gt", "es", "https://cookidoo.international/foundation/es"),
+    ("gt", "vi", "https://cookidoo.international/foundation/vi"),
+    ("hu", "en", "https://cookidoo.international/foundation/en"),
+    ("hu", "fr", "https://cookidoo.international/foundation/fr"),
+    ("hu", "el", "https://cookidoo.international/foundation/el"),
+    ("hu", "hu", "https://cookidoo.international/foundation/hu"),
+    ("hu", "id", "https://cookidoo.international/foundation/id"),
+    ("hu", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("hu", "ro", "https://cookidoo.international/foundation/ro"),
+    ("hu", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("hu", "es", "https://cookidoo.international/foundation/es"),
+    ("hu", "vi", "https://cookidoo.international/foundation/vi"),
+    ("is", "en", "https://cookidoo.international/foundation/en"),
+    ("is", "fr", "https://cookidoo.international/foundation/fr"),
+    ("is", "el", "https://cookidoo.international/foundation/el"),
+    ("is", "hu", "https://cookidoo.international/foundation/hu"),
+    ("is", "id", "https://cookidoo.international/foundation/id"),
+    ("is", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("is", "ro", "https://cookidoo.international/foundation/ro"),
+    ("is", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("is", "es", "https://cookidoo.international/foundation/es"),
+    ("is", "vi", "https://cookidoo.international/foundation/vi"),
+    ("id", "en", "https://cookidoo.international/foundation/en"),
+    ("id", "fr", "https://cookidoo.international/foundation/fr"),
+    ("id", "el", "https://cookidoo.international/foundation/el"),
+    ("id", "hu", "https://cookidoo.international/foundation/hu"),
+    ("id", "id", "https://cookidoo.international/foundation/id"),
+    ("id", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("id", "ro", "https://cookidoo.international/foundation/ro"),
+    ("id", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("id", "es", "https://cookidoo.international/foundation/es"),
+    ("id", "vi", "https://cookidoo.international/foundation/vi"),
+    ("ie", "en-GB", "https://cookidoo.co.uk/foundation/en-GB"),
+    ("il", "en", "https://cookidoo.international/foundation/en"),
+    ("il", "fr", "https://cookidoo.international/foundation/fr"),
+    ("il", "el", "https://cookidoo.international/foundation/el"),
+    ("il", "hu", "https://cookidoo.international/foundation/hu"),
+    ("il", "id", "https://cookidoo.international/foundation/id"),
+    ("il", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("il", "ro", "https://cookidoo.international/foundation/ro"),
+    ("il", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("il", "es", "https://cookidoo.international/foundation/es"),
+    ("il", "vi", "https://cookidoo.international/foundation/vi"),
+    ("it", "it-IT", "https://cookidoo.it/foundation/it-IT"),
+    ("kw", "en", "https://cookidoo.international/foundation/en"),
+    ("kw", "fr", "https://cookidoo.international/foundation/fr"),
+    ("kw", "el", "https://cookidoo.international/foundation/el"),
+    ("kw", "hu", "https://cookidoo.international/foundation/hu"),
+    ("kw", "id", "https://cookidoo.international/foundation/id"),
+    ("kw", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("kw", "ro", "https://cookidoo.international/foundation/ro"),
+    ("kw", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("kw", "es", "https://cookidoo.international/foundation/es"),
+    ("kw", "vi", "https://cookidoo.international/foundation/vi"),
+    ("lt", "en", "https://cookidoo.international/foundation/en"),
+    ("lt", "fr", "https://cookidoo.international/foundation/fr"),
+    ("lt", "el", "https://cookidoo.international/foundation/el"),
+    ("lt", "hu", "https://cookidoo.international/foundation/hu"),
+    ("lt", "id", "https://cookidoo.international/foundation/id"),
+    ("lt", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("lt", "ro", "https://cookidoo.international/foundation/ro"),
+    ("lt", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("lt", "es", "https://cookidoo.international/foundation/es"),
+    ("lt", "vi", "https://cookidoo.international/foundation/vi"),
+    ("lu", "nl-BE", "https://cookidoo.be/foundation/nl-BE"),
+    ("lu", "en", "https://cookidoo.be/foundation/en"),
+    ("lu", "fr-BE", "https://cookidoo.be/foundation/fr-BE"),
+    ("lu", "de-BE", "https://cookidoo.be/foundation/de-BE"),
+    ("my", "en", "https://cookidoo.international/foundation/en"),
+    ("my", "fr", "https://cookidoo.international/foundation/fr"),
+    ("my", "el", "https://cookidoo.international/foundation/el"),
+    ("my", "hu", "https://cookidoo.international/foundation/hu"),
+    ("my", "id", "https://cookidoo.international/foundation/id"),
+    ("my", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("my", "ro", "https://cookidoo.international/foundation/ro"),
+    ("my", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("my", "es", "https://cookidoo.international/foundation/es"),
+    ("my", "vi", "https://cookidoo.international/foundation/vi"),
+    ("mt", "en", "https://cookidoo.international/foundation/en"),
+    ("mt", "fr", "https://cookidoo.international/foundation/fr"),
+    ("mt", "el", "https://cookidoo.international/foundation/el"),
+    ("mt", "hu", "https://cookidoo.international/foundation/hu"),
+    ("mt", "id", "https://cookidoo.international/foundation/id"),
+    ("mt", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("mt", "ro", "https://cookidoo.international/foundation/ro"),
+    ("mt", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("mt", "es", "https://cookidoo.international/foundation/es"),
+    ("mt", "vi", "https://cookidoo.international/foundation/vi"),
+    ("mx", "es-MX", "https://cookidoo.mx/foundation/es-MX"),
+    ("ma", "en", "https://cookidoo.international/foundation/en"),
+    ("ma", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ma", "el", "https://cookidoo.international/foundation/el"),
+    ("ma", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ma", "id", "https://cookidoo.international/foundation/id"),
+    ("ma", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ma", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ma", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ma", "es", "https://cookidoo.international/foundation/es"),
+    ("ma", "vi", "https://cookidoo.international/foundation/vi"),
+    ("nl", "nl-BE", "https://cookidoo.be/foundation/nl-BE"),
+    ("nl", "en", "https://cookidoo.be/foundation/en"),
+    ("nl", "fr-BE", "https://cookidoo.be/foundation/fr-BE"),
+    ("nl", "de-BE", "https://cookidoo.be/foundation/de-BE"),
+    ("nz", "en-AU", "https://cookidoo.com.au/foundation/en-AU"),
+    ("no", "en", "https://cookidoo.international/foundation/en"),
+    ("no", "fr", "https://cookidoo.international/foundation/fr"),
+    ("no", "el", "https://cookidoo.international/foundation/el"),
+    ("no", "hu", "https://cookidoo.international/foundation/hu"),
+    ("no", "id", "https://cookidoo.international/foundation/id"),
+    ("no", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("no", "ro", "https://cookidoo.international/foundation/ro"),
+    ("no", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("no", "es", "https://cookidoo.international/foundation/es"),
+    ("no", "vi", "https://cookidoo.international/foundation/vi"),
+    ("pa", "en", "https://cookidoo.international/foundation/en"),
+    ("pa", "fr", "https://cookidoo.international/foundation/fr"),
+    ("pa", "el", "https://cookidoo.international/foundation/el"),
+    ("pa", "hu", "https://cookidoo.international/foundation/hu"),
+    ("pa", "id", "https://cookidoo.international/foundation/id"),
+    ("pa", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("pa", "ro", "https://cookidoo.international/foundation/ro"),
+    ("pa", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("pa", "es", "https://cookidoo.international/foundation/es"),
+    ("pa", "vi", "https://cookidoo.international/foundation/vi"),
+    ("py", "en", "https://cookidoo.international/foundation/en"),
+    ("py", "fr", "https://cookidoo.international/foundation/fr"),
+    ("py", "el", "https://cookidoo.international/foundation/el"),
+    ("py", "hu", "https://cookidoo.international/foundation/hu"),
+    ("py", "id", "https://cookidoo.international/foundation/id"),
+    ("py", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("py", "ro", "https://cookidoo.international/foundation/ro"),
+    ("py", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("py", "es", "https://cookidoo.international/foundation/es"),
+    ("py", "vi", "https://cookidoo.international/foundation/vi"),
+    ("pe", "en", "https://cookidoo.international/foundation/en"),
+    ("pe", "fr", "https://cookidoo.international/foundation/fr"),
+    ("pe", "el", "https://cookidoo.international/foundation/el"),
+    ("pe", "hu", "https://cookidoo.international/foundation/hu"),
+    ("pe", "id", "https://cookidoo.international/foundation/id"),
+    ("pe", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("pe", "ro", "https://cookidoo.international/foundation/ro"),
+    ("pe", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("pe", "es", "https://cookidoo.international/foundation/es"),
+    ("pe", "vi", "https://cookidoo.international/foundation/vi"),
+    ("ph", "en", "https://cookidoo.international/foundation/en"),
+    ("ph", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ph", "el", "https://cookidoo.international/foundation/el"),
+    ("ph", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ph", "id", "https://cookidoo.international/foundation/id"),
+    ("ph", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ph", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ph", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ph", "es", "https://cookidoo.international/foundation/es"),
+    ("ph", "vi", "https://cookidoo.international/foundation/vi"),
+    ("pl", "pl", "https://cookidoo.pl/foundation/pl"),
+    ("pt", "pt-PT", "https://cookidoo.pt/foundation/pt-PT"),
+    ("ro", "en", "https://cookidoo.international/foundation/en"),
+    ("ro", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ro", "el", "https://cookidoo.international/foundation/el"),
+    ("ro", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ro", "id", "https://cookidoo.international/foundation/id"),
+    ("ro", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ro", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ro", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ro", "es", "https://cookidoo.international/foundation/es"),
+    ("ro", "vi", "https://cookidoo.international/foundation/vi"),
+    ("sa", "en", "https://cookidoo.international/foundation/en"),
+    ("sa", "fr", "https://cookidoo.international/foundation/fr"),
+    ("sa", "el", "https://cookidoo.international/foundation/el"),
+    ("sa", "hu", "https://cookidoo.international/foundation/hu"),
+    ("sa", "id", "https://cookidoo.international/foundation/id"),
+    ("sa", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("sa", "ro", "https://cookidoo.international/foundation/ro"),
+    ("sa", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("sa", "es", "https://cookidoo.international/foundation/es"),
+    ("sa", "vi", "https://cookidoo.international/foundation/vi"),
+    ("sg", "en", "https://cookidoo.international/foundation/en"),
+    ("sg", "fr", "https://cookidoo.international/foundation/fr"),
+    ("sg", "el", "https://cookidoo.international/foundation/el"),
+    ("sg", "hu", "https://cookidoo.international/foundation/hu"),
+    ("sg", "id", "https://cookidoo.international/foundation/id"),
+    ("sg", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("sg", "ro", "https://cookidoo.international/foundation/ro"),
+    ("sg", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("sg", "es", "https://cookidoo.international/foundation/es"),
+    ("sg", "vi", "https://cookidoo.international/foundation/vi"),
+    ("za", "en", "https://cookidoo.international/foundation/en"),
+    ("za", "fr", "https://cookidoo.international/foundation/fr"),
+    ("za", "el", "https://cookidoo.international/foundation/el"),
+    ("za", "hu", "https://cookidoo.international/foundation/hu"),
+    ("za", "id", "https://cookidoo.international/foundation/id"),
+    ("za", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("za", "ro", "https://cookidoo.international/foundation/ro"),
+    ("za", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("za", "es", "https://cookidoo.international/foundation/es"),
+    ("za", "vi", "https://cookidoo.international/foundation/vi"),
+    ("es", "es-ES", "https://cookidoo.es/foundation/es-ES"),
+    ("se", "en", "https://cookidoo.international/foundation/en"),
+    ("se", "fr", "https://cookidoo.international/foundation/fr"),
+    ("se", "el", "https://cookidoo.international/foundation/el"),
+    ("se", "hu", "https://cookidoo.international/foundation/hu"),
+    ("se", "id", "https://cookidoo.international/foundation/id"),
+    ("se", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("se", "ro", "https://cookidoo.international/foundation/ro"),
+    ("se", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("se", "es", "https://cookidoo.international/foundation/es"),
+    ("se", "vi", "https://cookidoo.international/foundation/vi"),
+    ("ch", "en", "https://cookidoo.ch/foundation/en"),
+    ("ch", "fr-CH", "https://cookidoo.ch/foundation/fr-CH"),
+    ("ch", "de-CH", "https://cookidoo.ch/foundation/de-CH"),
+    ("ch", "it-CH", "https://cookidoo.ch/foundation/it-CH"),
+    ("th", "en", "https://cookidoo.international/foundation/en"),
+    ("th", "fr", "https://cookidoo.international/foundation/fr"),
+    ("th", "el", "https://cookidoo.international/foundation/el"),
+    ("th", "hu", "https://cookidoo.international/foundation/hu"),
+    ("th", "id", "https://cookidoo.international/foundation/id"),
+    ("th", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("th", "ro", "https://cookidoo.international/foundation/ro"),
+    ("th", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("th", "es", "https://cookidoo.international/foundation/es"),
+    ("th", "vi", "https://cookidoo.international/foundation/vi"),
+    ("tr", "tr-TR", "https://cookidoo.com.tr/foundation/tr-TR"),
+    ("ua", "en", "https://cookidoo.international/foundation/en"),
+    ("ua", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ua", "el", "https://cookidoo.international/foundation/el"),
+    ("ua", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ua", "id", "https://cookidoo.international/foundation/id"),
+    ("ua", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ua", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ua", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ua", "es", "https://cookidoo.international/foundation/es"),
+    ("ua", "vi", "https://cookidoo.international/foundation/vi"),
+    ("ae", "en", "https://cookidoo.international/foundation/en"),
+    ("ae", "fr", "https://cookidoo.international/foundation/fr"),
+    ("ae", "el", "https://cookidoo.international/foundation/el"),
+    ("ae", "hu", "https://cookidoo.international/foundation/hu"),
+    ("ae", "id", "https://cookidoo.international/foundation/id"),
+    ("ae", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("ae", "ro", "https://cookidoo.international/foundation/ro"),
+    ("ae", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("ae", "es", "https://cookidoo.international/foundation/es"),
+    ("ae", "vi", "https://cookidoo.international/foundation/vi"),
+    ("gb", "en-GB", "https://cookidoo.co.uk/foundation/en-GB"),
+    ("us", "en-US", "https://cookidoo.thermomix.com/foundation/en-US"),
+    ("uy", "en", "https://cookidoo.international/foundation/en"),
+    ("uy", "fr", "https://cookidoo.international/foundation/fr"),
+    ("uy", "el", "https://cookidoo.international/foundation/el"),
+    ("uy", "hu", "https://cookidoo.international/foundation/hu"),
+    ("uy", "id", "https://cookidoo.international/foundation/id"),
+    ("uy", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("uy", "ro", "https://cookidoo.international/foundation/ro"),
+    ("uy", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("uy", "es", "https://cookidoo.international/foundation/es"),
+    ("uy", "vi", "https://cookidoo.international/foundation/vi"),
+    ("vn", "en", "https://cookidoo.international/foundation/en"),
+    ("vn", "fr", "https://cookidoo.international/foundation/fr"),
+    ("vn", "el", "https://cookidoo.international/foundation/el"),
+    ("vn", "hu", "https://cookidoo.international/foundation/hu"),
+    ("vn", "id", "https://cookidoo.international/foundation/id"),
+    ("vn", "pt-BR", "https://cookidoo.international/foundation/pt-BR"),
+    ("vn", "ro", "https://cookidoo.international/foundation/ro"),
+    ("vn", "zh-Hans", "https://cookidoo.international/foundation/zh-Hans"),
+    ("vn", "es", "https://cookidoo.international/foundation/es"),
+    ("vn", "vi", "https://cookidoo.international/foundation/vi"),
+)
@@ -0,0 +1,120 @@
+"""Cookidoo API caches."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING
+
+from cookidoo_api.types import CookidooCacheStats, CookidooRecipeDetails
+
+if TYPE_CHECKING:
+    from cookidoo_api.store import CookidooRecipeStore
+
+
+@dataclass(slots=True)
+class CookidooRecipeCacheEntry:
+    """Cookidoo recipe cache entry type.
+
+    Attributes
+    ----------
+    recipe
+        The recipe details, as a model for the instances returning models
+    fetched_at
+        The unix timestamp of the last download or revalidation
+    etag
+        The `ETag` validator of the response, if any
+    last_modified
+        The `Last-Modified` validator of the response, if any
+
+    """
+
+    recipe: CookidooRecipeDetails
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class CookidooRecipeCache:
+    """In-memory LRU cache of recipe details with a time to live.
+
+    The recipes are keyed by their language and id.
+
+    Expired entries are kept until evicted, so that they can be revalidated
+    with their validators instead of being downloaded again. With a store,
+    the raw recipes are also persisted and looked up on a memory miss.
+    """
+
+    _entries: OrderedDict[tuple[str, str], CookidooRecipeCacheEntry]
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 24 * 60 * 60,
+        store: "CookidooRecipeStore | None" = None,
+    ) -> None:
+        """Init function for the recipe cache.
+
+        Parameters
+        ----------
+        max_size
+            The maximum number of recipes, the least recently used are evicted
+        ttl
+            The time in seconds a recipe is served without revalidation
+        store
+            The persistent store behind the memory cache, if any
+
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.store = store
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached recipes."""
+        return len(self._entries)
+
+    def stats(self) -> CookidooCacheStats:
+        """Cache statistics."""
+        return CookidooCacheStats(
+            size=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            revalidations=self._revalidations,
+            evictions=self._evictions,
+        )
+
+    def get(self, key: tuple[str, str]) -> CookidooRecipeCacheEntry | None:
+        """Get a recipe from memory, marking it as recently used."""
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def check(self, entry: CookidooRecipeCacheEntry | None) -> bool:
+        """Check whether a recipe is fresh, counting a hit or a miss."""
+        if entry is not None and time.time() - entry.fetched_at < self.ttl:
+            self._hits += 1
+            return True
+        self._misses += 1
+        return False
+
+    def put(self, key: tuple[str, str], entry: CookidooRecipeCacheEntry) -> None:
+        """Add or replace a recipe, evicting the least recently used if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def revalidated(self, key: tuple[str, str]) -> None:
+        """Mark an expired recipe as unchanged on the server."""
+        if entry := self._entries.get(key):
+            entry.fetched_at = time.time()
+            self._revalidations += 1
+
+    def clear(self) -> None:
+        """Remove all recipes."""
+        self._entries.clear()
@@ -0,0 +1,234 @@
+"""Cookidoo API write coalescing."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.types import (
+    CookidooAdditionalItem,
+    CookidooIngredientItem,
+    CookidooItem,
+)
+
+if TYPE_CHECKING:
+    from cookidoo_api.cookidoo import Cookidoo
+
+
+class _Batch[T: CookidooItem]:
+    """Edits of one endpoint waiting to be sent together."""
+
+    _pending: dict[str, T]
+    _result: "asyncio.Future[dict[str, T]] | None"
+    _timer: asyncio.TimerHandle | None
+
+    def __init__(
+        self,
+        send: Callable[[list[T]], Awaitable[list[T]]],
+        window: float,
+        max_size: int,
+    ) -> None:
+        self._send = send
+        self._window = window
+        self._max_size = max_size
+        self._pending = {}
+        self._result = None
+        self._timer = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, items: list[T]) -> list[T]:
+        """Add edits to the batch and wait for the response of their items."""
+        if not items:
+            return []
+        if self._result is None:
+            loop = asyncio.get_running_loop()
+            self._result = loop.create_future()
+            self._timer = loop.call_later(self._window, self.flush)
+        for item in items:
+            # the last edit of an item wins
+            self._pending.pop(item["id"], None)
+            self._pending[item["id"]] = item
+        result = self._result
+        if len(self._pending) >= self._max_size:
+            self.flush()
+        # the result is shared by the callers, it is not cancelled with one
+        edited = await asyncio.shield(result)
+        return [edited[item["id"]] for item in items if item["id"] in edited]
+
+    def flush(self) -> "asyncio.Future[dict[str, T]] | None":
+        """Send the pending edits now.
+
+        Returns
+        -------
+        asyncio.Future[dict[str, T]] | None
+            The edited items by id, once sent, or `None` if nothing is pending.
+
+        """
+        if (result := self._result) is None:
+            return None
+        if self._timer is not None:
+            self._timer.cancel()
+        items = list(self._pending.values())
+        self._pending, self._result, self._timer = {}, None, None
+        task = asyncio.ensure_future(self._deliver(items, result))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return result
+
+    async def _deliver(
+        self, items: list[T], result: "asyncio.Future[dict[str, T]]"
+    ) -> None:
+        try:
+            edited = await self._send(items)
+        except asyncio.CancelledError:
+            result.cancel()
+            raise
+        except Exception as e:
+            result.set_exception(e)
+        else:
+            result.set_result({item["id"]: item for item in edited})
+
+
+class CookidooWriteCoalescer:
+    """Coalescing of the item edits sent during a short window.
+
+    The edits are collected per endpoint and de-duplicated by item id, the last
+    edit of an item winning. Each endpoint receives one request per window,
+    and each caller gets the edited items it submitted.
+    """
+
+    def __init__(
+        self, cookidoo: "Cookidoo", window: float = 0.1, max_size: int = 500
+    ) -> None:
+        """Init function for the write coalescer.
+
+        Parameters
+        ----------
+        cookidoo
+            The client sending the edits
+        window
+            The time in seconds the edits are collected after the first one
+        max_size
+            The number of items of an endpoint sent without waiting for the
+            end of the window
+
+        Raises
+        ------
+        CookidooConfigException
+            If the window is negative or the size not positive.
+
+        """
+        if window < 0 or max_size < 1:
+            raise CookidooConfigException(
+                "The window must not be negative and the size at least 1"
+            )
+        self.cookidoo = cookidoo
+        self._ingredient_items_ownership = _Batch[CookidooIngredientItem](
+            cookidoo.edit_ingredient_items_ownership, window, max_size
+        )
+        self._additional_items_ownership = _Batch[CookidooAdditionalItem](
+            cookidoo.edit_additional_items_ownership, window, max_size
+        )
+        self._additional_items = _Batch[CookidooAdditionalItem](
+            cookidoo.edit_additional_items, window, max_size
+        )
+
+    async def edit_ingredient_items_ownership(
+        self,
+        ingredient_items: list[CookidooIngredientItem],
+    ) -> list[CookidooIngredientItem]:
+        """Edit ownership ingredient items, with the other edits of the window.
+
+        Parameters
+        ----------
+        ingredient_items
+            The ingredient items to change the the `is_owned` value for
+
+        Returns
+        -------
+        list[CookidooIngredientItem]
+            The list of the edited ingredient items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        return await self._ingredient_items_ownership.submit(ingredient_items)
+
+    async def edit_additional_items_ownership(
+        self,
+        additional_items: list[CookidooAdditionalItem],
+    ) -> list[CookidooAdditionalItem]:
+        """Edit ownership additional items, with the other edits of the window.
+
+        Parameters
+        ----------
+        additional_items
+            The additional items to change the the `is_owned` value for
+
+        Returns
+        -------
+        list[CookidooAdditionalItem]
+            The list of the edited additional items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        return await self._additional_items_ownership.submit(additional_items)
+
+    async def edit_additional_items(
+        self,
+        additional_items: list[CookidooAdditionalItem],
+    ) -> list[CookidooAdditionalItem]:
+        """Edit additional items, with the other edits of the window.
+
+        Parameters
+        ----------
+        additional_items
+            The additional items to change the the `name` value for
+
+        Returns
+        -------
+        list[CookidooAdditionalItem]
+            The list of the edited additional items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        return await self._additional_items.submit(additional_items)
+
+    async def flush(self) -> None:
+        """Send the pending edits now and wait for them to be sent.
+
+        The errors are raised to the callers of the edits, not here.
+        """
+        results = [
+            result
+            for batch in (
+                self._ingredient_items_ownership,
+                self._additional_items_ownership,
+                self._additional_items,
+            )
+            if (result := batch.flush()) is not None
+        ]
+        await asyncio.gather(*results, return_exceptions=True)
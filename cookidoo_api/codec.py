@@ -0,0 +1,95 @@
+"""Cookidoo API json codecs."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import json
+from typing import Any
+
+from cookidoo_api.exceptions import CookidooConfigException
+
+
+@dataclass(frozen=True, slots=True)
+class CookidooJSONCodec:
+    """Cookidoo json codec type.
+
+    Attributes
+    ----------
+    name
+        The name of the codec
+    loads
+        Decode a json document from bytes, raising a `ValueError` if invalid
+    dumps
+        Encode an object to a json document as bytes
+
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+STDLIB_JSON_CODEC = CookidooJSONCodec("json", json.loads, _json_dumps)
+
+
+def _orjson_codec() -> CookidooJSONCodec:
+    import orjson
+
+    return CookidooJSONCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> CookidooJSONCodec:
+    import msgspec
+
+    return CookidooJSONCodec(
+        "msgspec", msgspec.json.Decoder().decode, msgspec.json.Encoder().encode
+    )
+
+
+_CODECS: dict[str, Callable[[], CookidooJSONCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": lambda: STDLIB_JSON_CODEC,
+}
+
+
+def get_json_codec(name: str | None = None) -> CookidooJSONCodec:
+    """Get a json codec.
+
+    Parameters
+    ----------
+    name
+        The name of the codec (`orjson`, `msgspec` or `json`),
+        if omitted the fastest installed one, falling back to the stdlib `json`
+
+    Returns
+    -------
+    CookidooJSONCodec
+        The json codec
+
+    Raises
+    ------
+    CookidooConfigException
+        If the codec is unknown or its package is not installed.
+
+    """
+    if name is None:
+        for factory in _CODECS.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+        return STDLIB_JSON_CODEC
+    if name not in _CODECS:
+        raise CookidooConfigException(
+            f"Unknown json codec {name}, use one of {", ".join(_CODECS)}"
+        )
+    try:
+        return _CODECS[name]()
+    except ImportError as e:
+        raise CookidooConfigException(
+            f"The json codec {name} is not installed, run `pip install {name}`"
+        ) from e
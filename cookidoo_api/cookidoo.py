@@ -1,1467 +1,2088 @@
-"""Cookidoo api implementation."""
-
-from http import HTTPStatus
-from json import JSONDecodeError
-import logging
-import time
-import traceback
-from typing import cast
-
-from aiohttp import ClientError, ClientSession, FormData
-from yarl import URL
-
-from cookidoo_api.const import (
-    ADD_ADDITIONAL_ITEMS_PATH,
-    ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
-    ADDITIONAL_ITEMS_PATH,
-    API_ENDPOINT,
-    AUTHORIZATION_HEADER,
-    COMMUNITY_PROFILE_PATH,
-    COOKIDOO_CLIENT_ID,
-    DEFAULT_API_HEADERS,
-    DEFAULT_COOKIDOO_CONFIG,
-    DEFAULT_SITE,
-    DEFAULT_TOKEN_HEADERS,
-    EDIT_ADDITIONAL_ITEMS_PATH,
-    EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH,
-    EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH,
-    INGREDIENT_ITEMS_PATH,
-    RECIPE_PATH,
-    REMOVE_ADDITIONAL_ITEMS_PATH,
-    REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
-    SHOPPING_LIST_RECIPES_PATH,
-    SUBSCRIPTIONS_PATH,
-    TOKEN_ENDPOINT,
-)
-from cookidoo_api.exceptions import (
-    CookidooAuthException,
-    CookidooConfigException,
-    CookidooParseException,
-    CookidooRequestException,
-)
-from cookidoo_api.helpers import (
-    cookidoo_additional_item_from_json,
-    cookidoo_ingredient_item_from_json,
-    cookidoo_recipe_details_from_json,
-    cookidoo_recipe_from_json,
-)
-from cookidoo_api.types import (
-    AdditionalItemJSON,
-    CookidooAdditionalItem,
-    CookidooAuthResponse,
-    CookidooConfig,
-    CookidooIngredientItem,
-    CookidooLocalizationConfig,
-    CookidooRecipe,
-    CookidooRecipeDetails,
-    CookidooSubscription,
-    CookidooUserInfo,
-    ItemJSON,
-    RecipeDetailsJSON,
-    RecipeJSON,
-)
-
-_LOGGER = logging.getLogger(__name__)
-
-
-class Cookidoo:
-    """Unofficial Cookidoo API interface."""
-
-    _session: ClientSession
-    _cfg: CookidooConfig
-    _token_headers: dict[str, str]
-    _api_headers: dict[str, str]
-    _auth_data: CookidooAuthResponse | None
-
-    def __init__(
-        self,
-        session: ClientSession,
-        cfg: CookidooConfig = DEFAULT_COOKIDOO_CONFIG,
-    ) -> None:
-        """Init function for Bring API.
-
-        Parameters
-        ----------
-        session
-            The client session for aiohttp requests
-        cfg
-            Cookidoo config
-
-
-        """
-        self._session = session
-        self._cfg = cfg
-        self._token_headers = DEFAULT_TOKEN_HEADERS.copy()
-        self._api_headers = DEFAULT_API_HEADERS.copy()
-        self.__expires_in: int
-        self._auth_data = None
-
-    @property
-    def localization(self) -> CookidooLocalizationConfig:
-        """Localization."""
-        return self._cfg["localization"].copy()
-
-    @property
-    def expires_in(self) -> int:
-        """Refresh token expiration."""
-        return max(0, self.__expires_in - int(time.time()))
-
-    @expires_in.setter
-    def expires_in(self, expires_in: int | str) -> None:
-        self.__expires_in = int(time.time()) + int(expires_in)
-
-    @property
-    def auth_data(self) -> CookidooAuthResponse | None:
-        """Auth data."""
-        return self._auth_data.copy() if self._auth_data else None
-
-    @auth_data.setter
-    def auth_data(self, auth_data: CookidooAuthResponse) -> None:
-        self._api_headers["AUTHORIZATION"] = AUTHORIZATION_HEADER.format(
-            type=auth_data["token_type"].lower().capitalize(),
-            access_token=auth_data["access_token"],
-        )
-        self._auth_data = auth_data
-        self.expires_in = auth_data["expires_in"]
-
-    @property
-    def api_endpoint(self) -> URL:
-        """Get the api endpoint."""
-        return URL(API_ENDPOINT.format(**self._cfg["localization"]))
-
-    async def refresh_token(self) -> CookidooAuthResponse:
-        """Try to refresh the token.
-
-        Returns
-        -------
-        CookidooAuthResponse
-            The auth response object.
-
-        Raises
-        ------
-        CookidooConfigException
-            If no login has happened yet
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-        CookidooAuthException
-            If the login fails due invalid credentials.
-            You should check your email and password.
-
-        """
-        if not self._auth_data:
-            raise CookidooConfigException("No auth data available, please log in first")
-
-        refresh_data = FormData()
-        refresh_data.add_field("grant_type", "refresh_token")
-        refresh_data.add_field("refresh_token", self._auth_data["refresh_token"])
-        refresh_data.add_field("client_id", COOKIDOO_CLIENT_ID)
-
-        return await self._request_access_token(refresh_data)
-
-    async def login(self) -> CookidooAuthResponse:
-        """Try to login.
-
-        Returns
-        -------
-        CookidooAuthResponse
-            The auth response object.
-
-        Raises
-        ------
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-        CookidooAuthException
-            If the login fails due invalid credentials.
-            You should check your email and password.
-
-        """
-        user_data = FormData()
-        user_data.add_field("grant_type", "password")
-        user_data.add_field("username", self._cfg["email"])
-        user_data.add_field("password", self._cfg["password"])
-
-        return await self._request_access_token(user_data)
-
-    async def _request_access_token(self, form_data: FormData) -> CookidooAuthResponse:
-        """Request a new access token.
-
-        Parameters
-        ----------
-        form_data
-            The data to be passed to the request with user credentials or refresh token
-
-        Returns
-        -------
-        CookidooAuthResponse
-            The auth response object.
-
-        Raises
-        ------
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-        CookidooAuthException
-            If the access token request fails due invalid credentials.
-            You should check your email and password or refresh token.
-
-        """
-
-        try:
-            url = TOKEN_ENDPOINT.format(site=DEFAULT_SITE)
-            async with self._session.post(
-                url, data=form_data, headers=self._token_headers
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s",
-                    url,
-                    r.status,
-                    await r.text()
-                    if r.status != 200
-                    else "",  # do not log response on success, as it contains sensible data
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse access token request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot request access token: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Access token request failed due to authorization failure, "
-                        "please check your email and password or refresh token."
-                    )
-                if r.status == HTTPStatus.BAD_REQUEST:
-                    _LOGGER.debug(
-                        "Exception: Cannot request access token: %s", await r.text()
-                    )
-                    raise CookidooAuthException(
-                        "Access token request failed due to bad request, please check your email or refresh token."
-                    )
-                r.raise_for_status()
-
-                try:
-                    data = cast(
-                        CookidooAuthResponse,
-                        {
-                            key: val
-                            for key, val in (await r.json()).items()
-                            if key in CookidooAuthResponse.__annotations__
-                        },
-                    )
-                except JSONDecodeError as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot request access token:\n %s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Cannot parse access token request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot request access token:\n %s", traceback.format_exc()
-            )
-            raise CookidooRequestException(
-                "Authentication failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot request access token:\n %s", traceback.format_exc()
-            )
-            raise CookidooRequestException(
-                "Authentication failed due to request exception."
-            ) from e
-
-        self.auth_data = data
-
-        return data.copy()
-
-    async def get_user_info(
-        self,
-    ) -> CookidooUserInfo:
-        """Get user info.
-
-        Returns
-        -------
-        CookidooUserInfo
-            The user info
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-
-        try:
-            url = self.api_endpoint / COMMUNITY_PROFILE_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.get(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get user info: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Loading user info failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return cast(
-                        CookidooUserInfo,
-                        {
-                            key: val
-                            for key, val in (await r.json())["userInfo"].items()
-                            if key in CookidooUserInfo.__annotations__
-                        },
-                    )
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get user info:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading user info failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get user info:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading user info failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot user info:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading user info failed due to request exception."
-            ) from e
-
-    async def get_active_subscription(
-        self,
-    ) -> CookidooSubscription | None:
-        """Get active subscription if any.
-
-        Returns
-        -------
-        CookidooSubscription
-            The active subscription
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-
-        try:
-            url = self.api_endpoint / SUBSCRIPTIONS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.get(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get active subscription: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Loading active subscription failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    if subscription := next(
-                        (
-                            subscription
-                            for subscription in (await r.json())
-                            if subscription["active"]
-                        ),
-                        None,
-                    ):
-                        return cast(
-                            CookidooSubscription,
-                            {
-                                key: val
-                                for key, val in subscription.items()
-                                if key in CookidooSubscription.__annotations__
-                            },
-                        )
-                    else:
-                        return None
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get active subscription:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading active subscription failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get active subscription:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading user info failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot active subscription:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading active subscription failed due to request exception."
-            ) from e
-
-    async def get_recipe_details(self, id: str) -> CookidooRecipeDetails:
-        """Get recipe details.
-
-        Parameters
-        ----------
-        id
-            The id of the recipe
-
-        Returns
-        -------
-        CookidooRecipeDetails
-            The recipe details
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-
-        try:
-            url = self.api_endpoint / RECIPE_PATH.format(
-                **self._cfg["localization"], id=id
-            )
-            async with self._session.get(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get recipe details: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Loading recipe details failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return cookidoo_recipe_details_from_json(
-                        cast(RecipeDetailsJSON, await r.json())
-                    )
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get recipe details:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading recipe details failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get recipe details:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading recipe details failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot recipe details:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading recipe details failed due to request exception."
-            ) from e
-
-    async def get_shopping_list_recipes(
-        self,
-    ) -> list[CookidooRecipe]:
-        """Get recipes.
-
-        Returns
-        -------
-        list[CookidooRecipe]
-            The list of the recipes
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-
-        try:
-            url = self.api_endpoint / SHOPPING_LIST_RECIPES_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.get(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get recipes: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Loading recipes failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return [
-                        cookidoo_recipe_from_json(cast(RecipeJSON, recipe))
-                        for recipe in (await r.json())["recipes"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get recipes:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading recipes failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get recipes:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading recipes failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot recipes:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading recipes failed due to request exception."
-            ) from e
-
-    async def get_ingredient_items(
-        self,
-    ) -> list[CookidooIngredientItem]:
-        """Get ingredient items.
-
-        Returns
-        -------
-        list[CookidooIngredientItem]
-            The list of the ingredient items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-
-        try:
-            url = self.api_endpoint / INGREDIENT_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.get(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get ingredient items: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Loading ingredient items failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return [
-                        cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
-                        for recipe in (await r.json())["recipes"]
-                        for ingredient in recipe["recipeIngredientGroups"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get ingredient items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading ingredient items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get ingredient items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading ingredient items failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot ingredient items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading ingredient items failed due to request exception."
-            ) from e
-
-    async def add_ingredient_items_for_recipes(
-        self,
-        recipe_ids: list[str],
-    ) -> list[CookidooIngredientItem]:
-        """Add ingredient items for recipes.
-
-        Parameters
-        ----------
-        recipe_ids
-            The recipe ids for the ingredient items to add to the shopping list
-
-        Returns
-        -------
-        list[CookidooIngredientItem]
-            The list of the added ingredient items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {"recipeIDs": recipe_ids}
-        try:
-            url = self.api_endpoint / ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot add ingredient items for recipes: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Add ingredient items for recipes failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-                try:
-                    return [
-                        cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
-                        for recipe in (await r.json())["data"]
-                        for ingredient in recipe["recipeIngredientGroups"]
-                    ]
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get added ingredient items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading added ingredient items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute add ingredient items for recipes:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Add ingredient items for recipes failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute add ingredient items for recipes:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Add ingredient items for recipes failed due to request exception."
-            ) from e
-
-    async def remove_ingredient_items_for_recipes(
-        self,
-        recipe_ids: list[str],
-    ) -> None:
-        """Remove ingredient items for recipes.
-
-        Parameters
-        ----------
-        recipe_ids
-            The recipe ids for the ingredient items to remove to the shopping list
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {"recipeIDs": recipe_ids}
-        try:
-            url = self.api_endpoint / REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot remove ingredient items for recipes: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Remove ingredient items for recipes failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute remove ingredient items for recipes:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Remove ingredient items for recipes failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute remove ingredient items for recipes:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Remove ingredient items for recipes failed due to request exception."
-            ) from e
-
-    async def edit_ingredient_items_ownership(
-        self,
-        ingredient_items: list[CookidooIngredientItem],
-    ) -> list[CookidooIngredientItem]:
-        """Edit ownership ingredient items.
-
-        Parameters
-        ----------
-        ingredient_items
-            The ingredient items to change the the `is_owned` value for
-
-        Returns
-        -------
-        list[CookidooIngredientItem]
-            The list of the edited ingredient items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {
-            "ingredients": [
-                {
-                    "id": ingredient_item["id"],
-                    "isOwned": ingredient_item["is_owned"],
-                    "ownedTimestamp": int(time.time()),
-                }
-                for ingredient_item in ingredient_items
-            ]
-        }
-        try:
-            url = self.api_endpoint / EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot edit recipe ingredient items ownership: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Edit ingredient items ownership failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-                try:
-                    return [
-                        cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
-                        for ingredient in (await r.json())["data"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get edited ingredient items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading edited ingredient items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute edit ingredient items ownership:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Edit ingredient items ownership failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute edit ingredient items ownership:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Edit ingredient items ownership failed due to request exception."
-            ) from e
-
-    async def get_additional_items(
-        self,
-    ) -> list[CookidooAdditionalItem]:
-        """Get additional items.
-
-        Returns
-        -------
-        list[CookidooAdditionalItem]
-            The list of the additional items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-
-        try:
-            url = self.api_endpoint / ADDITIONAL_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.get(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot get additional items: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Loading additional items failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-
-                try:
-                    return [
-                        cookidoo_additional_item_from_json(
-                            cast(AdditionalItemJSON, additional_item)
-                        )
-                        for additional_item in (await r.json())["additionalItems"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get additional items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading additional items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot get additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading additional items failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Loading additional items failed due to request exception."
-            ) from e
-
-    async def add_additional_items(
-        self,
-        additional_item_names: list[str],
-    ) -> list[CookidooAdditionalItem]:
-        """Create additional items.
-
-        Parameters
-        ----------
-        additional_item_names
-            The additional item names to create, only the label can be set, as the default state `is_owned=false` is forced (chain with immediate update call for work-around)
-
-        Returns
-        -------
-        list[CookidooAdditionalItem]
-            The list of the added additional items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {"itemsValue": additional_item_names}
-        try:
-            url = self.api_endpoint / ADD_ADDITIONAL_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot add additional items: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Add additional items failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-                try:
-                    return [
-                        cookidoo_additional_item_from_json(
-                            cast(AdditionalItemJSON, additional_item)
-                        )
-                        for additional_item in (await r.json())["data"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get added additional items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading added additional items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute add additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Add additional items failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute add additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Add additional items failed due to request exception."
-            ) from e
-
-    async def edit_additional_items(
-        self,
-        additional_items: list[CookidooAdditionalItem],
-    ) -> list[CookidooAdditionalItem]:
-        """Edit additional items.
-
-        Parameters
-        ----------
-        additional_items
-            The additional items to change the the `name` value for
-
-        Returns
-        -------
-        list[CookidooAdditionalItem]
-            The list of the edited additional items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {
-            "additionalItems": [
-                {
-                    "id": additional_item["id"],
-                    "name": additional_item["name"],
-                }
-                for additional_item in additional_items
-            ]
-        }
-        try:
-            url = self.api_endpoint / EDIT_ADDITIONAL_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot edit additional items: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Edit additional items failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-                try:
-                    return [
-                        cookidoo_additional_item_from_json(
-                            cast(AdditionalItemJSON, additional_item)
-                        )
-                        for additional_item in (await r.json())["data"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get edited additional items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading edited additional items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute edit additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Edit additional items failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute edit additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Edit additional items failed due to request exception."
-            ) from e
-
-    async def edit_additional_items_ownership(
-        self,
-        additional_items: list[CookidooAdditionalItem],
-    ) -> list[CookidooAdditionalItem]:
-        """Edit ownership additional items.
-
-        Parameters
-        ----------
-        additional_items
-            The additional items to change the the `is_owned` value for
-
-        Returns
-        -------
-        list[CookidooAdditionalItem]
-            The list of the edited additional items
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {
-            "additionalItems": [
-                {
-                    "id": additional_item["id"],
-                    "isOwned": additional_item["is_owned"],
-                    "ownedTimestamp": int(time.time()),
-                }
-                for additional_item in additional_items
-            ]
-        }
-        try:
-            url = self.api_endpoint / EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot edit additional items ownership: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Edit additional items ownership failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-                try:
-                    return [
-                        cookidoo_additional_item_from_json(
-                            cast(AdditionalItemJSON, additional_item)
-                        )
-                        for additional_item in (await r.json())["data"]
-                    ]
-
-                except (JSONDecodeError, KeyError) as e:
-                    _LOGGER.debug(
-                        "Exception: Cannot get edited additional items:\n%s",
-                        traceback.format_exc(),
-                    )
-                    raise CookidooParseException(
-                        "Loading edited additional items failed during parsing of request response."
-                    ) from e
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute edit additional items ownership:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Edit additional items ownership failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute edit additional items ownership:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Edit additional items ownership failed due to request exception."
-            ) from e
-
-    async def remove_additional_items(
-        self,
-        additional_item_ids: list[str],
-    ) -> None:
-        """Remove additional items.
-
-        Parameters
-        ----------
-        additional_item_ids
-            The additional item ids to remove
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        json_data = {"additionalItemIDs": additional_item_ids}
-        try:
-            url = self.api_endpoint / REMOVE_ADDITIONAL_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.post(
-                url, headers=self._api_headers, json=json_data
-            ) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot remove additional items: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Remove additional items failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute remove additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Remove additional items failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute remove additional items:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Remove additional items failed due to request exception."
-            ) from e
-
-    async def clear_shopping_list(
-        self,
-    ) -> None:
-        """Remove all additional items, ingredients and recipes.
-
-        Raises
-        ------
-        CookidooAuthException
-            When the access token is not valid anymore
-        CookidooRequestException
-            If the request fails.
-        CookidooParseException
-            If the parsing of the request response fails.
-
-        """
-        try:
-            url = self.api_endpoint / INGREDIENT_ITEMS_PATH.format(
-                **self._cfg["localization"]
-            )
-            async with self._session.delete(url, headers=self._api_headers) as r:
-                _LOGGER.debug(
-                    "Response from %s [%s]: %s", url, r.status, await r.text()
-                )
-
-                if r.status == HTTPStatus.UNAUTHORIZED:
-                    try:
-                        errmsg = await r.json()
-                    except (JSONDecodeError, ClientError):
-                        _LOGGER.debug(
-                            "Exception: Cannot parse request response:\n %s",
-                            traceback.format_exc(),
-                        )
-                    else:
-                        _LOGGER.debug(
-                            "Exception: Cannot clear shopping list: %s",
-                            errmsg["error_description"],
-                        )
-                    raise CookidooAuthException(
-                        "Clear shopping list failed due to authorization failure, "
-                        "the authorization token is invalid or expired."
-                    )
-
-                r.raise_for_status()
-        except TimeoutError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute clear shopping list:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Clear shopping list failed due to connection timeout."
-            ) from e
-        except ClientError as e:
-            _LOGGER.debug(
-                "Exception: Cannot execute clear shopping list:\n%s",
-                traceback.format_exc(),
-            )
-            raise CookidooRequestException(
-                "Clear shopping list failed due to request exception."
-            ) from e
+"""Cookidoo api implementation."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AsyncExitStack,
+    contextmanager,
+    nullcontext,
+)
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
+from functools import cache
+import hashlib
+from http import HTTPStatus
+from importlib.util import find_spec
+from itertools import chain
+import logging
+import sqlite3
+import ssl
+import time
+import traceback
+from typing import Any, Final, NamedTuple, Self, cast, overload
+
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    FormData,
+    RequestInfo,
+    TCPConnector,
+)
+from multidict import CIMultiDictProxy
+from yarl import URL
+
+from cookidoo_api.cache import CookidooRecipeCache, CookidooRecipeCacheEntry
+from cookidoo_api.codec import STDLIB_JSON_CODEC, CookidooJSONCodec
+from cookidoo_api.const import (
+    ADD_ADDITIONAL_ITEMS_PATH,
+    ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+    API_ENDPOINT,
+    AUTHORIZATION_HEADER,
+    COMMUNITY_PROFILE_PATH,
+    COOKIDOO_CLIENT_ID,
+    DEFAULT_API_HEADERS,
+    DEFAULT_COOKIDOO_CONFIG,
+    DEFAULT_SITE,
+    DEFAULT_TOKEN_HEADERS,
+    EDIT_ADDITIONAL_ITEMS_PATH,
+    EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH,
+    EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH,
+    RECIPE_PATH,
+    REMOVE_ADDITIONAL_ITEMS_PATH,
+    REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+    SHOPPING_LIST_PATH,
+    SUBSCRIPTIONS_PATH,
+    TOKEN_ENDPOINT,
+)
+from cookidoo_api.exceptions import (
+    CookidooAuthException,
+    CookidooConfigException,
+    CookidooException,
+    CookidooParseException,
+    CookidooRequestException,
+)
+from cookidoo_api.helpers import (
+    cookidoo_additional_item_from_json,
+    cookidoo_ingredient_item_from_json,
+    cookidoo_recipe_details_from_json,
+    cookidoo_shopping_list_from_json,
+    get_localization,
+)
+from cookidoo_api.models import (
+    CookidooAdditionalItemModel,
+    CookidooIngredientItemModel,
+    CookidooModel,
+    CookidooRecipeDetailsModel,
+    CookidooRecipeModel,
+    CookidooShoppingListModel,
+    CookidooSubscriptionModel,
+    CookidooUserInfoModel,
+)
+from cookidoo_api.ratelimit import CookidooRateLimiter
+from cookidoo_api.retry import CookidooCircuitBreaker, CookidooRetryPolicy
+from cookidoo_api.store import CookidooRecipeStore, CookidooStoredRecipe
+from cookidoo_api.stream import iter_json_array
+from cookidoo_api.tokens import CookidooStoredToken, CookidooTokenStore
+from cookidoo_api.types import (
+    AdditionalItemJSON,
+    CookidooAdditionalItem,
+    CookidooAuthResponse,
+    CookidooConfig,
+    CookidooIngredientItem,
+    CookidooItem,
+    CookidooLocalizationConfig,
+    CookidooRecipe,
+    CookidooRecipeDetails,
+    CookidooShoppingList,
+    CookidooShoppingListChanges,
+    CookidooSubscription,
+    CookidooUserInfo,
+    ItemJSON,
+    RecipeDetailsJSON,
+    RecipeJSON,
+    ShoppingListJSON,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_STREAM_CHUNK_SIZE: Final = 1 << 16
+
+
+def _recipe_details_from_json(json: Any) -> CookidooRecipeDetails:
+    return cookidoo_recipe_details_from_json(cast(RecipeDetailsJSON, json))
+
+
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    """Create the ssl context once, as loading the CA certificates is slow."""
+    return ssl.create_default_context()
+
+
+@cache
+def _accept_encoding() -> str:
+    """Get the content encodings which aiohttp can decode."""
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        return "gzip, deflate, br"
+    return "gzip, deflate"
+
+
+class _Placeholders(dict[str, str]):
+    """Format mapping keeping the missing fields as placeholders."""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+class _Routes:
+    """The api urls of a localization, built once and shared by all instances."""
+
+    def __init__(
+        self, localization: CookidooLocalizationConfig, api_endpoint: str
+    ) -> None:
+        self.api_endpoint = URL(api_endpoint.format_map(_Placeholders(**localization)))
+        self._localization = localization.copy()
+        self._urls: dict[str, URL] = {}
+        self._templates: dict[str, str] = {}
+
+    def url(self, path: str, **kwargs: str) -> URL:
+        """Get the url of an api path, with the fields other than the localization."""
+        if not kwargs:
+            if (url := self._urls.get(path)) is None:
+                url = self._urls[path] = self.api_endpoint / path.format(
+                    **self._localization
+                )
+            return url
+        if (template := self._templates.get(path)) is None:
+            template = self._templates[path] = path.format_map(
+                _Placeholders(**self._localization)
+            )
+        return self.api_endpoint / template.format(**kwargs)
+
+
+@cache
+def _compile_routes(
+    country_code: str, language: str, url: str, api_endpoint: str
+) -> _Routes:
+    return _Routes(
+        CookidooLocalizationConfig(
+            country_code=country_code, language=language, url=url
+        ),
+        api_endpoint,
+    )
+
+
+def _localization_key(
+    localization: CookidooLocalizationConfig,
+) -> tuple[str, str, str]:
+    return (
+        localization["country_code"],
+        localization["language"],
+        localization["url"],
+    )
+
+
+def _routes(
+    localization: CookidooLocalizationConfig, api_endpoint: str = API_ENDPOINT
+) -> _Routes:
+    """Get the routes of a localization, compiled on first use."""
+    return _compile_routes(*_localization_key(localization), api_endpoint)
+
+
+@dataclass(slots=True)
+class _AuthState:
+    """The auth data, shared by the instances of all localizations of a client."""
+
+    data: CookidooAuthResponse | None = None
+    expires_at: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class _Response(NamedTuple):
+    """A read response, which can be shared between callers."""
+
+    status: int
+    reason: str | None
+    headers: CIMultiDictProxy[str]
+    body: bytes
+    request_info: RequestInfo
+    history: tuple[ClientResponse, ...]
+
+    def raise_for_status(self) -> None:
+        """Raise a `ClientResponseError` if the status is an error."""
+        if self.status >= HTTPStatus.BAD_REQUEST:
+            raise ClientResponseError(
+                self.request_info,
+                self.history,
+                status=self.status,
+                message=self.reason or "",
+                headers=self.headers,
+            )
+
+
+class Cookidoo:
+    """Unofficial Cookidoo API interface."""
+
+    _session: ClientSession
+    _cfg: CookidooConfig
+    _token_headers: dict[str, str]
+    _api_headers: dict[str, str]
+    _auth: _AuthState
+    _routes: _Routes
+    _api_endpoint: str
+    _token_url: URL
+    _locales: dict[tuple[str, str, str], "Cookidoo"]
+    _json_codec: CookidooJSONCodec
+    _shopping_list_max_age: float
+    _shopping_list: tuple[float, CookidooShoppingList] | None
+    _shopping_list_generation: int
+    _single_flight: bool
+    _recipe_cache: CookidooRecipeCache | None
+    _auto_auth: bool
+    _refresh_margin: float
+    _retry_policy: CookidooRetryPolicy | None
+    _circuit_breaker: CookidooCircuitBreaker | None
+    _timeout: ClientTimeout
+    _rate_limiter: CookidooRateLimiter | None
+    _owns_session: bool
+    _models: bool
+    _token_store: CookidooTokenStore | None
+    _slot: AbstractAsyncContextManager[object]
+    _in_flight: dict[
+        tuple[str, str, tuple[tuple[str, str], ...], int], asyncio.Future[_Response]
+    ]
+
+    def __init__(
+        self,
+        session: ClientSession,
+        cfg: CookidooConfig = DEFAULT_COOKIDOO_CONFIG,
+        *,
+        json_codec: CookidooJSONCodec = STDLIB_JSON_CODEC,
+        shopping_list_max_age: float = 0,
+        single_flight: bool = True,
+        recipe_cache: CookidooRecipeCache | None = None,
+        auto_auth: bool = False,
+        refresh_margin: float = 60,
+        retry_policy: CookidooRetryPolicy | None = None,
+        circuit_breaker: CookidooCircuitBreaker | None = None,
+        rate_limiter: CookidooRateLimiter | None = None,
+        models: bool = False,
+        token_store: CookidooTokenStore | None = None,
+        api_endpoint: str = API_ENDPOINT,
+        token_endpoint: str = TOKEN_ENDPOINT.format(site=DEFAULT_SITE),
+        slot: AbstractAsyncContextManager[object] | None = None,
+    ) -> None:
+        """Init function for Bring API.
+
+        Parameters
+        ----------
+        session
+            The client session for aiohttp requests
+        cfg
+            Cookidoo config
+        json_codec
+            The codec to decode responses and encode request bodies,
+            see `get_json_codec` for the faster `orjson` and `msgspec` codecs
+        shopping_list_max_age
+            The age in seconds up to which the recipes, ingredient items and
+            additional items getters reuse the last shopping list snapshot
+        single_flight
+            Share one request between concurrent identical GET requests
+        recipe_cache
+            The cache for the recipe details, which can be shared between instances
+        auto_auth
+            Log in before the first request, refresh the token before it expires
+            and retry a request once after a 401, falling back to a new login
+            if the refresh fails
+        refresh_margin
+            The time in seconds before the token expiry at which auto auth
+            refreshes it
+        retry_policy
+            The retries of failed idempotent requests, if omitted nothing is retried
+        circuit_breaker
+            The per host circuit breaker, which can be shared between instances
+        rate_limiter
+            The per host rate limiter, which can be shared between instances,
+            see `CookidooRateLimiter.for_session` for the one of the session
+        models
+            Return the slotted models of `cookidoo_api.models` instead of dicts,
+            read-only mappings with the same keys which take less memory
+        token_store
+            The store of the token of the account, which can be shared between
+            processes, loaded by auto auth instead of logging in and saved after
+            each login or refresh
+        api_endpoint
+            The base url of the api, where `{country_code}` is replaced by the
+            country of the localization, to use a proxy or a fake server
+        token_endpoint
+            The url of the token requests, to use a proxy or a fake server
+        slot
+            The context manager entered around each request, like the
+            concurrency slot of an account in a `CookidooPool`
+
+        """
+        self._session = session
+        self._cfg = cfg
+        self._token_headers = DEFAULT_TOKEN_HEADERS.copy()
+        self._api_headers = DEFAULT_API_HEADERS.copy()
+        self._auth = _AuthState()
+        self._api_endpoint = api_endpoint
+        self._token_url = URL(token_endpoint)
+        self._routes = _routes(cfg["localization"], api_endpoint)
+        self._locales = {_localization_key(cfg["localization"]): self}
+        self._json_codec = json_codec
+        self._shopping_list_max_age = shopping_list_max_age
+        self._shopping_list = None
+        # changed by the writes, so that the reads in flight do not keep a snapshot
+        self._shopping_list_generation = 0
+        self._single_flight = single_flight
+        self._in_flight = {}
+        self._recipe_cache = recipe_cache
+        self._auto_auth = auto_auth
+        self._refresh_margin = refresh_margin
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._timeout = (
+            ClientTimeout(total=retry_policy.timeout)
+            if retry_policy is not None and retry_policy.timeout is not None
+            else session.timeout
+        )
+        self._rate_limiter = rate_limiter
+        self._owns_session = False
+        self._models = models
+        self._token_store = token_store
+        self._slot = nullcontext() if slot is None else slot
+
+    @classmethod
+    def create(
+        cls,
+        cfg: CookidooConfig = DEFAULT_COOKIDOO_CONFIG,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30,
+        ttl_dns_cache: int = 300,
+        timeout: ClientTimeout = ClientTimeout(total=60, connect=10),
+        **kwargs: Any,
+    ) -> Self:
+        """Create an instance owning its session and connection pool.
+
+        The connections are kept alive and reused, the dns lookups are cached,
+        the ssl context is shared by all created instances and the responses
+        are compressed, with brotli if `aiohttp[speedups]` is installed.
+        Must be called from a coroutine, and the instance closed with `close`
+        or used as an async context manager.
+
+        Parameters
+        ----------
+        cfg
+            Cookidoo config
+        limit
+            The maximum number of open connections
+        limit_per_host
+            The maximum number of open connections to each host
+        keepalive_timeout
+            The time in seconds an idle connection is kept open for reuse
+        ttl_dns_cache
+            The time in seconds the dns lookups are cached
+        timeout
+            The timeouts of the requests
+        kwargs
+            The other options of the instance, see `Cookidoo`
+
+        Returns
+        -------
+        Self
+            The instance
+
+        """
+        connector = TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=ttl_dns_cache,
+            ssl=_ssl_context(),
+        )
+        session = ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={"ACCEPT-ENCODING": _accept_encoding()},
+        )
+        cookidoo = cls(session, cfg, **kwargs)
+        cookidoo._owns_session = True
+        return cookidoo
+
+    async def close(self) -> None:
+        """Wait for the shared in-flight requests and close the owned session.
+
+        A session passed to the constructor is left open for its owner.
+        """
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+        if self._owns_session:
+            await self._session.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter the context of the instance."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the instance when leaving its context."""
+        await self.close()
+
+    @property
+    def localization(self) -> CookidooLocalizationConfig:
+        """Localization."""
+        return self._cfg["localization"].copy()
+
+    @property
+    def expires_in(self) -> int:
+        """Refresh token expiration."""
+        return max(0, self._auth.expires_at - int(time.time()))
+
+    @expires_in.setter
+    def expires_in(self, expires_in: int | str) -> None:
+        self._auth.expires_at = int(time.time()) + int(expires_in)
+
+    @property
+    def auth_data(self) -> CookidooAuthResponse | None:
+        """Auth data."""
+        return self._auth.data.copy() if self._auth.data else None
+
+    @auth_data.setter
+    def auth_data(self, auth_data: CookidooAuthResponse) -> None:
+        self._api_headers["AUTHORIZATION"] = AUTHORIZATION_HEADER.format(
+            type=auth_data["token_type"].lower().capitalize(),
+            access_token=auth_data["access_token"],
+        )
+        self._auth.data = auth_data
+        self.expires_in = auth_data["expires_in"]
+
+    @property
+    def api_endpoint(self) -> URL:
+        """Get the api endpoint."""
+        return self._routes.api_endpoint
+
+    def for_locale(self, locale: str | CookidooLocalizationConfig) -> "Cookidoo":
+        """Get an instance for another localization, sharing this client.
+
+        The instance shares the session, the authentication and the other
+        state of the client, except for the shopping list snapshot. It is
+        created once per localization.
+
+        Parameters
+        ----------
+        locale
+            The localization, or its language like `de-CH`, see `get_localization`
+
+        Returns
+        -------
+        Cookidoo
+            The instance for the localization
+
+        Raises
+        ------
+        CookidooConfigException
+            If the language has no or several localizations.
+
+        """
+        localization = get_localization(locale) if isinstance(locale, str) else locale
+        key = _localization_key(localization)
+        if (cookidoo := self._locales.get(key)) is None:
+            cookidoo = self._locales[key] = copy(self)
+            cookidoo._cfg = CookidooConfig(
+                localization=localization.copy(),
+                email=self._cfg["email"],
+                password=self._cfg["password"],
+            )
+            cookidoo._routes = _routes(localization, self._api_endpoint)
+            cookidoo._shopping_list = None
+            cookidoo._owns_session = False
+        return cookidoo
+
+    async def refresh_token(self) -> CookidooAuthResponse:
+        """Try to refresh the token.
+
+        Returns
+        -------
+        CookidooAuthResponse
+            The auth response object.
+
+        Raises
+        ------
+        CookidooConfigException
+            If no login has happened yet
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+        CookidooAuthException
+            If the login fails due invalid credentials.
+            You should check your email and password.
+
+        """
+        if not self._auth.data:
+            raise CookidooConfigException("No auth data available, please log in first")
+
+        refresh_data = FormData()
+        refresh_data.add_field("grant_type", "refresh_token")
+        refresh_data.add_field("refresh_token", self._auth.data["refresh_token"])
+        refresh_data.add_field("client_id", COOKIDOO_CLIENT_ID)
+
+        return await self._request_access_token(refresh_data)
+
+    async def login(self) -> CookidooAuthResponse:
+        """Try to login.
+
+        Returns
+        -------
+        CookidooAuthResponse
+            The auth response object.
+
+        Raises
+        ------
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+        CookidooAuthException
+            If the login fails due invalid credentials.
+            You should check your email and password.
+
+        """
+        user_data = FormData()
+        user_data.add_field("grant_type", "password")
+        user_data.add_field("username", self._cfg["email"])
+        user_data.add_field("password", self._cfg["password"])
+
+        return await self._request_access_token(user_data)
+
+    @overload
+    async def _request(
+        self,
+        method: str,
+        url: URL | str,
+        action: str,
+        parse: None = None,
+        *,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        data: FormData | None = None,
+        auth_errors: dict[int, str] | None = None,
+        sensitive: bool = False,
+        auth: bool = True,
+    ) -> None: ...
+
+    @overload
+    async def _request[T](
+        self,
+        method: str,
+        url: URL | str,
+        action: str,
+        parse: Callable[[Any], T],
+        *,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        data: FormData | None = None,
+        auth_errors: dict[int, str] | None = None,
+        sensitive: bool = False,
+        auth: bool = True,
+    ) -> T: ...
+
+    async def _request[T](
+        self,
+        method: str,
+        url: URL | str,
+        action: str,
+        parse: Callable[[Any], T] | None = None,
+        *,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        data: FormData | None = None,
+        auth_errors: dict[int, str] | None = None,
+        sensitive: bool = False,
+        auth: bool = True,
+    ) -> T | None:
+        """Send a request and convert its response.
+
+        Parameters
+        ----------
+        method
+            The http method of the request
+        url
+            The url of the request
+        action
+            The human readable name of the action, used for logs and errors
+        parse
+            The conversion of the json response, if the response has a body
+        headers
+            The additional headers of the request
+        json
+            The json body of the request
+        data
+            The form body of the request
+        auth_errors
+            The messages of the auth exceptions per status code,
+            defaults to an invalid or expired authorization token on 401
+        sensitive
+            Do not log the response body on success
+        auth
+            Send the api headers with the authorization token
+
+        Returns
+        -------
+        T | None
+            The converted response or `None` if there is nothing to parse.
+
+        Raises
+        ------
+        CookidooAuthException
+            When the status code of the response is one of the `auth_errors`
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        response = await self._fetch(
+            method,
+            url,
+            action,
+            headers=headers,
+            json=json,
+            data=data,
+            auth_errors=auth_errors,
+            sensitive=sensitive,
+            auth=auth,
+            read=parse is not None,
+        )
+        if parse is None:
+            return None
+        return self._parse(response.body, action, parse)
+
+    async def _fetch(
+        self,
+        method: str,
+        url: URL | str,
+        action: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json: Any = None,
+        data: FormData | None = None,
+        auth_errors: dict[int, str] | None = None,
+        sensitive: bool = False,
+        auth: bool = True,
+        read: bool = True,
+    ) -> _Response:
+        """Send a request and check the status of its response.
+
+        See `_request` for the parameters, `read` is whether the body is needed.
+        """
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if json is not None:
+            headers = {**(headers or {}), "CONTENT-TYPE": "application/json"}
+        if auth_errors is None:
+            auth_errors = {
+                HTTPStatus.UNAUTHORIZED: f"{action} failed due to authorization failure, "
+                "the authorization token is invalid or expired."
+            }
+
+        body = data if json is None else self._json_codec.dumps(json)
+        auto_auth = auth and self._auto_auth
+
+        try:
+            if auto_auth:
+                await self._ensure_token()
+            auth_data = self._auth.data
+            response = await self._send_with_retries(
+                method, url, headers, body, auth, debug, sensitive, debug or read
+            )
+            if auto_auth and response.status == HTTPStatus.UNAUTHORIZED:
+                await self._reauthenticate(auth_data)
+                response = await self._send_with_retries(
+                    method, url, headers, body, auth, debug, sensitive, debug or read
+                )
+
+            if response.status in auth_errors:
+                raise CookidooAuthException(auth_errors[response.status])
+
+            response.raise_for_status()
+        except TimeoutError as e:
+            if debug:
+                _LOGGER.debug(
+                    "Exception: Cannot execute %s:\n%s",
+                    action.lower(),
+                    traceback.format_exc(),
+                )
+            raise CookidooRequestException(
+                f"{action} failed due to connection timeout."
+            ) from e
+        except ClientError as e:
+            if debug:
+                _LOGGER.debug(
+                    "Exception: Cannot execute %s:\n%s",
+                    action.lower(),
+                    traceback.format_exc(),
+                )
+            raise CookidooRequestException(
+                f"{action} failed due to request exception."
+            ) from e
+        return response
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: URL | str,
+        headers: dict[str, str] | None,
+        data: FormData | bytes | None,
+        auth: bool,
+        debug: bool,
+        sensitive: bool,
+        read: bool,
+    ) -> _Response:
+        """Send a request through the circuit breaker, retrying it if allowed."""
+        policy = self._retry_policy
+        if policy is not None and method not in policy.methods:
+            policy = None
+        breaker = self._circuit_breaker
+        host = URL(url).host or ""
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None:
+                breaker.before_request(host)
+            try:
+                response = await self._dispatch(
+                    method, url, headers, data, auth, debug, sensitive, read
+                )
+            except (TimeoutError, ClientError):
+                if breaker is not None:
+                    breaker.record_failure(host)
+                if policy is None or (delay := policy.delay(attempt)) is None:
+                    raise
+            else:
+                if breaker is not None:
+                    if response.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                        breaker.record_failure(host)
+                    else:
+                        breaker.record_success(host)
+                if (
+                    policy is None
+                    or response.status not in policy.statuses
+                    or (
+                        delay := policy.delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                    )
+                    is None
+                ):
+                    return response
+            _LOGGER.debug(
+                "Retrying %s %s in %.2fs after attempt %s", method, url, delay, attempt
+            )
+            await asyncio.sleep(delay)
+
+    async def _dispatch(
+        self,
+        method: str,
+        url: URL | str,
+        headers: dict[str, str] | None,
+        data: FormData | bytes | None,
+        auth: bool,
+        debug: bool,
+        sensitive: bool,
+        read: bool,
+    ) -> _Response:
+        """Send a request with the current api headers."""
+        if auth:
+            headers = {**self._api_headers, **headers} if headers else self._api_headers
+        elif headers is None:
+            headers = {}
+        if method == "GET" and self._single_flight:
+            return await self._send_single_flight(
+                method, url, headers, debug, sensitive
+            )
+        return await self._send(method, url, headers, data, debug, sensitive, read)
+
+    async def _ensure_token(self) -> None:
+        """Log in or refresh the token if it is missing or about to expire."""
+        auth_data = self._auth.data
+        if auth_data is None or self.expires_in <= self._refresh_margin:
+            await self._reauthenticate(auth_data)
+
+    async def _reauthenticate(self, stale: CookidooAuthResponse | None) -> None:
+        """Replace stale auth data, once for all concurrent callers.
+
+        With a token store, the token is replaced by the stored one if another
+        process has already replaced it, the lock of the store making the
+        processes wait for the one refreshing the token.
+
+        Parameters
+        ----------
+        stale
+            The auth data found missing, expiring or rejected by the caller
+
+        """
+        async with self._auth.lock:
+            if self._auth.data is not None and self._auth.data is not stale:
+                return  # another caller has already replaced it
+            if (store := self._token_store) is None:
+                await self._renew_token()
+                return
+            async with store.lock(self._cfg["email"]):
+                if (
+                    await self.load_token()
+                    and (stale is None or self._auth.data != stale)
+                    and self.expires_in > self._refresh_margin
+                ):
+                    return  # another process has already replaced it
+                await self._renew_token()
+
+    async def _renew_token(self) -> None:
+        """Refresh the token, falling back to a new login."""
+        if self._auth.data is not None:
+            try:
+                await self.refresh_token()
+            except CookidooAuthException:
+                _LOGGER.debug("Token refresh failed, logging in again")
+            else:
+                return
+        await self.login()
+
+    async def load_token(self) -> bool:
+        """Load the token of the account from the token store.
+
+        A token which cannot be loaded is logged and ignored.
+
+        Returns
+        -------
+        bool
+            Whether a token was loaded, it may be expired.
+
+        """
+        if self._token_store is None:
+            return False
+        try:
+            stored = await self._token_store.load(self._cfg["email"])
+        except (OSError, sqlite3.Error):
+            _LOGGER.warning("Cannot load the token from the store", exc_info=True)
+            return False
+        if stored is None:
+            return False
+        self.auth_data = stored.auth_data
+        self._auth.expires_at = stored.expires_at
+        return True
+
+    def _export[T](
+        self, value: T, model: type[CookidooModel], *, shared: bool = False
+    ) -> T:
+        """Prepare a result for the caller, as a model if enabled.
+
+        Parameters
+        ----------
+        value
+            The result, a dict or a list of dicts, or the models kept by the
+            instance
+        model
+            The model of the dicts
+        shared
+            Whether the result is kept by the instance, so that it is copied
+
+        Returns
+        -------
+        T
+            The result, or its models typed as the dicts they replace.
+
+        """
+        if not self._models:
+            if isinstance(value, CookidooModel):
+                # from a recipe cache shared with an instance returning models
+                return cast(T, value.copy())
+            return deepcopy(value) if shared else value
+        if isinstance(value, list | tuple):
+            return cast(T, [self._model(item, model) for item in value])
+        return self._model(value, model)
+
+    def _model[T](self, value: T, model: type[CookidooModel]) -> T:
+        """Convert a dict to be kept by the instance to a model, if enabled.
+
+        The models are immutable, so they are kept and returned without copies.
+        """
+        if not self._models or value is None or isinstance(value, CookidooModel):
+            return value
+        return cast(T, model.from_dict(cast(dict[str, Any], value)))
+
+    def _parse_model[T](
+        self, parse: Callable[[Any], T], model: type[CookidooModel]
+    ) -> Callable[[Any], T]:
+        """Extend a parse callable to build the model of its result, if enabled.
+
+        The model is built while parsing, so that a missing field raises a
+        `CookidooParseException`.
+        """
+        if not self._models:
+            return parse
+        return lambda json: self._model(parse(json), model)
+
+    def _parse[T](self, body: bytes, action: str, parse: Callable[[Any], T]) -> T:
+        """Decode and convert the body of a response."""
+        try:
+            return parse(self._json_codec.loads(body))
+        except (ValueError, KeyError) as e:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Exception: Cannot parse response of %s:\n%s",
+                    action.lower(),
+                    traceback.format_exc(),
+                )
+            raise CookidooParseException(
+                f"{action} failed during parsing of request response."
+            ) from e
+
+    async def _send(
+        self,
+        method: str,
+        url: URL | str,
+        headers: dict[str, str],
+        data: FormData | bytes | None,
+        debug: bool,
+        sensitive: bool,
+        read: bool = True,
+    ) -> _Response:
+        """Send a request and read its response."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(URL(url).host or "")
+        async with (
+            self._slot,
+            self._session.request(
+                method, url, headers=headers, data=data, timeout=self._timeout
+            ) as r,
+        ):
+            # read the body only once, it is decoded for the log if needed
+            body = await r.read() if read else b""
+            if debug:
+                _LOGGER.debug(
+                    "Response from %s [%s]: %s",
+                    url,
+                    r.status,
+                    body.decode(errors="replace")
+                    if r.status != HTTPStatus.OK or not sensitive
+                    else "",  # do not log response on success, as it contains sensible data
+                )
+            return _Response(
+                r.status, r.reason, r.headers, body, r.request_info, r.history
+            )
+
+    async def _stream(self, url: URL, action: str, key: str) -> AsyncIterator[Any]:
+        """Send a GET request and decode an array of its response while it is received.
+
+        The request goes through the rate limiter and the circuit breaker but
+        is neither retried nor shared, as the elements are yielded as soon as
+        they are decoded. Only a token rejected before the first element is
+        replaced, with auto auth. The errors raised by the caller while it
+        handles an element are not converted.
+
+        Parameters
+        ----------
+        url
+            The url of the request
+        action
+            The human readable name of the action, used for logs and errors
+        key
+            The key of the array in the json object of the response
+
+        Yields
+        ------
+        Any
+            The decoded elements of the array.
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        host = url.host or ""
+        async with AsyncExitStack() as stack:
+            with self._stream_errors(action, host):
+                response = await self._open_stream(stack, url, action)
+            elements = iter_json_array(
+                response.content.iter_chunked(_STREAM_CHUNK_SIZE), key
+            )
+            while True:
+                with self._stream_errors(action, host):
+                    try:
+                        element = await anext(elements)
+                    except StopAsyncIteration:
+                        break
+                yield element
+
+    async def _open_stream(
+        self, stack: AsyncExitStack, url: URL, action: str
+    ) -> ClientResponse:
+        """Send the GET request of a stream, keeping its response open in the stack.
+
+        As in `_fetch`, with auto auth a rejected token is replaced once and
+        the request sent again, before any element is decoded.
+        """
+        host = url.host or ""
+        retry = self._auto_auth
+        if retry:
+            await self._ensure_token()
+        while True:
+            auth_data = self._auth.data
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.before_request(host)
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(host)
+            async with AsyncExitStack() as attempt:
+                await attempt.enter_async_context(self._slot)
+                r = await attempt.enter_async_context(
+                    self._session.get(
+                        url, headers=self._api_headers, timeout=self._timeout
+                    )
+                )
+                if self._circuit_breaker is not None:
+                    if r.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                        self._circuit_breaker.record_failure(host)
+                    else:
+                        self._circuit_breaker.record_success(host)
+                if not (retry and r.status == HTTPStatus.UNAUTHORIZED):
+                    if r.status == HTTPStatus.UNAUTHORIZED:
+                        raise CookidooAuthException(
+                            f"{action} failed due to authorization failure, "
+                            "the authorization token is invalid or expired."
+                        )
+                    r.raise_for_status()
+                    await stack.enter_async_context(attempt.pop_all())
+                    return r
+            retry = False
+            await self._reauthenticate(auth_data)
+
+    @contextmanager
+    def _stream_errors(self, action: str, host: str) -> Iterator[None]:
+        """Convert the errors of the request or the decoding of a stream.
+
+        As in `_send_with_retries`, the timeouts and connection errors are
+        failures of the host for the circuit breaker.
+        """
+        try:
+            yield
+        except (TimeoutError, ClientError) as e:
+            if self._circuit_breaker is not None and not isinstance(
+                e, ClientResponseError
+            ):
+                self._circuit_breaker.record_failure(host)
+            if isinstance(e, TimeoutError):
+                raise CookidooRequestException(
+                    f"{action} failed due to connection timeout."
+                ) from e
+            raise CookidooRequestException(
+                f"{action} failed due to request exception."
+            ) from e
+        except ValueError as e:
+            raise CookidooParseException(
+                f"{action} failed during parsing of request response."
+            ) from e
+
+    async def _send_single_flight(
+        self,
+        method: str,
+        url: URL | str,
+        headers: dict[str, str],
+        debug: bool,
+        sensitive: bool,
+    ) -> _Response:
+        """Send a request, sharing the response with identical in-flight requests.
+
+        The requests sent before a write of the shopping list are not shared
+        with the ones sent after it, so that a read sees the previous writes.
+        """
+        key = (
+            method,
+            str(url),
+            tuple(headers.items()),
+            self._shopping_list_generation,
+        )
+        if (future := self._in_flight.get(key)) is None:
+            future = asyncio.ensure_future(
+                self._send(method, url, headers, None, debug, sensitive)
+            )
+            self._in_flight[key] = future
+
+            def done(future: asyncio.Future[_Response]) -> None:
+                del self._in_flight[key]
+                if not future.cancelled():
+                    future.exception()  # retrieved, even if all callers are gone
+
+            future.add_done_callback(done)
+        # a cancelled caller must not cancel the request of the others
+        return await asyncio.shield(future)
+
+    async def _request_access_token(self, form_data: FormData) -> CookidooAuthResponse:
+        """Request a new access token.
+
+        Parameters
+        ----------
+        form_data
+            The data to be passed to the request with user credentials or refresh token
+
+        Returns
+        -------
+        CookidooAuthResponse
+            The auth response object.
+
+        Raises
+        ------
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+        CookidooAuthException
+            If the access token request fails due invalid credentials.
+            You should check your email and password or refresh token.
+
+        """
+        data = await self._request(
+            "POST",
+            self._token_url,
+            "Authentication",
+            lambda json: cast(
+                CookidooAuthResponse,
+                {
+                    key: val
+                    for key, val in json.items()
+                    if key in CookidooAuthResponse.__annotations__
+                },
+            ),
+            headers=self._token_headers,
+            data=form_data,
+            auth=False,
+            auth_errors={
+                HTTPStatus.UNAUTHORIZED: "Access token request failed due to authorization failure, "
+                "please check your email and password or refresh token.",
+                HTTPStatus.BAD_REQUEST: "Access token request failed due to bad request, please check your email or refresh token.",
+            },
+            sensitive=True,
+        )
+
+        self.auth_data = data
+        if self._token_store is not None:
+            try:
+                await self._token_store.save(
+                    self._cfg["email"],
+                    CookidooStoredToken(data, self._auth.expires_at),
+                )
+            except (OSError, sqlite3.Error):
+                _LOGGER.warning("Cannot save the token to the store", exc_info=True)
+
+        return data.copy()
+
+    async def get_user_info(
+        self,
+    ) -> CookidooUserInfo:
+        """Get user info.
+
+        Returns
+        -------
+        CookidooUserInfo
+            The user info
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        user_info = await self._request(
+            "GET",
+            self._routes.url(COMMUNITY_PROFILE_PATH),
+            "Loading user info",
+            self._parse_model(
+                lambda json: cast(
+                    CookidooUserInfo,
+                    {
+                        key: val
+                        for key, val in json["userInfo"].items()
+                        if key in CookidooUserInfo.__annotations__
+                    },
+                ),
+                CookidooUserInfoModel,
+            ),
+        )
+        return self._export(user_info, CookidooUserInfoModel)
+
+    async def get_active_subscription(
+        self,
+    ) -> CookidooSubscription | None:
+        """Get active subscription if any.
+
+        Returns
+        -------
+        CookidooSubscription
+            The active subscription
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+
+        def parse(json: Any) -> CookidooSubscription | None:
+            if subscription := next(
+                (subscription for subscription in json if subscription["active"]),
+                None,
+            ):
+                return cast(
+                    CookidooSubscription,
+                    {
+                        key: val
+                        for key, val in subscription.items()
+                        if key in CookidooSubscription.__annotations__
+                    },
+                )
+            return None
+
+        subscription = await self._request(
+            "GET",
+            self._routes.url(SUBSCRIPTIONS_PATH),
+            "Loading active subscription",
+            self._parse_model(parse, CookidooSubscriptionModel),
+        )
+        return self._export(subscription, CookidooSubscriptionModel)
+
+    async def get_recipe_details(self, id: str) -> CookidooRecipeDetails:
+        """Get recipe details.
+
+        Parameters
+        ----------
+        id
+            The id of the recipe
+
+        Returns
+        -------
+        CookidooRecipeDetails
+            The recipe details
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        url = self._routes.url(RECIPE_PATH, id=id)
+        action = "Loading recipe details"
+        if (cache := self._recipe_cache) is None:
+            return self._export(
+                await self._request("GET", url, action, _recipe_details_from_json),
+                CookidooRecipeDetailsModel,
+            )
+
+        key = (self._cfg["localization"]["language"], id)
+        entry = cache.get(key)
+        if entry is None and cache.store is not None:
+            entry = (await self._load_stored_recipes(cache, cache.store, [key])).get(
+                key
+            )
+        fresh = cache.check(entry)
+        if entry and fresh:
+            return self._export(entry.recipe, CookidooRecipeDetailsModel, shared=True)
+
+        headers = {}
+        if entry and entry.etag:
+            headers["IF-NONE-MATCH"] = entry.etag
+        if entry and entry.last_modified:
+            headers["IF-MODIFIED-SINCE"] = entry.last_modified
+        response = await self._fetch("GET", url, action, headers=headers)
+        if entry and response.status == HTTPStatus.NOT_MODIFIED:
+            cache.revalidated(key)
+            if cache.store is not None:
+                await self._store_recipe(cache.store.touch(key, entry.fetched_at))
+            return self._export(entry.recipe, CookidooRecipeDetailsModel, shared=True)
+
+        recipe = self._model(
+            self._parse(response.body, action, _recipe_details_from_json),
+            CookidooRecipeDetailsModel,
+        )
+        entry = CookidooRecipeCacheEntry(
+            recipe,
+            time.time(),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        cache.put(key, entry)
+        if cache.store is not None:
+            await self._store_recipe(
+                cache.store.put(
+                    key,
+                    CookidooStoredRecipe(
+                        response.body,
+                        entry.fetched_at,
+                        entry.etag,
+                        entry.last_modified,
+                    ),
+                )
+            )
+        return self._export(recipe, CookidooRecipeDetailsModel, shared=True)
+
+    async def iter_recipe_details(
+        self, ids: Iterable[str], concurrency: int = 8
+    ) -> AsyncIterator[tuple[str, CookidooRecipeDetails | CookidooException]]:
+        """Get the details of many recipes, yielding each as soon as it is loaded.
+
+        At most `concurrency` requests are in flight, the next id is only taken
+        once a request finishes. A failing recipe does not stop the others.
+
+        Parameters
+        ----------
+        ids
+            The ids of the recipes
+        concurrency
+            The maximum number of concurrent requests
+
+        Yields
+        ------
+        tuple[str, CookidooRecipeDetails | CookidooException]
+            The id of a recipe with its details, or the exception loading it.
+
+        Raises
+        ------
+        CookidooConfigException
+            If the concurrency is not positive.
+
+        """
+        if concurrency < 1:
+            raise CookidooConfigException("The concurrency must be at least 1")
+
+        remaining = iter(ids)
+        pending: dict[asyncio.Future[CookidooRecipeDetails], str] = {}
+        try:
+            while True:
+                while (
+                    len(pending) < concurrency
+                    and (id := next(remaining, None)) is not None
+                ):
+                    pending[asyncio.ensure_future(self.get_recipe_details(id))] = id
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    id = pending.pop(future)
+                    if (exception := future.exception()) is None:
+                        yield id, future.result()
+                    elif isinstance(exception, CookidooException):
+                        yield id, exception
+                    else:
+                        raise exception
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def get_recipe_details_many(
+        self, ids: Iterable[str], concurrency: int = 8
+    ) -> dict[str, CookidooRecipeDetails | CookidooException]:
+        """Get the details of many recipes.
+
+        Parameters
+        ----------
+        ids
+            The ids of the recipes
+        concurrency
+            The maximum number of concurrent requests
+
+        Returns
+        -------
+        dict[str, CookidooRecipeDetails | CookidooException]
+            The details or the exception loading them, per recipe id.
+
+        Raises
+        ------
+        CookidooConfigException
+            If the concurrency is not positive.
+
+        """
+        return {
+            id: result
+            async for id, result in self.iter_recipe_details(ids, concurrency)
+        }
+
+    async def preload_recipe_details(self, ids: Iterable[str]) -> int:
+        """Load stored recipe details into the memory cache, without any request.
+
+        Parameters
+        ----------
+        ids
+            The ids of the recipes to load, in the language of the instance
+
+        Returns
+        -------
+        int
+            The number of recipes found in the store.
+
+        Raises
+        ------
+        CookidooConfigException
+            If no recipe cache with a store is configured.
+
+        """
+        if (cache := self._recipe_cache) is None or cache.store is None:
+            raise CookidooConfigException(
+                "No recipe store available, please configure a recipe cache with a store"
+            )
+        language = self._cfg["localization"]["language"]
+        return len(
+            await self._load_stored_recipes(
+                cache, cache.store, [(language, id) for id in ids]
+            )
+        )
+
+    async def _load_stored_recipes(
+        self,
+        cache: CookidooRecipeCache,
+        store: CookidooRecipeStore,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], CookidooRecipeCacheEntry]:
+        """Load recipes from the store into the memory cache.
+
+        A failing store or an unreadable recipe is logged and skipped,
+        the recipe is then loaded from the API.
+        """
+        try:
+            stored = await store.get_many(keys)
+        except sqlite3.Error:
+            _LOGGER.warning("Cannot load recipes from the store", exc_info=True)
+            return {}
+
+        entries = {}
+        for key, recipe in stored.items():
+            try:
+                details = self._parse(
+                    recipe.body, "Loading stored recipe", _recipe_details_from_json
+                )
+            except CookidooParseException:
+                continue
+            entries[key] = CookidooRecipeCacheEntry(
+                self._model(details, CookidooRecipeDetailsModel),
+                recipe.fetched_at,
+                recipe.etag,
+                recipe.last_modified,
+            )
+            cache.put(key, entries[key])
+        return entries
+
+    async def _store_recipe(self, write: Awaitable[None]) -> None:
+        """Write to the recipe store, logging failures as the cache is optional."""
+        try:
+            await write
+        except sqlite3.Error:
+            _LOGGER.warning("Cannot write recipe to the store", exc_info=True)
+
+    async def get_shopping_list(
+        self,
+        max_age: float = 0,
+    ) -> CookidooShoppingList:
+        """Get the recipes, ingredient items and additional items of the shopping list.
+
+        Parameters
+        ----------
+        max_age
+            The age in seconds up to which the last snapshot is reused instead
+            of loading the shopping list again
+
+        Returns
+        -------
+        CookidooShoppingList
+            The snapshot of the shopping list
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        return self._export(
+            await self._get_shopping_list(max_age),
+            CookidooShoppingListModel,
+            shared=True,
+        )
+
+    async def _get_shopping_list(self, max_age: float) -> CookidooShoppingList:
+        """Get the shared snapshot of the shopping list, loading it if outdated."""
+        if self._shopping_list and (
+            time.monotonic() - self._shopping_list[0] <= max_age
+        ):
+            return self._shopping_list[1]
+
+        generation = self._shopping_list_generation
+        shopping_list = self._model(
+            await self._request(
+                "GET",
+                self._routes.url(SHOPPING_LIST_PATH),
+                "Loading shopping list",
+                lambda json: cookidoo_shopping_list_from_json(
+                    cast(ShoppingListJSON, json)
+                ),
+            ),
+            CookidooShoppingListModel,
+        )
+        self._keep_shopping_list(shopping_list, generation)
+        return shopping_list
+
+    def _keep_shopping_list(
+        self, shopping_list: CookidooShoppingList, generation: int
+    ) -> None:
+        """Keep a loaded snapshot, unless a write happened while it was loaded."""
+        if generation == self._shopping_list_generation:
+            self._shopping_list = (time.monotonic(), shopping_list)
+
+    @contextmanager
+    def _shopping_list_write(self) -> Iterator[None]:
+        """Drop the snapshot for a write, and the reads in flight during it."""
+        self._shopping_list = None
+        self._shopping_list_generation += 1
+        try:
+            yield
+        finally:
+            self._shopping_list = None
+            self._shopping_list_generation += 1
+
+    async def watch_shopping_list(
+        self, interval: float = 30, max_interval: float = 300, backoff: float = 1.5
+    ) -> AsyncIterator[CookidooShoppingListChanges]:
+        """Poll the shopping list, yielding it each time it changes.
+
+        The first shopping list is yielded with all its items added. An
+        unchanged response is recognized by the hash of its body, without being
+        parsed. The polling slows down while the shopping list is unchanged, up
+        to `max_interval`, and is back to `interval` after a change.
+
+        Parameters
+        ----------
+        interval
+            The time in seconds between two polls after a change
+        max_interval
+            The maximum time in seconds between two polls
+        backoff
+            The factor of the time between two polls while unchanged
+
+        Yields
+        ------
+        CookidooShoppingListChanges
+            The shopping list with the ids of its added, removed and changed items.
+
+        Raises
+        ------
+        CookidooConfigException
+            If the intervals or the backoff are invalid.
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        if interval <= 0 or max_interval < interval or backoff < 1:
+            raise CookidooConfigException(
+                "The interval must be positive and at most the maximum interval, "
+                "and the backoff at least 1"
+            )
+
+        action = "Loading shopping list"
+        digest: bytes | None = None
+        previous: CookidooShoppingList | None = None
+        items: dict[str, CookidooItem] = {}
+        delay = interval
+        while True:
+            changed = False
+            generation = self._shopping_list_generation
+            response = await self._fetch(
+                "GET", self._routes.url(SHOPPING_LIST_PATH), action
+            )
+            body_digest = hashlib.blake2b(response.body, digest_size=16).digest()
+            if body_digest != digest:
+                digest = body_digest
+                shopping_list = self._parse(
+                    response.body,
+                    action,
+                    lambda json: cookidoo_shopping_list_from_json(
+                        cast(ShoppingListJSON, json)
+                    ),
+                )
+                snapshot = self._model(shopping_list, CookidooShoppingListModel)
+                self._keep_shopping_list(snapshot, generation)
+                if shopping_list != previous:
+                    current: dict[str, CookidooItem] = {
+                        item["id"]: item
+                        for item in chain(
+                            shopping_list["ingredient_items"],
+                            shopping_list["additional_items"],
+                        )
+                    }
+                    yield CookidooShoppingListChanges(
+                        shopping_list=self._export(
+                            snapshot, CookidooShoppingListModel, shared=True
+                        ),
+                        added=current.keys() - items.keys(),
+                        removed=items.keys() - current.keys(),
+                        changed={
+                            id
+                            for id, item in current.items()
+                            if id in items and items[id] != item
+                        },
+                    )
+                    previous, items, changed = shopping_list, current, True
+            delay = interval if changed else min(max_interval, delay * backoff)
+            await asyncio.sleep(delay)
+
+    async def get_shopping_list_recipes(
+        self,
+    ) -> list[CookidooRecipe]:
+        """Get recipes.
+
+        Returns
+        -------
+        list[CookidooRecipe]
+            The list of the recipes
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        shopping_list = await self._get_shopping_list(self._shopping_list_max_age)
+        return self._export(shopping_list["recipes"], CookidooRecipeModel, shared=True)
+
+    async def get_ingredient_items(
+        self,
+    ) -> list[CookidooIngredientItem]:
+        """Get ingredient items.
+
+        Returns
+        -------
+        list[CookidooIngredientItem]
+            The list of the ingredient items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        shopping_list = await self._get_shopping_list(self._shopping_list_max_age)
+        return self._export(
+            shopping_list["ingredient_items"], CookidooIngredientItemModel, shared=True
+        )
+
+    async def iter_ingredient_items(self) -> AsyncIterator[CookidooIngredientItem]:
+        """Get ingredient items, yielding each as soon as it is received.
+
+        The shopping list is decoded one recipe at a time while it is received,
+        so that the memory stays flat however long the list is. The snapshot of
+        the shopping list is neither used nor updated.
+
+        Yields
+        ------
+        CookidooIngredientItem
+            The ingredient items.
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        action = "Loading ingredient items"
+        async for recipe in self._stream(
+            self._routes.url(SHOPPING_LIST_PATH), action, "recipes"
+        ):
+            try:
+                items = [
+                    cookidoo_ingredient_item_from_json(item)
+                    for item in cast(RecipeJSON, recipe)["recipeIngredientGroups"]
+                ]
+            except (KeyError, TypeError) as e:
+                raise CookidooParseException(
+                    f"{action} failed during parsing of request response."
+                ) from e
+            for item in items:
+                yield self._export(item, CookidooIngredientItemModel)
+
+    async def add_ingredient_items_for_recipes(
+        self,
+        recipe_ids: list[str],
+    ) -> list[CookidooIngredientItem]:
+        """Add ingredient items for recipes.
+
+        Parameters
+        ----------
+        recipe_ids
+            The recipe ids for the ingredient items to add to the shopping list
+
+        Returns
+        -------
+        list[CookidooIngredientItem]
+            The list of the added ingredient items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {"recipeIDs": recipe_ids}
+            items = await self._request(
+                "POST",
+                self._routes.url(ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH),
+                "Add ingredient items for recipes",
+                lambda json: [
+                    cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
+                    for recipe in json["data"]
+                    for ingredient in recipe["recipeIngredientGroups"]
+                ],
+                json=json_data,
+            )
+            return self._export(items, CookidooIngredientItemModel)
+
+    async def remove_ingredient_items_for_recipes(
+        self,
+        recipe_ids: list[str],
+    ) -> None:
+        """Remove ingredient items for recipes.
+
+        Parameters
+        ----------
+        recipe_ids
+            The recipe ids for the ingredient items to remove to the shopping list
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {"recipeIDs": recipe_ids}
+            await self._request(
+                "POST",
+                self._routes.url(REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH),
+                "Remove ingredient items for recipes",
+                json=json_data,
+            )
+
+    async def edit_ingredient_items_ownership(
+        self,
+        ingredient_items: list[CookidooIngredientItem],
+    ) -> list[CookidooIngredientItem]:
+        """Edit ownership ingredient items.
+
+        Parameters
+        ----------
+        ingredient_items
+            The ingredient items to change the the `is_owned` value for
+
+        Returns
+        -------
+        list[CookidooIngredientItem]
+            The list of the edited ingredient items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {
+                "ingredients": [
+                    {
+                        "id": ingredient_item["id"],
+                        "isOwned": ingredient_item["is_owned"],
+                        "ownedTimestamp": int(time.time()),
+                    }
+                    for ingredient_item in ingredient_items
+                ]
+            }
+            items = await self._request(
+                "POST",
+                self._routes.url(EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH),
+                "Edit ingredient items ownership",
+                lambda json: [
+                    cookidoo_ingredient_item_from_json(cast(ItemJSON, ingredient))
+                    for ingredient in json["data"]
+                ],
+                json=json_data,
+            )
+            return self._export(items, CookidooIngredientItemModel)
+
+    async def get_additional_items(
+        self,
+    ) -> list[CookidooAdditionalItem]:
+        """Get additional items.
+
+        Returns
+        -------
+        list[CookidooAdditionalItem]
+            The list of the additional items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        shopping_list = await self._get_shopping_list(self._shopping_list_max_age)
+        return self._export(
+            shopping_list["additional_items"], CookidooAdditionalItemModel, shared=True
+        )
+
+    async def add_additional_items(
+        self,
+        additional_item_names: list[str],
+    ) -> list[CookidooAdditionalItem]:
+        """Create additional items.
+
+        Parameters
+        ----------
+        additional_item_names
+            The additional item names to create, only the label can be set, as the default state `is_owned=false` is forced (chain with immediate update call for work-around)
+
+        Returns
+        -------
+        list[CookidooAdditionalItem]
+            The list of the added additional items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {"itemsValue": additional_item_names}
+            items = await self._request(
+                "POST",
+                self._routes.url(ADD_ADDITIONAL_ITEMS_PATH),
+                "Add additional items",
+                lambda json: [
+                    cookidoo_additional_item_from_json(
+                        cast(AdditionalItemJSON, additional_item)
+                    )
+                    for additional_item in json["data"]
+                ],
+                json=json_data,
+            )
+            return self._export(items, CookidooAdditionalItemModel)
+
+    async def edit_additional_items(
+        self,
+        additional_items: list[CookidooAdditionalItem],
+    ) -> list[CookidooAdditionalItem]:
+        """Edit additional items.
+
+        Parameters
+        ----------
+        additional_items
+            The additional items to change the the `name` value for
+
+        Returns
+        -------
+        list[CookidooAdditionalItem]
+            The list of the edited additional items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {
+                "additionalItems": [
+                    {
+                        "id": additional_item["id"],
+                        "name": additional_item["name"],
+                    }
+                    for additional_item in additional_items
+                ]
+            }
+            items = await self._request(
+                "POST",
+                self._routes.url(EDIT_ADDITIONAL_ITEMS_PATH),
+                "Edit additional items",
+                lambda json: [
+                    cookidoo_additional_item_from_json(
+                        cast(AdditionalItemJSON, additional_item)
+                    )
+                    for additional_item in json["data"]
+                ],
+                json=json_data,
+            )
+            return self._export(items, CookidooAdditionalItemModel)
+
+    async def edit_additional_items_ownership(
+        self,
+        additional_items: list[CookidooAdditionalItem],
+    ) -> list[CookidooAdditionalItem]:
+        """Edit ownership additional items.
+
+        Parameters
+        ----------
+        additional_items
+            The additional items to change the the `is_owned` value for
+
+        Returns
+        -------
+        list[CookidooAdditionalItem]
+            The list of the edited additional items
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {
+                "additionalItems": [
+                    {
+                        "id": additional_item["id"],
+                        "isOwned": additional_item["is_owned"],
+                        "ownedTimestamp": int(time.time()),
+                    }
+                    for additional_item in additional_items
+                ]
+            }
+            items = await self._request(
+                "POST",
+                self._routes.url(EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH),
+                "Edit additional items ownership",
+                lambda json: [
+                    cookidoo_additional_item_from_json(
+                        cast(AdditionalItemJSON, additional_item)
+                    )
+                    for additional_item in json["data"]
+                ],
+                json=json_data,
+            )
+            return self._export(items, CookidooAdditionalItemModel)
+
+    async def remove_additional_items(
+        self,
+        additional_item_ids: list[str],
+    ) -> None:
+        """Remove additional items.
+
+        Parameters
+        ----------
+        additional_item_ids
+            The additional item ids to remove
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            json_data = {"additionalItemIDs": additional_item_ids}
+            await self._request(
+                "POST",
+                self._routes.url(REMOVE_ADDITIONAL_ITEMS_PATH),
+                "Remove additional items",
+                json=json_data,
+            )
+
+    async def clear_shopping_list(
+        self,
+    ) -> None:
+        """Remove all additional items, ingredients and recipes.
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        with self._shopping_list_write():
+            await self._request(
+                "DELETE",
+                self._routes.url(SHOPPING_LIST_PATH),
+                "Clear shopping list",
+            )
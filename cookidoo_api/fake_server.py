@@ -0,0 +1,506 @@
+"""Cookidoo API fake server, for offline and load tests.
+
+The server implements the endpoints used by the client, with payloads modeled
+on the raw requests in `docs/raw-api-requests`, and keeps a shopping list per
+account in memory. Run it with `python -m cookidoo_api.fake_server` and point
+the client at it with the `api_endpoint` and `token_endpoint` options.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import random
+import re
+import secrets
+import time
+from typing import Any
+import uuid
+
+from aiohttp import web
+
+from cookidoo_api.const import (
+    ADD_ADDITIONAL_ITEMS_PATH,
+    ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+    COMMUNITY_PROFILE_PATH,
+    COOKIDOO_AUTHORIZATION_HEADER,
+    EDIT_ADDITIONAL_ITEMS_PATH,
+    EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH,
+    EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH,
+    RECIPE_PATH,
+    REMOVE_ADDITIONAL_ITEMS_PATH,
+    REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH,
+    SHOPPING_LIST_PATH,
+    SUBSCRIPTIONS_PATH,
+)
+
+TOKEN_PATH = "oauth2/token"
+
+_RECIPE_ID = re.compile(r"r\d+")
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_INGREDIENT_REF = "com.vorwerk.ingredients.Ingredient-rpf-{}"
+
+# the ingredients of the generated recipes: local id, name, quantity and unit
+_INGREDIENTS = (
+    ("9", "Zucker", 200, "g"),
+    ("116", "Eiweisse", 4, ""),
+    ("322", "Kokosraspeln", 260, "g"),
+    ("319", "Kondensmilch", 400, "g"),
+    ("15", "Butter", 50, "g"),
+    ("27", "Weizenmehl", 250, "g"),
+    ("60", "Milch", 500, "g"),
+    ("32", "Eier", 3, ""),
+    ("2", "Salz", 1, "Prise"),
+    ("411", "Orangen", 2, ""),
+)
+
+
+def _ulid() -> str:
+    """Generate an id like the ones of the shopping list items."""
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    return "".join(
+        _ULID_ALPHABET[(value >> shift) & 31] for shift in range(125, -1, -5)
+    )
+
+
+def _recipe_ingredients(id: str) -> list[tuple[str, str, int, str]]:
+    """Get the ingredients of a recipe, the same for each call."""
+    rng = random.Random(id)
+    return rng.sample(_INGREDIENTS, rng.randint(3, 6))
+
+
+def _recipe_details(id: str, language: str) -> dict[str, Any]:
+    """Generate the details of a recipe."""
+    ingredients = _recipe_ingredients(id)
+    return {
+        "id": id,
+        "title": f"Rezept {id}",
+        "locale": language.rpartition("-")[2].lower(),
+        "language": language.partition("-")[0],
+        "status": "ok",
+        "difficulty": "easy",
+        "times": [
+            {"type": "activeTime", "comment": "", "quantity": {"value": 2700}},
+            {"type": "totalTime", "comment": "", "quantity": {"value": 32400}},
+        ],
+        "categories": [
+            {
+                "id": "VrkNavCategory-RPF-011",
+                "title": "Desserts, Pâtisserie und Süssigkeiten",
+                "subtitle": "",
+                "defaultTitle": "Desserts and sweets",
+            }
+        ],
+        "servingSize": {"quantity": {"value": 4}, "unitNotation": "Portionen"},
+        "recipeUtensils": [
+            {"utensilRef": "5460-utensil-rdpf3", "utensilNotation": "Kühlschrank"}
+        ],
+        "recipeIngredientGroups": [
+            {
+                "title": "",
+                "recipeIngredients": [
+                    {
+                        "localId": _INGREDIENT_REF.format(local_id),
+                        "optional": False,
+                        "quantity": {"value": value},
+                        "unit_ref": "11-unit-rdpf3" if unit else "",
+                        "preparation": "",
+                        "unitNotation": unit,
+                        "ingredient_ref": _INGREDIENT_REF.format(local_id),
+                        "ingredientNotation": name,
+                    }
+                    for local_id, name, value, unit in ingredients
+                ],
+            }
+        ],
+        "recipeStepGroups": [
+            {
+                "title": "",
+                "recipeSteps": [
+                    {
+                        "title": str(step),
+                        "formattedText": f"{name} in den Mixtopf geben.",
+                    }
+                    for step, (_, name, _, _) in enumerate(ingredients, 1)
+                ],
+            }
+        ],
+        "additionalInformation": [
+            {
+                "type": "VrkRecipeAdditionalInformationType",
+                "content": "Kühl aufbewahren.",
+            }
+        ],
+        "inCollections": [
+            {
+                "id": "col500561",
+                "title": "Schneeweiss und Zuckersüss",
+                "recipesCount": {"value": 6, "text": "other"},
+                "market": "ch",
+            }
+        ],
+    }
+
+
+def _shopping_list_recipe(id: str, language: str) -> dict[str, Any]:
+    """Generate a recipe of a shopping list, with new ids for its items."""
+    return {
+        "id": id,
+        "ulid": _ulid(),
+        "title": f"Rezept {id}",
+        "locale": language.rpartition("-")[2].lower(),
+        "status": "ok",
+        "language": language.partition("-")[0],
+        "hasVariants": False,
+        "isCustomerRecipe": False,
+        "descriptiveAssets": [],
+        "recipeIngredientGroups": [
+            {
+                "id": _ulid(),
+                "isOwned": False,
+                "localId": _INGREDIENT_REF.format(local_id),
+                "optional": False,
+                "quantity": {"value": value},
+                "unit_ref": "11-unit-rdpf3" if unit else "",
+                "preparation": "",
+                "unitNotation": unit,
+                "ingredient_ref": _INGREDIENT_REF.format(local_id),
+                "ingredientNotation": name,
+                "shoppingCategory_ref": "ShoppingCategory-rpf-6",
+            }
+            for local_id, name, value, unit in _recipe_ingredients(id)
+        ],
+    }
+
+
+@dataclass(slots=True)
+class _ShoppingList:
+    recipes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    ingredient_items: dict[str, dict[str, Any]] = field(default_factory=dict)
+    additional_items: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def clear(self) -> None:
+        self.recipes.clear()
+        self.ingredient_items.clear()
+        self.additional_items.clear()
+
+
+async def _items(request: web.Request, key: str) -> list[Any]:
+    """Get the list of a json request body."""
+    try:
+        values = json.loads(await request.read())[key]
+    except (ValueError, KeyError, TypeError) as e:
+        raise web.HTTPBadRequest(text=f"The body has no list {key}") from e
+    if not isinstance(values, list):
+        raise web.HTTPBadRequest(text=f"The body has no list {key}")
+    return values
+
+
+class CookidooFakeServer:
+    """Fake Cookidoo server, with the shopping lists of the accounts in memory.
+
+    The recipes are generated from their id, which must look like `r907015`.
+    The accounts are created on their first login, with any password unless
+    the passwords are given.
+    """
+
+    def __init__(
+        self,
+        passwords: dict[str, str] | None = None,
+        expires_in: int = 43199,
+        latency: float = 0,
+    ) -> None:
+        """Init function for the fake server.
+
+        Parameters
+        ----------
+        passwords
+            The passwords of the accounts by email, if omitted any password
+            is accepted
+        expires_in
+            The lifetime in seconds of the access tokens
+        latency
+            The time in seconds each response is delayed
+
+        """
+        self.passwords = passwords
+        self.expires_in = expires_in
+        self.latency = latency
+        self.requests = 0
+        self._access_tokens: dict[str, tuple[str, float]] = {}
+        self._refresh_tokens: dict[str, str] = {}
+        self._shopping_lists: dict[str, _ShoppingList] = {}
+        self.app = web.Application(middlewares=[self._middleware])
+        shopping_list = f"/{SHOPPING_LIST_PATH}"
+        self.app.add_routes(
+            [
+                web.post(f"/{TOKEN_PATH}", self._token),
+                web.get(f"/{COMMUNITY_PROFILE_PATH}", self._user_info),
+                web.get(f"/{SUBSCRIPTIONS_PATH}", self._subscriptions),
+                web.get(f"/{RECIPE_PATH}", self._recipe),
+                web.get(shopping_list, self._shopping_list),
+                web.delete(shopping_list, self._clear_shopping_list),
+                web.post(
+                    f"/{ADD_INGREDIENT_ITEMS_FOR_RECIPES_PATH}", self._add_recipes
+                ),
+                web.post(
+                    f"/{REMOVE_INGREDIENT_ITEMS_FOR_RECIPES_PATH}", self._remove_recipes
+                ),
+                web.post(
+                    f"/{EDIT_OWNERSHIP_INGREDIENT_ITEMS_PATH}",
+                    self._edit_ingredient_items_ownership,
+                ),
+                web.post(f"/{ADD_ADDITIONAL_ITEMS_PATH}", self._add_additional_items),
+                web.post(f"/{EDIT_ADDITIONAL_ITEMS_PATH}", self._edit_additional_items),
+                web.post(
+                    f"/{EDIT_OWNERSHIP_ADDITIONAL_ITEMS_PATH}",
+                    self._edit_additional_items_ownership,
+                ),
+                web.post(
+                    f"/{REMOVE_ADDITIONAL_ITEMS_PATH}", self._remove_additional_items
+                ),
+            ]
+        )
+
+    def expire_tokens(self) -> None:
+        """Expire the access tokens, so that the next requests are rejected."""
+        self._access_tokens.clear()
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    def _email(self, request: web.Request) -> str:
+        """Get the email of the account of the access token."""
+        _, _, token = request.headers.get("Authorization", "").partition(" ")
+        email, expires_at = self._access_tokens.get(token, ("", 0))
+        if expires_at <= time.time():
+            raise web.HTTPUnauthorized(text="The access token is invalid or expired")
+        return email
+
+    def _account(self, request: web.Request) -> _ShoppingList:
+        """Get the shopping list of the account of the access token."""
+        return self._shopping_lists.setdefault(self._email(request), _ShoppingList())
+
+    async def _token(self, request: web.Request) -> web.Response:
+        if request.headers.get("Authorization") != COOKIDOO_AUTHORIZATION_HEADER:
+            raise web.HTTPUnauthorized(text="Invalid client credentials")
+        form = await request.post()
+        match form.get("grant_type"):
+            case "password":
+                email = str(form.get("username", ""))
+                if not email or (
+                    self.passwords is not None
+                    and self.passwords.get(email) != form.get("password")
+                ):
+                    raise web.HTTPUnauthorized(text="Invalid email or password")
+            case "refresh_token":
+                refresh_token = str(form.get("refresh_token", ""))
+                if (email := self._refresh_tokens.get(refresh_token, "")) == "":
+                    raise web.HTTPBadRequest(text="Invalid refresh token")
+            case _:
+                raise web.HTTPBadRequest(text="Unsupported grant type")
+
+        access_token = secrets.token_urlsafe(32)
+        refresh_token = secrets.token_urlsafe(32)
+        self._access_tokens[access_token] = (email, time.time() + self.expires_in)
+        self._refresh_tokens[refresh_token] = email
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "expires_in": self.expires_in,
+                "id_token": secrets.token_urlsafe(32),
+                "iss": f"{request.url.origin()}/",
+                "jti": str(uuid.uuid4()),
+                "refresh_token": refresh_token,
+                "scope": "marcossapi openid profile email Online offline_access",
+                "token_type": "bearer",
+                "user_name": email,
+            }
+        )
+
+    async def _user_info(self, request: web.Request) -> web.Response:
+        email = self._email(request)
+        return web.json_response(
+            {
+                "id": str(uuid.uuid5(uuid.NAMESPACE_URL, email)),
+                "isPublic": False,
+                "userInfo": {
+                    "username": email.partition("@")[0],
+                    "description": "",
+                    "picture": "",
+                    "pictureTemplate": "",
+                },
+                "savedSearches": [],
+                "foodPreferences": [],
+                "meta": {},
+                "thermomixes": [],
+            }
+        )
+
+    async def _subscriptions(self, request: web.Request) -> web.Response:
+        self._email(request)
+        return web.json_response(
+            [
+                {
+                    "active": True,
+                    "startDate": "2024-09-15T00:00:00Z",
+                    "expires": "2099-12-31T23:59:00Z",
+                    "type": "TRIAL",
+                    "extendedType": "TRIAL",
+                    "autoRenewalProduct": "Cookidoo 1 Month Free",
+                    "autoRenewalProductCode": None,
+                    "countryOfResidence": "ch",
+                    "subscriptionLevel": "NONE",
+                    "status": "RUNNING",
+                    "marketMismatch": False,
+                    "subscriptionSource": "COMMERCE",
+                    "_created": "2024-09-15T00:00:00Z",
+                    "_modified": None,
+                }
+            ]
+        )
+
+    async def _recipe(self, request: web.Request) -> web.Response:
+        self._email(request)
+        id = request.match_info["id"]
+        if not _RECIPE_ID.fullmatch(id):
+            raise web.HTTPNotFound(text=f"Unknown recipe {id}")
+        return web.json_response(
+            _recipe_details(id, request.match_info["language"]),
+            content_type="application/vnd.vorwerk.recipe.embedded.hal+json",
+        )
+
+    async def _shopping_list(self, request: web.Request) -> web.Response:
+        shopping_list = self._account(request)
+        return web.json_response(
+            {
+                "recipes": list(shopping_list.recipes.values()),
+                "customerRecipes": [],
+                "additionalItems": list(shopping_list.additional_items.values()),
+            }
+        )
+
+    async def _clear_shopping_list(self, request: web.Request) -> web.Response:
+        self._account(request).clear()
+        return web.json_response(
+            {
+                "message": "Von der Einkaufsliste entfernt",
+                "data": {"recipes": [], "additionalItems": []},
+            }
+        )
+
+    async def _add_recipes(self, request: web.Request) -> web.Response:
+        shopping_list = self._account(request)
+        language = request.match_info["language"]
+        added = []
+        for id in await _items(request, "recipeIDs"):
+            if not isinstance(id, str) or not _RECIPE_ID.fullmatch(id):
+                continue
+            if (recipe := shopping_list.recipes.get(id)) is None:
+                recipe = shopping_list.recipes[id] = _shopping_list_recipe(id, language)
+                shopping_list.ingredient_items.update(
+                    (item["id"], item) for item in recipe["recipeIngredientGroups"]
+                )
+            added.append(recipe)
+        return web.json_response({"data": added})
+
+    async def _remove_recipes(self, request: web.Request) -> web.Response:
+        shopping_list = self._account(request)
+        ids = set(await _items(request, "recipeIDs"))
+        for id, recipe in list(shopping_list.recipes.items()):
+            # the recipes can be removed by id or by ulid
+            if id in ids or recipe["ulid"] in ids:
+                del shopping_list.recipes[id]
+                for item in recipe["recipeIngredientGroups"]:
+                    shopping_list.ingredient_items.pop(item["id"], None)
+        return web.Response(status=204)
+
+    async def _edit_ingredient_items_ownership(
+        self, request: web.Request
+    ) -> web.Response:
+        shopping_list = self._account(request)
+        edited = []
+        for edit in await _items(request, "ingredients"):
+            if (item := shopping_list.ingredient_items.get(edit.get("id"))) is None:
+                continue
+            item["isOwned"] = bool(edit.get("isOwned"))
+            item["ownedTimestamp"] = edit.get("ownedTimestamp", int(time.time()))
+            edited.append(item)
+        return web.json_response({"data": edited})
+
+    async def _add_additional_items(self, request: web.Request) -> web.Response:
+        shopping_list = self._account(request)
+        added = []
+        for name in await _items(request, "itemsValue"):
+            id = _ulid()
+            item = {"id": id, "name": str(name), "isOwned": False}
+            shopping_list.additional_items[id] = item
+            added.append(item)
+        return web.json_response({"data": added})
+
+    async def _edit_additional_items(self, request: web.Request) -> web.Response:
+        shopping_list = self._account(request)
+        edited = []
+        for edit in await _items(request, "additionalItems"):
+            if (item := shopping_list.additional_items.get(edit.get("id"))) is None:
+                continue
+            item["name"] = str(edit.get("name", item["name"]))
+            edited.append(item)
+        return web.json_response({"data": edited})
+
+    async def _edit_additional_items_ownership(
+        self, request: web.Request
+    ) -> web.Response:
+        shopping_list = self._account(request)
+        edited = []
+        for edit in await _items(request, "additionalItems"):
+            if (item := shopping_list.additional_items.get(edit.get("id"))) is None:
+                continue
+            item["isOwned"] = bool(edit.get("isOwned"))
+            item["ownedTimestamp"] = edit.get("ownedTimestamp", int(time.time()))
+            edited.append(item)
+        return web.json_response({"data": edited})
+
+    async def _remove_additional_items(self, request: web.Request) -> web.Response:
+        shopping_list = self._account(request)
+        for id in await _items(request, "additionalItemIDs"):
+            shopping_list.additional_items.pop(id, None)
+        return web.Response(status=204)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m cookidoo_api.fake_server",
+        description="Run a fake Cookidoo server for offline and load tests.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--expires-in",
+        type=int,
+        default=43199,
+        help="the lifetime in seconds of the access tokens",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0,
+        help="the time in seconds each response is delayed",
+    )
+    args = parser.parse_args(argv)
+    server = CookidooFakeServer(expires_in=args.expires_in, latency=args.latency)
+    web.run_app(server.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 """Cookidoo API helpers."""
 
 import asyncio
-import json
 import logging
-import os
-from typing import cast
+from typing import Any, get_args, get_origin, get_type_hints, is_typeddict
+import warnings
 
+from cookidoo_api.exceptions import CookidooParseException
+from cookidoo_api.localization import (
+    LOCALIZATION_FILE_PATH,
+    LOCALIZATIONS,
+    CookidooLocalizationRegistry,
+)
 from cookidoo_api.types import (
     AdditionalItemJSON,
     CookidooAdditionalItem,
@@ -16,15 +21,34 @@ from cookidoo_api.types import (
     CookidooLocalizationConfig,
     CookidooRecipe,
     CookidooRecipeDetails,
+    CookidooShoppingList,
     IngredientJSON,
     ItemJSON,
     RecipeDetailsJSON,
+    RecipeDetailsTimeJSON,
     RecipeJSON,
+    ShoppingListJSON,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-localization_file_path = os.path.join(os.path.dirname(__file__), "localization.json")
+
+def __getattr__(name: str) -> Any:
+    """Get the deprecated `localization_file_path`.
+
+    It is the path of the localization file of the shared `LOCALIZATIONS`
+    registry. Setting it has no effect, pass the path of another file to a
+    `CookidooLocalizationRegistry` instead.
+    """
+    if name == "localization_file_path":
+        warnings.warn(
+            "localization_file_path is deprecated, "
+            "use CookidooLocalizationRegistry instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return LOCALIZATIONS.path or LOCALIZATION_FILE_PATH
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def cookidoo_recipe_from_json(
@@ -41,63 +65,111 @@ def cookidoo_recipe_from_json(
     )
 
 
+def _field_path(value: Any, schema: Any, key: object, path: str = "") -> str | None:
+    """Find the path of a field missing or invalid in a json, following its schema."""
+    if not isinstance(value, dict):
+        return path.rstrip(".") or None
+    for name, hint in get_type_hints(schema).items():
+        if name not in value:
+            if name == key:
+                return f"{path}{name}"
+            continue
+        item, origin = value[name], get_origin(hint)
+        if is_typeddict(hint) and (
+            found := _field_path(item, hint, key, f"{path}{name}.")
+        ):
+            return found
+        if (
+            origin is list
+            and is_typeddict(item_hint := get_args(hint)[0])
+            and isinstance(item, list)
+        ):
+            for index, element in enumerate(item):
+                if found := _field_path(
+                    element, item_hint, key, f"{path}{name}[{index}]."
+                ):
+                    return found
+    return None
+
+
+def _recipe_times(times: list[RecipeDetailsTimeJSON]) -> dict[str, int]:
+    return {time_["type"]: time_["quantity"]["value"] for time_ in times}
+
+
 def cookidoo_recipe_details_from_json(
     recipe: RecipeDetailsJSON,
 ) -> CookidooRecipeDetails:
-    """Convert an recipe details received from the API to a cookidoo recipe details."""
-    return CookidooRecipeDetails(
-        id=recipe["id"],
-        name=recipe["title"],
-        ingredients=[
-            cookidoo_ingredient_from_json(ingredient)
-            for ingredientGroup in recipe["recipeIngredientGroups"]
-            for ingredient in ingredientGroup["recipeIngredients"]
-        ],
-        difficulty=recipe["difficulty"],
-        notes=[
-            additional_notes["content"]
-            for additional_notes in recipe["additionalInformation"]
-        ],
-        categories=[
-            CookidooCategory(
-                id=category["id"], name=category["title"], notes=category["subtitle"]
-            )
-            for category in recipe["categories"]
-        ],
-        collections=[
-            CookidooCollection(
-                id=collection["id"],
-                name=collection["title"],
-                total_recipes=collection["recipesCount"]["value"],
-            )
-            for collection in recipe["inCollections"]
-        ],
-        utensils=[utensil["utensilNotation"] for utensil in recipe["recipeUtensils"]],
-        serving_size=f"{recipe["servingSize"]['quantity']['value']} {recipe["servingSize"]["unitNotation"]}",
-        active_time=next(
-            time_["quantity"]["value"]
-            for time_ in recipe["times"]
-            if time_["type"] == "activeTime"
-        ),
-        total_time=next(
-            time_["quantity"]["value"]
-            for time_ in recipe["times"]
-            if time_["type"] == "totalTime"
-        ),
-    )
+    """Convert an recipe details received from the API to a cookidoo recipe details.
+
+    Each part of the json is walked once, the times through a map by type.
+
+    Raises
+    ------
+    CookidooParseException
+        If a field is missing or invalid, with its path in the json.
+
+    """
+    try:
+        times = _recipe_times(recipe["times"])
+        serving_size = recipe["servingSize"]
+        return CookidooRecipeDetails(
+            id=recipe["id"],
+            name=recipe["title"],
+            ingredients=[
+                cookidoo_ingredient_from_json(ingredient)
+                for group in recipe["recipeIngredientGroups"]
+                for ingredient in group["recipeIngredients"]
+            ],
+            difficulty=recipe["difficulty"],
+            notes=[notes["content"] for notes in recipe["additionalInformation"]],
+            categories=[
+                CookidooCategory(
+                    id=category["id"],
+                    name=category["title"],
+                    notes=category["subtitle"],
+                )
+                for category in recipe["categories"]
+            ],
+            collections=[
+                CookidooCollection(
+                    id=collection["id"],
+                    name=collection["title"],
+                    total_recipes=collection["recipesCount"]["value"],
+                )
+                for collection in recipe["inCollections"]
+            ],
+            utensils=[
+                utensil["utensilNotation"] for utensil in recipe["recipeUtensils"]
+            ],
+            serving_size=f"{serving_size['quantity']['value']} {serving_size['unitNotation']}",
+            active_time=times["activeTime"],
+            total_time=times["totalTime"],
+        )
+    except KeyError as e:
+        key = e.args[0] if e.args else None
+        path = _field_path(recipe, RecipeDetailsJSON, key)
+        if path is None and key in ("activeTime", "totalTime"):
+            path = f"times[type={key}]"
+        raise CookidooParseException(
+            f"Recipe details are missing the field {path or key}"
+        ) from e
+    except (TypeError, AttributeError) as e:
+        raise CookidooParseException(f"Recipe details are invalid: {e}") from e
 
 
 def cookidoo_ingredient_from_json(
     ingredient: IngredientJSON,
 ) -> CookidooIngredient:
     """Convert an ingredient received from the API to a cookidoo ingredient."""
+    quantity = ingredient["quantity"]
+    unit = ingredient["unitNotation"]
     return CookidooIngredient(
         id=ingredient["localId"],
         name=ingredient["ingredientNotation"],
-        description=f"{ingredient['quantity']['value']} {ingredient['unitNotation']}"
-        if ingredient["unitNotation"] and ingredient["quantity"]
-        else str(ingredient["quantity"]["value"])
-        if ingredient["quantity"]
+        description=f"{quantity['value']} {unit}"
+        if unit and quantity
+        else str(quantity["value"])
+        if quantity
         else "",
     )
 
@@ -129,19 +201,46 @@ def cookidoo_additional_item_from_json(
     )
 
 
-def __get_localization_options(
-    country: str | None = None,
-    language: str | None = None,
-) -> list[CookidooLocalizationConfig]:
-    with open(localization_file_path, encoding="utf-8") as file:
-        options = cast(list[CookidooLocalizationConfig], json.loads(file.read()))
-        return list(
-            filter(
-                lambda option: (not country or option["country_code"] == country)
-                and (not language or option["language"] == language),
-                options,
-            )
-        )
+def cookidoo_shopping_list_from_json(
+    shopping_list: ShoppingListJSON,
+) -> CookidooShoppingList:
+    """Convert a shopping list received from the API to a cookidoo shopping list."""
+    return CookidooShoppingList(
+        recipes=[
+            cookidoo_recipe_from_json(recipe) for recipe in shopping_list["recipes"]
+        ],
+        ingredient_items=[
+            cookidoo_ingredient_item_from_json(ingredient)
+            for recipe in shopping_list["recipes"]
+            for ingredient in recipe["recipeIngredientGroups"]
+        ],
+        additional_items=[
+            cookidoo_additional_item_from_json(additional_item)
+            for additional_item in shopping_list["additionalItems"]
+        ],
+    )
+
+
+async def _loaded_localizations() -> CookidooLocalizationRegistry:
+    """Get the localization registry, loading it in the executor on first use."""
+    if not LOCALIZATIONS.loaded:
+        await asyncio.get_running_loop().run_in_executor(None, LOCALIZATIONS.load)
+    return LOCALIZATIONS
+
+
+def get_localization(locale: str) -> CookidooLocalizationConfig:
+    """Get the localization of a language like `de-CH`.
+
+    A language used in several countries is resolved to the country
+    of its region, like `en-GB` to `gb`.
+
+    Raises
+    ------
+    CookidooConfigException
+        If the language has no or several localizations.
+
+    """
+    return LOCALIZATIONS.get(locale)
 
 
 async def get_localization_options(
@@ -149,16 +248,14 @@ async def get_localization_options(
     language: str | None = None,
 ) -> list[CookidooLocalizationConfig]:
     """Get a list of possible localization options."""
-    return await asyncio.get_running_loop().run_in_executor(
-        None, __get_localization_options, country, language
-    )
+    return (await _loaded_localizations()).options(country, language)
 
 
 async def get_country_options() -> list[str]:
-    """Get a list of possible country options."""
-    return list({option["country_code"] for option in await get_localization_options()})
+    """Get a sorted list of possible country options."""
+    return (await _loaded_localizations()).countries()
 
 
 async def get_language_options() -> list[str]:
-    """Get a list of possible language options."""
-    return list({option["language"] for option in await get_localization_options()})
+    """Get a sorted list of possible language options."""
+    return (await _loaded_localizations()).languages()
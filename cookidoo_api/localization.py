@@ -0,0 +1,154 @@
+"""Cookidoo API localization registry."""
+
+from collections.abc import Callable
+import json
+import os
+from typing import NamedTuple, cast
+
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.types import CookidooLocalizationConfig
+
+LOCALIZATION_FILE_PATH = os.path.join(os.path.dirname(__file__), "localization.json")
+
+
+class _Indexes(NamedTuple):
+    options: tuple[CookidooLocalizationConfig, ...]
+    by_country: dict[str, tuple[CookidooLocalizationConfig, ...]]
+    by_language: dict[str, tuple[CookidooLocalizationConfig, ...]]
+    by_url: dict[str, tuple[CookidooLocalizationConfig, ...]]
+    countries: tuple[str, ...]
+    languages: tuple[str, ...]
+
+
+def _index(
+    options: tuple[CookidooLocalizationConfig, ...],
+    key: Callable[[CookidooLocalizationConfig], str],
+) -> dict[str, tuple[CookidooLocalizationConfig, ...]]:
+    index: dict[str, list[CookidooLocalizationConfig]] = {}
+    for option in options:
+        index.setdefault(key(option), []).append(option)
+    return {value: tuple(group) for value, group in index.items()}
+
+
+class CookidooLocalizationRegistry:
+    """Registry of the localization options, indexed by country, language and url.
+
+    The options are loaded on first use and kept in memory, the lookups are
+    dictionary lookups. The returned options are copies, which can be changed.
+    Without a path, the options are imported from the prebuilt module generated
+    by `scripts/generate-localization-module.py`, which is faster than parsing
+    the json.
+    """
+
+    _indexes: _Indexes | None
+
+    def __init__(self, path: str | None = None) -> None:
+        """Init function for the localization registry.
+
+        Parameters
+        ----------
+        path
+            The path of the json file of the localization options,
+            if omitted the prebuilt ones
+
+        """
+        self.path = path
+        self._indexes = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the options are loaded."""
+        return self._indexes is not None
+
+    def load(self) -> None:
+        """Load the options, if not loaded yet."""
+        self._get_indexes()
+
+    def _get_indexes(self) -> _Indexes:
+        if self._indexes is None:
+            options = self._read_options()
+            by_country = _index(options, lambda option: option["country_code"])
+            by_language = _index(options, lambda option: option["language"])
+            self._indexes = _Indexes(
+                options,
+                by_country,
+                by_language,
+                _index(options, lambda option: option["url"]),
+                tuple(sorted(by_country)),
+                tuple(sorted(by_language)),
+            )
+        return self._indexes
+
+    def _read_options(self) -> tuple[CookidooLocalizationConfig, ...]:
+        if self.path is None:
+            try:
+                from cookidoo_api._localization_data import OPTIONS
+            except ImportError:  # not generated, fall back to the json
+                pass
+            else:
+                return tuple(
+                    CookidooLocalizationConfig(
+                        country_code=country_code, language=language, url=url
+                    )
+                    for country_code, language, url in OPTIONS
+                )
+        with open(self.path or LOCALIZATION_FILE_PATH, encoding="utf-8") as file:
+            return tuple(
+                cast(list[CookidooLocalizationConfig], json.loads(file.read()))
+            )
+
+    def options(
+        self, country: str | None = None, language: str | None = None
+    ) -> list[CookidooLocalizationConfig]:
+        """Get the localization options, optionally of a country and a language."""
+        indexes = self._get_indexes()
+        if country:
+            options = indexes.by_country.get(country, ())
+            if language:
+                options = tuple(
+                    option for option in options if option["language"] == language
+                )
+        elif language:
+            options = indexes.by_language.get(language, ())
+        else:
+            options = indexes.options
+        return [option.copy() for option in options]
+
+    def by_url(self, url: str) -> list[CookidooLocalizationConfig]:
+        """Get the localization options of a cookidoo url."""
+        return [option.copy() for option in self._get_indexes().by_url.get(url, ())]
+
+    def countries(self) -> list[str]:
+        """Get the sorted country codes."""
+        return list(self._get_indexes().countries)
+
+    def languages(self) -> list[str]:
+        """Get the sorted languages."""
+        return list(self._get_indexes().languages)
+
+    def get(self, locale: str) -> CookidooLocalizationConfig:
+        """Get the localization of a language like `de-CH`.
+
+        A language used in several countries is resolved to the country
+        of its region, like `en-GB` to `gb`.
+
+        Raises
+        ------
+        CookidooConfigException
+            If the language has no or several localizations.
+
+        """
+        options = self._get_indexes().by_language.get(locale, ())
+        if len(options) > 1:
+            region = locale.rpartition("-")[2].lower()
+            options = tuple(
+                option for option in options if option["country_code"] == region
+            )
+        if len(options) != 1:
+            raise CookidooConfigException(
+                f"No unique localization for {locale}, pass the localization instead"
+            )
+        return options[0].copy()
+
+
+LOCALIZATIONS = CookidooLocalizationRegistry()
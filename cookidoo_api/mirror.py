@@ -0,0 +1,381 @@
+"""Cookidoo API shopping list mirror."""
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from itertools import count
+import logging
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from cookidoo_api.exceptions import CookidooException
+from cookidoo_api.models import CookidooModel
+from cookidoo_api.types import (
+    CookidooAdditionalItem,
+    CookidooIngredientItem,
+    CookidooMirrorStats,
+    CookidooRecipe,
+    CookidooShoppingList,
+)
+
+if TYPE_CHECKING:
+    from cookidoo_api.cookidoo import Cookidoo
+
+_LOGGER = logging.getLogger(__name__)
+
+# the prefix of the ids of the additional items not created yet
+_LOCAL_ID_PREFIX = "local:"
+
+
+@dataclass(slots=True, eq=False)
+class CookidooMirrorWrite:
+    """Cookidoo shopping list mirror write type.
+
+    Attributes
+    ----------
+    action
+        The name of the `Cookidoo` method sending the write
+    values
+        The items, ids or names passed to the method
+    status
+        Whether the write is waiting to be sent, sent or failed
+    error
+        The exception of the failed write, a `CookidooException` unless the
+        write failed unexpectedly
+    local_ids
+        The local ids of the created additional items
+
+    """
+
+    action: str
+    values: list[Any]
+    status: Literal["pending", "flushed", "failed"] = "pending"
+    error: Exception | None = None
+    local_ids: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _State:
+    recipes: dict[str, CookidooRecipe] = field(default_factory=dict)
+    ingredient_items: dict[str, CookidooIngredientItem] = field(default_factory=dict)
+    additional_items: dict[str, CookidooAdditionalItem] = field(default_factory=dict)
+
+
+def _plain[T](value: T) -> T:
+    """Copy a result of the client as dicts, also if it is a model."""
+    if isinstance(value, CookidooModel):
+        return value.copy()  # type: ignore[return-value]
+    return deepcopy(value)
+
+
+class CookidooShoppingListMirror:
+    """In-memory copy of a shopping list, with optimistic writes sent behind.
+
+    The reads are answered from memory. The writes change the copy at once and
+    are sent in order in the background, then the copy takes the items returned
+    by the server. The created additional items have local ids until they are
+    sent, which can be used in the following writes.
+
+    When a write fails, the shopping list is loaded again once the other writes
+    are sent, and the writes still pending are applied over it. Adding recipes
+    also reloads the shopping list, as the server only returns their items.
+    """
+
+    def __init__(self, cookidoo: "Cookidoo", max_failures: int = 100) -> None:
+        """Init function for the shopping list mirror.
+
+        Parameters
+        ----------
+        cookidoo
+            The client of the shopping list
+        max_failures
+            The number of failed writes kept in `failures`
+
+        """
+        self.cookidoo = cookidoo
+        self._state = _State()
+        self._queue: deque[CookidooMirrorWrite] = deque()
+        self._failures: deque[CookidooMirrorWrite] = deque(maxlen=max_failures)
+        self._worker: asyncio.Task[None] | None = None
+        self._ids: dict[str, str] = {}
+        self._local_ids = count()
+        self._stale = False
+        self._flushed = 0
+        self._failed = 0
+        self._reconciliations = 0
+
+    async def load(self) -> None:
+        """Load the shopping list, keeping the writes not sent yet.
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If the request fails.
+        CookidooParseException
+            If the parsing of the request response fails.
+
+        """
+        shopping_list = _plain(await self.cookidoo.get_shopping_list())
+        self._state = self._from_shopping_list(shopping_list)
+        for write in self._queue:
+            self._apply(write)
+
+    @staticmethod
+    def _from_shopping_list(shopping_list: CookidooShoppingList) -> _State:
+        return _State(
+            {recipe["id"]: recipe for recipe in shopping_list["recipes"]},
+            {item["id"]: item for item in shopping_list["ingredient_items"]},
+            {item["id"]: item for item in shopping_list["additional_items"]},
+        )
+
+    @property
+    def recipes(self) -> list[CookidooRecipe]:
+        """The recipes on the shopping list."""
+        return deepcopy(list(self._state.recipes.values()))
+
+    @property
+    def ingredient_items(self) -> list[CookidooIngredientItem]:
+        """The ingredient items of the recipes on the shopping list."""
+        return deepcopy(list(self._state.ingredient_items.values()))
+
+    @property
+    def additional_items(self) -> list[CookidooAdditionalItem]:
+        """The additional items on the shopping list."""
+        return deepcopy(list(self._state.additional_items.values()))
+
+    @property
+    def pending(self) -> list[CookidooMirrorWrite]:
+        """The writes waiting to be sent, in order."""
+        return list(self._queue)
+
+    @property
+    def failures(self) -> list[CookidooMirrorWrite]:
+        """The last failed writes."""
+        return list(self._failures)
+
+    def stats(self) -> CookidooMirrorStats:
+        """Mirror statistics."""
+        return CookidooMirrorStats(
+            pending=len(self._queue),
+            flushed=self._flushed,
+            failed=self._failed,
+            reconciliations=self._reconciliations,
+        )
+
+    def add_ingredient_items_for_recipes(
+        self, recipe_ids: list[str]
+    ) -> CookidooMirrorWrite:
+        """Add ingredient items for recipes, once sent."""
+        return self._write("add_ingredient_items_for_recipes", recipe_ids)
+
+    def remove_ingredient_items_for_recipes(
+        self, recipe_ids: list[str]
+    ) -> CookidooMirrorWrite:
+        """Remove ingredient items for recipes."""
+        return self._write("remove_ingredient_items_for_recipes", recipe_ids)
+
+    def edit_ingredient_items_ownership(
+        self, ingredient_items: list[CookidooIngredientItem]
+    ) -> CookidooMirrorWrite:
+        """Edit ownership ingredient items."""
+        return self._write("edit_ingredient_items_ownership", ingredient_items)
+
+    def add_additional_items(
+        self, additional_item_names: list[str]
+    ) -> CookidooMirrorWrite:
+        """Create additional items, with local ids until they are sent."""
+        write = CookidooMirrorWrite(
+            "add_additional_items",
+            list(additional_item_names),
+            local_ids=[
+                f"{_LOCAL_ID_PREFIX}{next(self._local_ids)}"
+                for _ in additional_item_names
+            ],
+        )
+        return self._enqueue(write)
+
+    def edit_additional_items(
+        self, additional_items: list[CookidooAdditionalItem]
+    ) -> CookidooMirrorWrite:
+        """Edit additional items."""
+        return self._write("edit_additional_items", additional_items)
+
+    def edit_additional_items_ownership(
+        self, additional_items: list[CookidooAdditionalItem]
+    ) -> CookidooMirrorWrite:
+        """Edit ownership additional items."""
+        return self._write("edit_additional_items_ownership", additional_items)
+
+    def remove_additional_items(
+        self, additional_item_ids: list[str]
+    ) -> CookidooMirrorWrite:
+        """Remove additional items."""
+        return self._write("remove_additional_items", additional_item_ids)
+
+    def _write(self, action: str, values: list[Any]) -> CookidooMirrorWrite:
+        return self._enqueue(CookidooMirrorWrite(action, [_plain(v) for v in values]))
+
+    def _enqueue(self, write: CookidooMirrorWrite) -> CookidooMirrorWrite:
+        self._apply(write)
+        self._queue.append(write)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._run())
+        return write
+
+    async def flush(self) -> None:
+        """Wait until the pending writes are sent and the shopping list reconciled.
+
+        The errors of the writes are reported in `failures`, not raised here.
+        """
+        while self._worker is not None and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    def _id(self, id: str) -> str:
+        """Get the id of an item, once created if it is a local id."""
+        return self._ids.get(id, id)
+
+    def _apply(self, write: CookidooMirrorWrite) -> None:
+        """Apply a write to the copy of the shopping list."""
+        state = self._state
+        match write.action:
+            case "remove_ingredient_items_for_recipes":
+                for recipe_id in write.values:
+                    if (recipe := state.recipes.pop(recipe_id, None)) is not None:
+                        for ingredient in recipe["ingredients"]:
+                            state.ingredient_items.pop(ingredient["id"], None)
+            case "edit_ingredient_items_ownership":
+                self._update_ingredient_items(
+                    CookidooIngredientItem(
+                        id=current["id"],
+                        name=current["name"],
+                        is_owned=item["is_owned"],
+                        description=current["description"],
+                    )
+                    for item in write.values
+                    if (current := state.ingredient_items.get(item["id"])) is not None
+                )
+            case "add_additional_items":
+                for id, name in zip(write.local_ids, write.values, strict=True):
+                    if id not in self._ids:
+                        state.additional_items[id] = CookidooAdditionalItem(
+                            id=id, name=name, is_owned=False
+                        )
+            case "edit_additional_items":
+                for item in write.values:
+                    id = self._id(item["id"])
+                    if (existing := state.additional_items.get(id)) is not None:
+                        state.additional_items[id] = CookidooAdditionalItem(
+                            id=id, name=item["name"], is_owned=existing["is_owned"]
+                        )
+            case "edit_additional_items_ownership":
+                for item in write.values:
+                    id = self._id(item["id"])
+                    if (existing := state.additional_items.get(id)) is not None:
+                        state.additional_items[id] = CookidooAdditionalItem(
+                            id=id, name=existing["name"], is_owned=item["is_owned"]
+                        )
+            case "remove_additional_items":
+                for id in write.values:
+                    state.additional_items.pop(self._id(id), None)
+
+    def _update_ingredient_items(self, items: Iterable[CookidooIngredientItem]) -> None:
+        """Replace ingredient items, also in the ingredients of their recipes."""
+        updated = {item["id"]: item for item in items}
+        self._state.ingredient_items.update(updated)
+        for recipe in self._state.recipes.values():
+            for ingredient in recipe["ingredients"]:
+                if (item := updated.get(ingredient["id"])) is not None:
+                    # the ingredients of the recipes are the items of the list
+                    cast(CookidooIngredientItem, ingredient)["is_owned"] = item[
+                        "is_owned"
+                    ]
+
+    async def _send(self, write: CookidooMirrorWrite) -> None:
+        """Send a write and apply the returned items to the copy."""
+        cookidoo = self.cookidoo
+        if write.action == "add_additional_items":
+            created = _plain(await cookidoo.add_additional_items(write.values))
+            # the copy may have been loaded again while waiting, and the items
+            # removed by the writes queued since are not in it anymore
+            additional_items = self._state.additional_items
+            for id, item in zip(write.local_ids, created, strict=False):
+                self._ids[id] = item["id"]
+                if additional_items.pop(id, None) is not None:
+                    additional_items[item["id"]] = item
+            return
+
+        # the items of local ids which could not be created are dropped
+        values = [
+            {**value, "id": self._id(value["id"])}
+            if isinstance(value, dict)
+            else self._id(value)
+            for value in write.values
+        ]
+        values = [
+            value
+            for value in values
+            if not (value["id"] if isinstance(value, dict) else value).startswith(
+                _LOCAL_ID_PREFIX
+            )
+        ]
+        if not values:
+            return
+        result = _plain(await getattr(cookidoo, write.action)(values))
+        state = self._state
+        # the edited items removed by the writes queued since are not kept
+        match write.action:
+            case "add_ingredient_items_for_recipes":
+                self._stale = True  # the recipes are only known by loading the list
+                self._update_ingredient_items(result)
+            case "edit_ingredient_items_ownership":
+                self._update_ingredient_items(
+                    item for item in result if item["id"] in state.ingredient_items
+                )
+            case "edit_additional_items" | "edit_additional_items_ownership":
+                state.additional_items.update(
+                    (item["id"], item)
+                    for item in result
+                    if item["id"] in state.additional_items
+                )
+            case "remove_additional_items":
+                for id in cast(list[str], values):
+                    state.additional_items.pop(id, None)
+
+    async def _run(self) -> None:
+        """Send the writes in order, then reconcile the copy if needed."""
+        while self._queue:
+            write = self._queue[0]
+            try:
+                await self._send(write)
+            except Exception as e:
+                _LOGGER.debug(
+                    "Mirror write %s failed: %s",
+                    write.action,
+                    e,
+                    exc_info=not isinstance(e, CookidooException),
+                )
+                write.status, write.error = "failed", e
+                self._failures.append(write)
+                self._failed += 1
+                self._stale = True
+            else:
+                write.status = "flushed"
+                self._flushed += 1
+            finally:
+                self._queue.popleft()
+
+            if not self._queue and self._stale:
+                try:
+                    await self.load()
+                except Exception as e:
+                    _LOGGER.debug(
+                        "Mirror reconciliation failed: %s",
+                        e,
+                        exc_info=not isinstance(e, CookidooException),
+                    )
+                    return
+                self._stale = False
+                self._reconciliations += 1
@@ -0,0 +1,211 @@
+"""Cookidoo API slotted models."""
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
+from functools import cache
+from types import NoneType
+from typing import Any, ClassVar, Self, cast, get_args
+
+
+@cache
+def _optional_fields(model: type) -> frozenset[str]:
+    """Get the names of the fields of a model which can be None, and so missing."""
+    return frozenset(
+        field.name for field in fields(model) if NoneType in get_args(field.type)
+    )
+
+
+class CookidooModel(Mapping[str, Any]):
+    """Base of the slotted models, read-only mappings with the keys of the dicts.
+
+    The models take a fraction of the memory of the dicts they replace, and
+    being immutable, they can be shared without copies. Lists are stored as
+    tuples, `to_dict` or `copy` converts a model back to the dicts and lists.
+    """
+
+    __slots__ = ()
+    # the fields holding lists of models
+    _nested: ClassVar[Mapping[str, type["CookidooModel"]]] = {}
+
+    @classmethod
+    def _fields(cls) -> tuple[str, ...]:
+        """Get the field names, which are the slots of the dataclass."""
+        return cast(tuple[str, ...], cls.__slots__)
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> Self:
+        """Create a model from its dict, the optional fields being None if missing."""
+        optional = _optional_fields(cls)
+        return cls(
+            **{
+                key: tuple(cls._nested[key].from_dict(item) for item in value[key])
+                if key in cls._nested
+                else tuple(value[key])
+                if isinstance(value.get(key), list)
+                else value.get(key)
+                if key in optional
+                else value[key]
+                for key in cls._fields()
+            }
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the model to its dict."""
+        return {
+            key: [
+                item.to_dict() if isinstance(item, CookidooModel) else item
+                for item in value
+            ]
+            if isinstance(value, tuple)
+            else value
+            for key, value in zip(self._fields(), self.values(), strict=True)
+        }
+
+    def copy(self) -> dict[str, Any]:
+        """Copy the model to a dict which can be modified, like `dict.copy`.
+
+        Unlike `dict.copy`, the nested models and tuples are copied too.
+        """
+        return self.to_dict()
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value of a field."""
+        if key not in self._fields():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names."""
+        return iter(self._fields())
+
+    def __len__(self) -> int:
+        """Get the number of fields."""
+        return len(self._fields())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another model or a dict."""
+        if isinstance(other, CookidooModel):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooUserInfoModel(CookidooModel):
+    """Slotted `CookidooUserInfo`."""
+
+    username: str
+    description: str | None
+    picture: str | None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooSubscriptionModel(CookidooModel):
+    """Slotted `CookidooSubscription`."""
+
+    active: bool
+    expires: str
+    startDate: str  # noqa: N815
+    status: str
+    subscriptionLevel: str  # noqa: N815
+    subscriptionSource: str  # noqa: N815
+    type: str
+    extendedType: str  # noqa: N815
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooIngredientModel(CookidooModel):
+    """Slotted `CookidooIngredient`."""
+
+    id: str
+    name: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooIngredientItemModel(CookidooModel):
+    """Slotted `CookidooIngredientItem`."""
+
+    id: str
+    name: str
+    is_owned: bool
+    description: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooAdditionalItemModel(CookidooModel):
+    """Slotted `CookidooAdditionalItem`."""
+
+    id: str
+    name: str
+    is_owned: bool
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooRecipeModel(CookidooModel):
+    """Slotted `CookidooRecipe`."""
+
+    _nested = {"ingredients": CookidooIngredientModel}
+
+    id: str
+    name: str
+    ingredients: tuple[CookidooIngredientModel, ...]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooCategoryModel(CookidooModel):
+    """Slotted `CookidooCategory`."""
+
+    id: str
+    name: str
+    notes: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooCollectionModel(CookidooModel):
+    """Slotted `CookidooCollection`."""
+
+    id: str
+    name: str
+    total_recipes: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooRecipeDetailsModel(CookidooModel):
+    """Slotted `CookidooRecipeDetails`."""
+
+    _nested = {
+        "ingredients": CookidooIngredientModel,
+        "categories": CookidooCategoryModel,
+        "collections": CookidooCollectionModel,
+    }
+
+    id: str
+    name: str
+    ingredients: tuple[CookidooIngredientModel, ...]
+    difficulty: str
+    notes: tuple[str, ...]
+    categories: tuple[CookidooCategoryModel, ...]
+    collections: tuple[CookidooCollectionModel, ...]
+    utensils: tuple[str, ...]
+    serving_size: str
+    active_time: int
+    total_time: int
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CookidooShoppingListModel(CookidooModel):
+    """Slotted `CookidooShoppingList`."""
+
+    _nested = {
+        "recipes": CookidooRecipeModel,
+        "ingredient_items": CookidooIngredientItemModel,
+        "additional_items": CookidooAdditionalItemModel,
+    }
+
+    recipes: tuple[CookidooRecipeModel, ...]
+    ingredient_items: tuple[CookidooIngredientItemModel, ...]
+    additional_items: tuple[CookidooAdditionalItemModel, ...]
@@ -0,0 +1,265 @@
+"""Cookidoo API multi-account client pool."""
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from aiohttp import ClientSession
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.types import CookidooConfig, CookidooPoolStats
+
+
+@dataclass(slots=True, eq=False)
+class _Account:
+    name: str
+    max_concurrency: int
+    active: int = 0
+    requests: int = 0
+    wait_time: float = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+    # set while the account has no request holding or waiting for a slot
+    idle: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def __post_init__(self) -> None:
+        self.idle.set()
+
+    def update_idle(self) -> None:
+        if self.active or self.waiters:
+            self.idle.clear()
+        else:
+            self.idle.set()
+
+
+class _Slot:
+    """Concurrency slot of the requests of an account, entered per request."""
+
+    __slots__ = ("_account", "_pool")
+
+    def __init__(self, pool: "CookidooPool", account: _Account) -> None:
+        self._pool = pool
+        self._account = account
+
+    async def __aenter__(self) -> None:
+        await self._pool._acquire(self._account)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._pool._release(self._account)
+
+
+class CookidooPool:
+    """Pool of clients of many accounts, sharing one session.
+
+    Each account has its own config and auth state. The requests of all the
+    accounts share a global number of slots, and each account a number of its
+    own. When the slots are taken, the waiting accounts are served in turn,
+    one request each, so that an account with many requests cannot starve
+    the others.
+    """
+
+    _accounts: dict[str, tuple[Cookidoo, _Account]]
+
+    def __init__(
+        self,
+        session: ClientSession,
+        max_concurrency: int = 10,
+        max_concurrency_per_account: int = 2,
+        **kwargs: Any,
+    ) -> None:
+        """Init function for the client pool.
+
+        Parameters
+        ----------
+        session
+            The client session shared by the accounts
+        max_concurrency
+            The maximum number of requests in flight for all the accounts
+        max_concurrency_per_account
+            The default maximum number of requests in flight for one account
+        kwargs
+            The default options of the clients, see `Cookidoo`
+
+        Raises
+        ------
+        CookidooConfigException
+            If a concurrency is not positive.
+
+        """
+        if max_concurrency < 1 or max_concurrency_per_account < 1:
+            raise CookidooConfigException("The concurrency must be at least 1")
+        self.session = session
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_account = max_concurrency_per_account
+        self._options = kwargs
+        self._accounts = {}
+        # the accounts with waiting requests, in the order they are served
+        self._turns: deque[_Account] = deque()
+        self._active = 0
+
+    def add(
+        self,
+        name: str,
+        cfg: CookidooConfig,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> Cookidoo:
+        """Add an account.
+
+        Parameters
+        ----------
+        name
+            The name of the account in the pool
+        cfg
+            The config of the account
+        max_concurrency
+            The maximum number of requests in flight for the account,
+            if omitted the default of the pool
+        kwargs
+            The options of the client, over the default ones of the pool
+
+        Returns
+        -------
+        Cookidoo
+            The client of the account.
+
+        Raises
+        ------
+        CookidooConfigException
+            If the name is taken or the concurrency not positive.
+
+        """
+        if name in self._accounts:
+            raise CookidooConfigException(f"The account {name} is already in the pool")
+        if max_concurrency is None:
+            max_concurrency = self.max_concurrency_per_account
+        if max_concurrency < 1:
+            raise CookidooConfigException("The concurrency must be at least 1")
+        account = _Account(name, max_concurrency)
+        cookidoo = Cookidoo(
+            self.session,
+            cfg,
+            **{**self._options, **kwargs},
+            slot=_Slot(self, account),
+        )
+        self._accounts[name] = (cookidoo, account)
+        return cookidoo
+
+    async def remove(self, name: str) -> None:
+        """Remove an account, once its requests are done.
+
+        The requests holding or waiting for a slot of the account are awaited,
+        as well as the requests shared with the client.
+
+        Raises
+        ------
+        KeyError
+            If the account is not in the pool.
+
+        """
+        cookidoo, account = self._accounts.pop(name)
+        await account.idle.wait()
+        await cookidoo.close()
+
+    def __getitem__(self, name: str) -> Cookidoo:
+        """Get the client of an account."""
+        return self._accounts[name][0]
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether an account is in the pool."""
+        return name in self._accounts
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the account names."""
+        return iter(self._accounts)
+
+    def __len__(self) -> int:
+        """Get the number of accounts."""
+        return len(self._accounts)
+
+    def stats(self, name: str | None = None) -> CookidooPoolStats:
+        """Pool statistics, of all the accounts or of one.
+
+        Raises
+        ------
+        KeyError
+            If the account is not in the pool.
+
+        """
+        accounts = (
+            [self._accounts[name][1]]
+            if name is not None
+            else [account for _, account in self._accounts.values()]
+        )
+        return CookidooPoolStats(
+            accounts=len(accounts),
+            active=sum(account.active for account in accounts),
+            waiting=sum(len(account.waiters) for account in accounts),
+            requests=sum(account.requests for account in accounts),
+            wait_time=sum(account.wait_time for account in accounts),
+        )
+
+    async def close(self) -> None:
+        """Wait for the requests in flight of all the accounts."""
+        await asyncio.gather(
+            *(cookidoo.close() for cookidoo, _ in self._accounts.values())
+        )
+
+    def _grant(self, account: _Account) -> None:
+        self._active += 1
+        account.active += 1
+        account.requests += 1
+        account.idle.clear()
+
+    async def _acquire(self, account: _Account) -> None:
+        """Wait for a slot of an account."""
+        if (
+            not account.waiters
+            and account.active < account.max_concurrency
+            and self._active < self.max_concurrency
+        ):
+            # a free global slot means no other account can be waiting for it
+            self._grant(account)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        account.waiters.append(waiter)
+        account.idle.clear()
+        if account not in self._turns:
+            self._turns.append(account)
+        start = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(account)  # granted meanwhile
+            else:
+                account.waiters.remove(waiter)
+                account.update_idle()
+            raise
+        finally:
+            account.wait_time += time.monotonic() - start
+
+    def _release(self, account: _Account) -> None:
+        """Free a slot of an account, granting it to the next account in turn."""
+        self._active -= 1
+        account.active -= 1
+        account.update_idle()
+        while self._active < self.max_concurrency and self._turns:
+            for _ in range(len(self._turns)):
+                candidate = self._turns.popleft()
+                if not candidate.waiters:
+                    continue
+                if candidate.active >= candidate.max_concurrency:
+                    self._turns.append(candidate)
+                    continue
+                self._grant(candidate)
+                candidate.waiters.popleft().set_result(None)
+                if candidate.waiters:
+                    self._turns.append(candidate)
+                break
+            else:
+                return
@@ -0,0 +1,107 @@
+"""Cookidoo API rate limiters."""
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from cookidoo_api.exceptions import CookidooConfigException
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+
+@dataclass(slots=True)
+class _Bucket:
+    rate: float
+    burst: float
+    tokens: float
+    updated_at: float
+
+
+class CookidooRateLimiter:
+    """Per host token bucket rate limiter, which can be shared between instances.
+
+    Each host, like the token host and the api host of each country, has its
+    own bucket. A request takes a token, and waits for it if the bucket is empty,
+    so that bursts are smoothed to the rate of the bucket.
+    """
+
+    _buckets: dict[str, _Bucket]
+    _shared: "WeakKeyDictionary[ClientSession, CookidooRateLimiter]" = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: float = 10,
+        hosts: Mapping[str, tuple[float, float]] | None = None,
+    ) -> None:
+        """Init function for the rate limiter.
+
+        Parameters
+        ----------
+        rate
+            The number of requests per second to each host
+        burst
+            The number of requests to each host which can be sent at once
+        hosts
+            The rate and burst of the hosts with other limits
+
+        Raises
+        ------
+        CookidooConfigException
+            If a rate or burst is not positive.
+
+        """
+        self.rate = rate
+        self.burst = burst
+        self.hosts = dict(hosts or {})
+        if any(r <= 0 or b < 1 for r, b in [(rate, burst), *self.hosts.values()]):
+            raise CookidooConfigException(
+                "The rate must be positive and the burst at least 1"
+            )
+        self._buckets = {}
+
+    @classmethod
+    def for_session(cls, session: "ClientSession") -> "CookidooRateLimiter":
+        """Get the rate limiter shared by all instances using a session.
+
+        The limiter is created with the default limits on first use.
+        """
+        if (limiter := cls._shared.get(session)) is None:
+            limiter = cls._shared[session] = cls()
+        return limiter
+
+    def _bucket(self, host: str) -> _Bucket:
+        if (bucket := self._buckets.get(host)) is None:
+            rate, burst = self.hosts.get(host, (self.rate, self.burst))
+            bucket = self._buckets[host] = _Bucket(rate, burst, burst, time.monotonic())
+        return bucket
+
+    def reserve(self, host: str) -> float:
+        """Take a token of a host.
+
+        Returns
+        -------
+        float
+            The time in seconds to wait before the token is available.
+
+        """
+        bucket = self._bucket(host)
+        now = time.monotonic()
+        bucket.tokens = min(
+            bucket.burst, bucket.tokens + (now - bucket.updated_at) * bucket.rate
+        )
+        bucket.updated_at = now
+        # the balance may go negative, so that the waiters are served in order
+        bucket.tokens -= 1
+        return max(0.0, -bucket.tokens / bucket.rate)
+
+    async def acquire(self, host: str) -> None:
+        """Take a token of a host, waiting until it is available."""
+        if delay := self.reserve(host):
+            await asyncio.sleep(delay)
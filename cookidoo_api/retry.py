@@ -0,0 +1,163 @@
+"""Cookidoo API retry policies and circuit breakers."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+import random
+import time
+
+from cookidoo_api.exceptions import CookidooUnavailableException
+
+
+@dataclass(frozen=True, slots=True)
+class CookidooRetryPolicy:
+    """Cookidoo retry policy type.
+
+    Attributes
+    ----------
+    attempts
+        The maximum number of attempts of a request, including the first one
+    backoff
+        The delay in seconds before the first retry, doubled for each next one
+    max_backoff
+        The maximum delay in seconds before a retry, a longer `Retry-After`
+        is not waited for and fails the request
+    jitter
+        Wait a random delay between zero and the backoff, so that failed
+        clients do not retry in lockstep
+    timeout
+        The timeout in seconds of each attempt, if omitted the one of the session
+    methods
+        The http methods which are safe to retry
+    statuses
+        The status codes of the responses which are retried
+
+    """
+
+    attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    timeout: float | None = None
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        }
+    )
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Get the delay before retrying a failed attempt.
+
+        Parameters
+        ----------
+        attempt
+            The number of the failed attempt, starting at 1
+        retry_after
+            The `Retry-After` header of the response, if any
+
+        Returns
+        -------
+        float | None
+            The delay in seconds, or `None` if the request must not be retried.
+
+        """
+        if attempt >= self.attempts:
+            return None
+        if (
+            retry_after is not None
+            and (delay := _parse_retry_after(retry_after)) is not None
+        ):
+            return delay if delay <= self.max_backoff else None
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a `Retry-After` header, given in seconds or as an http date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=UTC)
+    return max(0.0, (date - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(slots=True)
+class _Circuit:
+    failures: int = 0
+    opened_at: float | None = None
+
+
+class CookidooCircuitBreaker:
+    """Per host circuit breaker, which can be shared between instances.
+
+    After `failure_threshold` consecutive failures of a host, its circuit opens
+    and requests to it fail fast. Once `recovery_time` has passed, a single
+    request is let through to probe the host, closing the circuit on success
+    and opening it again on failure. Until then, the other requests still
+    fail fast.
+    """
+
+    _circuits: dict[str, _Circuit]
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30) -> None:
+        """Init function for the circuit breaker.
+
+        Parameters
+        ----------
+        failure_threshold
+            The number of consecutive failures which opens the circuit of a host
+        recovery_time
+            The time in seconds after which an open circuit lets a request through
+
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._circuits = {}
+
+    def is_open(self, host: str) -> bool:
+        """Check whether the circuit of a host is open."""
+        circuit = self._circuits.get(host)
+        return circuit is not None and circuit.opened_at is not None
+
+    def before_request(self, host: str) -> None:
+        """Check that a request to a host may be sent.
+
+        Raises
+        ------
+        CookidooUnavailableException
+            If the circuit of the host is open.
+
+        """
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.opened_at is None:
+            return
+        now = time.monotonic()
+        if now - circuit.opened_at < self.recovery_time:
+            raise CookidooUnavailableException(
+                f"Requests to {host} are suspended after repeated failures."
+            )
+        # let this request probe the host, the others keep failing fast
+        circuit.opened_at = now
+
+    def record_success(self, host: str) -> None:
+        """Close the circuit of a host after a successful request."""
+        self._circuits.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        """Count a failed request to a host, opening its circuit if needed."""
+        circuit = self._circuits.setdefault(host, _Circuit())
+        circuit.failures += 1
+        if circuit.opened_at is not None or circuit.failures >= self.failure_threshold:
+            circuit.opened_at = time.monotonic()
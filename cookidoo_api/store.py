@@ -0,0 +1,132 @@
+"""Cookidoo API persistent stores."""
+
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import sqlite3
+import threading
+
+_RECIPES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipes (
+    language TEXT NOT NULL,
+    id TEXT NOT NULL,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    PRIMARY KEY (language, id)
+)
+"""
+
+
+@dataclass(slots=True)
+class CookidooStoredRecipe:
+    """Cookidoo stored recipe type.
+
+    Attributes
+    ----------
+    body
+        The raw json of the recipe details as received from the API
+    fetched_at
+        The unix timestamp of the last download or revalidation
+    etag
+        The `ETag` validator of the response, if any
+    last_modified
+        The `Last-Modified` validator of the response, if any
+
+    """
+
+    body: bytes
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class CookidooRecipeStore:
+    """SQLite store of raw recipe details, shareable between processes.
+
+    The database runs in WAL mode, so that several processes can read while
+    one of them writes. The blocking database calls run in the default
+    executor of the event loop.
+    """
+
+    def __init__(self, path: str, timeout: float = 30) -> None:
+        """Init function for the recipe store.
+
+        Parameters
+        ----------
+        path
+            The path of the SQLite database file, created if missing
+        timeout
+            The time in seconds to wait for a lock held by another process
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_RECIPES_SCHEMA)
+
+    async def _run[T](self, func: Callable[[], T]) -> T:
+        """Run a database call in the executor."""
+
+        def locked() -> T:
+            with self._lock:
+                return func()
+
+        return await asyncio.get_running_loop().run_in_executor(None, locked)
+
+    async def get(self, key: tuple[str, str]) -> CookidooStoredRecipe | None:
+        """Get a recipe by its language and id."""
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(
+        self, keys: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], CookidooStoredRecipe]:
+        """Get the stored recipes of several languages and ids."""
+        keys = list(keys)
+
+        def select() -> dict[tuple[str, str], CookidooStoredRecipe]:
+            recipes = {}
+            for language, id in keys:
+                if row := self._connection.execute(
+                    "SELECT body, fetched_at, etag, last_modified FROM recipes "
+                    "WHERE language = ? AND id = ?",
+                    (language, id),
+                ).fetchone():
+                    recipes[(language, id)] = CookidooStoredRecipe(*row)
+            return recipes
+
+        return await self._run(select)
+
+    async def put(self, key: tuple[str, str], recipe: CookidooStoredRecipe) -> None:
+        """Add or replace a recipe."""
+        await self._run(
+            lambda: self._connection.execute(
+                "INSERT OR REPLACE INTO recipes VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    recipe.body,
+                    recipe.fetched_at,
+                    recipe.etag,
+                    recipe.last_modified,
+                ),
+            )
+        )
+
+    async def touch(self, key: tuple[str, str], fetched_at: float) -> None:
+        """Update the fetch timestamp of a revalidated recipe."""
+        await self._run(
+            lambda: self._connection.execute(
+                "UPDATE recipes SET fetched_at = ? WHERE language = ? AND id = ?",
+                (fetched_at, *key),
+            )
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
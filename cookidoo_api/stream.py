@@ -0,0 +1,118 @@
+"""Cookidoo API incremental json parsing."""
+
+from codecs import getincrementaldecoder
+from collections.abc import AsyncIterable, AsyncIterator
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Buffer of a json document received in chunks, dropping the parsed part."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = aiter(chunks)
+        self._decoder = getincrementaldecoder("utf-8")()
+        self._eof = False
+        self.buffer = ""
+        self.pos = 0
+
+    async def _fill(self) -> None:
+        """Append the next chunk to the buffer.
+
+        Raises
+        ------
+        ValueError
+            If the document is incomplete.
+
+        """
+        if self._eof:
+            raise ValueError("Unexpected end of the json document")
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            self._eof = True
+            chunk = b""
+        self.buffer = self.buffer[self.pos :] + self._decoder.decode(chunk, self._eof)
+        self.pos = 0
+
+    async def peek(self) -> str:
+        """Get the next character after whitespace, without consuming it."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            await self._fill()
+
+    async def expect(self, *chars: str) -> str:
+        """Consume the next character after whitespace, which must be one of `chars`."""
+        if (char := await self.peek()) not in chars:
+            raise ValueError(
+                f"Expected {' or '.join(chars)} but got {char} in the json document"
+            )
+        self.pos += 1
+        return char
+
+    async def value(self) -> Any:
+        """Decode the next json value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # a number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self._eof:
+                    self.pos = end
+                    return value
+            await self._fill()
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """Decode the elements of an array in a json object received in chunks.
+
+    Only one element is held in memory at a time, the other values of the
+    object are decoded and dropped. The parsing stops after the array.
+
+    Parameters
+    ----------
+    chunks
+        The chunks of the json document, an object
+    key
+        The key of the array in the object
+
+    Yields
+    ------
+    Any
+        The decoded elements of the array.
+
+    Raises
+    ------
+    ValueError
+        If the document is invalid or incomplete.
+
+    """
+    reader = _Reader(chunks)
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        return
+    while True:
+        name = await reader.value()
+        await reader.expect(":")
+        if name != key:
+            await reader.value()
+        else:
+            await reader.expect("[")
+            if await reader.peek() == "]":
+                return
+            while True:
+                yield await reader.value()
+                if await reader.expect(",", "]") == "]":
+                    return
+        if await reader.expect(",", "}") == "}":
+            return
@@ -0,0 +1,301 @@
+"""Cookidoo API shopping list synchronization."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from cookidoo_api.types import (
+    CookidooAdditionalItem,
+    CookidooIngredientItem,
+    CookidooShoppingList,
+    CookidooShoppingListState,
+)
+
+if TYPE_CHECKING:
+    from cookidoo_api.cookidoo import Cookidoo
+
+
+@dataclass(slots=True)
+class CookidooShoppingListPlan:
+    """Cookidoo shopping list changes, batched by endpoint.
+
+    Attributes
+    ----------
+    add_recipe_ids
+        The ids of the recipes to add
+    remove_recipe_ids
+        The ids of the recipes to remove
+    add_additional_items
+        The `is_owned` value of the additional items to create, by name,
+        set after their creation
+    rename_additional_items
+        The additional items to rename, with their new name
+    remove_additional_item_ids
+        The ids of the additional items to remove
+    additional_items_ownership
+        The additional items to change the `is_owned` value for
+    ingredient_items_ownership
+        The ingredient items to change the `is_owned` value for
+    added_ingredient_items_ownership
+        The `is_owned` value of ingredient items not on the shopping list yet,
+        by id, set if they are added with the recipes
+
+    """
+
+    add_recipe_ids: list[str] = field(default_factory=list)
+    remove_recipe_ids: list[str] = field(default_factory=list)
+    add_additional_items: dict[str, bool] = field(default_factory=dict)
+    rename_additional_items: list[CookidooAdditionalItem] = field(default_factory=list)
+    remove_additional_item_ids: list[str] = field(default_factory=list)
+    additional_items_ownership: list[CookidooAdditionalItem] = field(
+        default_factory=list
+    )
+    ingredient_items_ownership: list[CookidooIngredientItem] = field(
+        default_factory=list
+    )
+    added_ingredient_items_ownership: dict[str, bool] = field(default_factory=dict)
+
+    @property
+    def calls(self) -> int:
+        """The maximum number of requests, one per endpoint at most."""
+        return sum(
+            map(
+                bool,
+                (
+                    self.add_recipe_ids,
+                    self.remove_recipe_ids,
+                    self.add_additional_items,
+                    self.rename_additional_items,
+                    self.remove_additional_item_ids,
+                    self.additional_items_ownership
+                    or any(self.add_additional_items.values()),
+                    self.ingredient_items_ownership
+                    or (self.add_recipe_ids and self.added_ingredient_items_ownership),
+                ),
+            )
+        )
+
+
+def _additional_item(
+    item: CookidooAdditionalItem, name: str, is_owned: bool
+) -> CookidooAdditionalItem:
+    return CookidooAdditionalItem(id=item["id"], name=name, is_owned=is_owned)
+
+
+def _ingredient_item(
+    item: CookidooIngredientItem, is_owned: bool
+) -> CookidooIngredientItem:
+    return CookidooIngredientItem(
+        id=item["id"],
+        name=item["name"],
+        is_owned=is_owned,
+        description=item["description"],
+    )
+
+
+async def _call[T, R](
+    method: Callable[[list[T]], Awaitable[R]], items: list[T]
+) -> R | None:
+    """Call a batch method, unless there is nothing to send."""
+    return await method(items) if items else None
+
+
+class CookidooShoppingListSync:
+    """Synchronization of a shopping list with a desired state.
+
+    The changes are computed against one snapshot of the shopping list and
+    sent with at most one request per endpoint. Additional items which are not
+    wanted anymore are renamed to the new names before being removed, so that
+    replacing an item takes one request instead of two.
+    """
+
+    def __init__(self, cookidoo: "Cookidoo") -> None:
+        """Init function for the shopping list synchronization.
+
+        Parameters
+        ----------
+        cookidoo
+            The client of the shopping list
+
+        """
+        self.cookidoo = cookidoo
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def plan(
+        current: CookidooShoppingList, desired: CookidooShoppingListState
+    ) -> CookidooShoppingListPlan:
+        """Compute the changes from the current to the desired shopping list.
+
+        Parameters
+        ----------
+        current
+            The snapshot of the shopping list
+        desired
+            The desired state of the shopping list
+
+        Returns
+        -------
+        CookidooShoppingListPlan
+            The changes to send.
+
+        """
+        plan = CookidooShoppingListPlan()
+
+        if (recipe_ids := desired.get("recipe_ids")) is not None:
+            current_ids = {recipe["id"] for recipe in current["recipes"]}
+            plan.add_recipe_ids = list(
+                dict.fromkeys(id for id in recipe_ids if id not in current_ids)
+            )
+            plan.remove_recipe_ids = list(current_ids.difference(recipe_ids))
+
+        if (additional_items := desired.get("additional_items")) is not None:
+            remaining = dict(additional_items)
+            unmatched: list[CookidooAdditionalItem] = []
+            for item in current["additional_items"]:
+                if item["name"] not in remaining:
+                    unmatched.append(item)
+                elif (is_owned := remaining.pop(item["name"])) != item["is_owned"]:
+                    plan.additional_items_ownership.append(
+                        _additional_item(item, item["name"], is_owned)
+                    )
+            # rename the unwanted items, preferring names with the same ownership
+            names = {
+                owned: deque(
+                    name for name, value in remaining.items() if value is owned
+                )
+                for owned in (False, True)
+            }
+            leftover: list[CookidooAdditionalItem] = []
+            for item in unmatched:
+                if same := names[item["is_owned"]]:
+                    plan.rename_additional_items.append(
+                        _additional_item(item, same.popleft(), item["is_owned"])
+                    )
+                else:
+                    leftover.append(item)
+            for item in leftover:
+                if other := names[not item["is_owned"]]:
+                    renamed = _additional_item(
+                        item, other.popleft(), not item["is_owned"]
+                    )
+                    plan.rename_additional_items.append(renamed)
+                    plan.additional_items_ownership.append(renamed)
+                else:
+                    plan.remove_additional_item_ids.append(item["id"])
+            plan.add_additional_items = {
+                name: is_owned
+                for name, is_owned in remaining.items()
+                if name in names[is_owned]
+            }
+
+        if ownership := desired.get("ingredient_items_ownership"):
+            removed = set(plan.remove_recipe_ids)
+            gone = {
+                ingredient["id"]
+                for recipe in current["recipes"]
+                if recipe["id"] in removed
+                for ingredient in recipe["ingredients"]
+            }
+            items = {item["id"]: item for item in current["ingredient_items"]}
+            for id, is_owned in ownership.items():
+                if id in gone:
+                    continue
+                if (ingredient_item := items.get(id)) is None:
+                    plan.added_ingredient_items_ownership[id] = is_owned
+                elif ingredient_item["is_owned"] != is_owned:
+                    plan.ingredient_items_ownership.append(
+                        _ingredient_item(ingredient_item, is_owned)
+                    )
+
+        return plan
+
+    async def apply(self, plan: CookidooShoppingListPlan) -> None:
+        """Send the changes of a plan.
+
+        The additions, renames and removals are sent concurrently, then the
+        ownership changes, including the ones of the added items.
+
+        Parameters
+        ----------
+        plan
+            The changes to send
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails, the changes of the other requests may be applied.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        cookidoo = self.cookidoo
+        added_ingredient_items, added_additional_items, *_ = await asyncio.gather(
+            _call(cookidoo.add_ingredient_items_for_recipes, plan.add_recipe_ids),
+            _call(cookidoo.add_additional_items, list(plan.add_additional_items)),
+            _call(cookidoo.remove_ingredient_items_for_recipes, plan.remove_recipe_ids),
+            _call(cookidoo.edit_additional_items, plan.rename_additional_items),
+            _call(cookidoo.remove_additional_items, plan.remove_additional_item_ids),
+        )
+
+        ingredient_items_ownership = [
+            *plan.ingredient_items_ownership,
+            *(
+                _ingredient_item(item, is_owned)
+                for item in added_ingredient_items or ()
+                if (is_owned := plan.added_ingredient_items_ownership.get(item["id"]))
+                is not None
+                and is_owned != item["is_owned"]
+            ),
+        ]
+        additional_items_ownership = [
+            *plan.additional_items_ownership,
+            *(
+                _additional_item(item, item["name"], True)
+                for item in added_additional_items or ()
+                if plan.add_additional_items.get(item["name"]) and not item["is_owned"]
+            ),
+        ]
+        await asyncio.gather(
+            _call(cookidoo.edit_ingredient_items_ownership, ingredient_items_ownership),
+            _call(cookidoo.edit_additional_items_ownership, additional_items_ownership),
+        )
+
+    async def sync(
+        self, desired: CookidooShoppingListState, max_age: float = 0
+    ) -> CookidooShoppingListPlan:
+        """Bring the shopping list to a desired state.
+
+        Concurrent synchronizations are sent one after the other.
+
+        Parameters
+        ----------
+        desired
+            The desired state of the shopping list
+        max_age
+            The age in seconds up to which the last snapshot of the shopping
+            list is compared instead of loading it again
+
+        Returns
+        -------
+        CookidooShoppingListPlan
+            The sent changes.
+
+        Raises
+        ------
+        CookidooAuthException
+            When the access token is not valid anymore
+        CookidooRequestException
+            If a request fails, the changes of the other requests may be applied.
+        CookidooParseException
+            If the parsing of a request response fails.
+
+        """
+        async with self._lock:
+            plan = self.plan(await self.cookidoo.get_shopping_list(max_age), desired)
+            await self.apply(plan)
+            return plan
@@ -0,0 +1,254 @@
+"""Cookidoo API token stores."""
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Any
+
+from cookidoo_api.types import CookidooAuthResponse
+
+try:
+    import fcntl
+except ImportError:  # not available on windows, only the process is locked
+    _FILE_LOCKS = False
+else:
+    _FILE_LOCKS = True
+
+_TOKENS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    account TEXT NOT NULL PRIMARY KEY,
+    auth_data TEXT NOT NULL,
+    expires_at INTEGER NOT NULL
+)
+"""
+
+
+@dataclass(slots=True)
+class CookidooStoredToken:
+    """Cookidoo stored token type.
+
+    Attributes
+    ----------
+    auth_data
+        The auth response of the last login or refresh
+    expires_at
+        The unix timestamp at which the access token expires
+
+    """
+
+    auth_data: CookidooAuthResponse
+    expires_at: int
+
+
+def _account_id(account: str) -> str:
+    """Get a file name safe id of an account."""
+    return hashlib.sha256(account.lower().encode()).hexdigest()[:32]
+
+
+async def _run_in_executor[T](func: Callable[[], T]) -> T:
+    return await asyncio.get_running_loop().run_in_executor(None, func)
+
+
+class CookidooTokenStore(ABC):
+    """Store of the tokens of accounts, shareable between processes.
+
+    The lock of an account is a file lock, so that only one process at a time
+    refreshes the token of the account, the others loading the new token.
+    """
+
+    def __init__(self, lock_directory: str, poll_interval: float = 0.05) -> None:
+        """Init function for the token store.
+
+        Parameters
+        ----------
+        lock_directory
+            The directory of the lock files of the accounts
+        poll_interval
+            The time in seconds between two attempts to take a lock
+            held by another process
+
+        """
+        self.lock_directory = lock_directory
+        self.poll_interval = poll_interval
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    @abstractmethod
+    async def load(self, account: str) -> CookidooStoredToken | None:
+        """Load the token of an account, if any."""
+
+    @abstractmethod
+    async def save(self, account: str, token: CookidooStoredToken) -> None:
+        """Save the token of an account."""
+
+    @asynccontextmanager
+    async def lock(self, account: str) -> AsyncIterator[None]:
+        """Hold the lock of an account, waiting for the other processes.
+
+        The lock is released if the process dies, so that it is never stale.
+        """
+        id = _account_id(account)
+        async with self._locks.setdefault(id, asyncio.Lock()):
+            if not _FILE_LOCKS:
+                yield
+                return
+            fd = os.open(
+                os.path.join(self.lock_directory, f"{id}.lock"),
+                os.O_RDWR | os.O_CREAT,
+                0o600,
+            )
+            try:
+                while True:
+                    try:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        await asyncio.sleep(self.poll_interval)
+                yield
+            finally:
+                # closing the file releases the lock
+                os.close(fd)
+
+
+class CookidooFileTokenStore(CookidooTokenStore):
+    """Store of the tokens in json files of a directory, one per account.
+
+    The files are only readable by the user, and replaced atomically.
+    """
+
+    def __init__(self, directory: str, poll_interval: float = 0.05) -> None:
+        """Init function for the file token store.
+
+        Parameters
+        ----------
+        directory
+            The directory of the token and lock files, created if missing
+        poll_interval
+            The time in seconds between two attempts to take a lock
+            held by another process
+
+        """
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        super().__init__(directory, poll_interval)
+        self.directory = directory
+
+    def _path(self, account: str) -> str:
+        return os.path.join(self.directory, f"{_account_id(account)}.json")
+
+    async def load(self, account: str) -> CookidooStoredToken | None:
+        """Load the token of an account, if any and readable."""
+
+        def read() -> CookidooStoredToken | None:
+            try:
+                with open(self._path(account), encoding="utf-8") as file:
+                    data = json.load(file)
+                return CookidooStoredToken(data["auth_data"], int(data["expires_at"]))
+            except FileNotFoundError:
+                return None
+            except (ValueError, KeyError, TypeError):
+                return None  # a corrupted file is replaced by the next save
+
+        return await _run_in_executor(read)
+
+    async def save(self, account: str, token: CookidooStoredToken) -> None:
+        """Save the token of an account."""
+
+        def write() -> None:
+            fd, path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(
+                        {"auth_data": token.auth_data, "expires_at": token.expires_at},
+                        file,
+                    )
+                os.replace(path, self._path(account))
+            except BaseException:
+                os.unlink(path)
+                raise
+
+        await _run_in_executor(write)
+
+
+class CookidooSQLiteTokenStore(CookidooTokenStore):
+    """SQLite store of the tokens, with the lock files next to the database.
+
+    The database runs in WAL mode, like the recipe store, and the blocking
+    database calls run in the default executor of the event loop. The accounts
+    are stored by the same ids as the file names of the file store, and the
+    database files are only readable by the user.
+    """
+
+    def __init__(
+        self, path: str, timeout: float = 30, poll_interval: float = 0.05
+    ) -> None:
+        """Init function for the SQLite token store.
+
+        Parameters
+        ----------
+        path
+            The path of the SQLite database file, created if missing
+        timeout
+            The time in seconds to wait for a database lock held by another process
+        poll_interval
+            The time in seconds between two attempts to take an account lock
+            held by another process
+
+        """
+        super().__init__(os.path.dirname(os.path.abspath(path)), poll_interval)
+        self.path = path
+        self._lock = threading.Lock()
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_TOKENS_SCHEMA)
+        for suffix in ("-wal", "-shm"):
+            with suppress(FileNotFoundError):
+                os.chmod(path + suffix, 0o600)
+
+    async def _run[T](self, func: Callable[[], T]) -> T:
+        """Run a database call in the executor."""
+
+        def locked() -> T:
+            with self._lock:
+                return func()
+
+        return await _run_in_executor(locked)
+
+    async def load(self, account: str) -> CookidooStoredToken | None:
+        """Load the token of an account, if any and readable."""
+        row: Any = await self._run(
+            lambda: self._connection.execute(
+                "SELECT auth_data, expires_at FROM tokens WHERE account = ?",
+                (_account_id(account),),
+            ).fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            return CookidooStoredToken(json.loads(row[0]), int(row[1]))
+        except (ValueError, KeyError, TypeError):
+            return None  # a corrupted row is replaced by the next save
+
+    async def save(self, account: str, token: CookidooStoredToken) -> None:
+        """Save the token of an account."""
+        await self._run(
+            lambda: self._connection.execute(
+                "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+                (_account_id(account), json.dumps(token.auth_data), token.expires_at),
+            )
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
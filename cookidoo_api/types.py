@@ -207,6 +207,95 @@ class CookidooRecipeDetails(CookidooRecipe):
     total_time: int
 
 
+class CookidooShoppingList(TypedDict):
+    """Cookidoo shopping list type.
+
+    Attributes
+    ----------
+    recipes
+        The recipes on the shopping list
+    ingredient_items
+        The ingredient items of the recipes on the shopping list
+    additional_items
+        The additional items on the shopping list
+
+    """
+
+    recipes: list[CookidooRecipe]
+    ingredient_items: list[CookidooIngredientItem]
+    additional_items: list[CookidooAdditionalItem]
+
+
+class CookidooShoppingListChanges(TypedDict):
+    """Cookidoo shopping list changes type.
+
+    Attributes
+    ----------
+    shopping_list
+        The shopping list
+    added
+        The ids of the items added since the previous shopping list
+    removed
+        The ids of the items removed since the previous shopping list
+    changed
+        The ids of the items changed since the previous shopping list
+
+    """
+
+    shopping_list: CookidooShoppingList
+    added: set[str]
+    removed: set[str]
+    changed: set[str]
+
+
+class CookidooShoppingListState(TypedDict, total=False):
+    """Cookidoo desired shopping list state type.
+
+    A missing part of the state is left as it is.
+
+    Attributes
+    ----------
+    recipe_ids
+        The ids of the recipes on the shopping list
+    additional_items
+        The `is_owned` value of the additional items on the shopping list,
+        by name
+    ingredient_items_ownership
+        The `is_owned` value of ingredient items, by id, the other
+        ingredient items are left as they are
+
+    """
+
+    recipe_ids: list[str]
+    additional_items: dict[str, bool]
+    ingredient_items_ownership: dict[str, bool]
+
+
+class CookidooCacheStats(TypedDict):
+    """Cookidoo cache statistics type.
+
+    Attributes
+    ----------
+    size
+        The number of cached entries
+    hits
+        The number of lookups served from a fresh entry
+    misses
+        The number of lookups of a missing or expired entry
+    revalidations
+        The number of expired entries confirmed unchanged by the server
+    evictions
+        The number of entries evicted to respect the size limit
+
+    """
+
+    size: int
+    hits: int
+    misses: int
+    revalidations: int
+    evictions: int
+
+
 class QuantityJSON(TypedDict):
     """The json for an quantity in the API."""
 
@@ -248,6 +337,13 @@ class RecipeJSON(TypedDict):
     recipeIngredientGroups: list[ItemJSON]
 
 
+class ShoppingListJSON(TypedDict):
+    """The json for a shopping list in the API."""
+
+    recipes: list[RecipeJSON]
+    additionalItems: list[AdditionalItemJSON]
+
+
 class RecipeDetailsAdditionalInformationJSON(TypedDict):
     """The json for a recipe details additional information in the API."""
 
@@ -331,3 +427,51 @@ class RecipeDetailsJSON(TypedDict):
     recipeUtensils: list[RecipeDetailsUtensilsJSON]
     servingSize: RecipeDetailsServingSizeJSON
     times: list[RecipeDetailsTimeJSON]
+
+
+class CookidooMirrorStats(TypedDict):
+    """Cookidoo shopping list mirror statistics type.
+
+    Attributes
+    ----------
+    pending
+        The number of writes waiting to be sent
+    flushed
+        The number of writes sent successfully
+    failed
+        The number of writes which failed
+    reconciliations
+        The number of reloads of the shopping list after a failed write
+        or added recipes
+
+    """
+
+    pending: int
+    flushed: int
+    failed: int
+    reconciliations: int
+
+
+class CookidooPoolStats(TypedDict):
+    """Cookidoo client pool statistics type.
+
+    Attributes
+    ----------
+    accounts
+        The number of accounts
+    active
+        The number of requests in flight
+    waiting
+        The number of requests waiting for a slot
+    requests
+        The number of requests which got a slot
+    wait_time
+        The total time in seconds the requests waited for a slot
+
+    """
+
+    accounts: int
+    active: int
+    waiting: int
+    requests: int
+    wait_time: float
@@ -78,6 +78,7 @@ async def main():
         )
         _ingredients = await cookidoo.get_ingredient_items()
         _recipes = await cookidoo.get_shopping_list_recipes()
+        _shopping_list = await cookidoo.get_shopping_list()
         await cookidoo.remove_ingredient_items_for_recipes(["r59322"])
 
         # Additional items
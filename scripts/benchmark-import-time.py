@@ -0,0 +1,65 @@
+"""Measure the import time of the package with `python -X importtime`."""
+#!/usr/bin/env python3
+
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cookidoo_api.localization import (  # noqa: E402
+    LOCALIZATION_FILE_PATH,
+    CookidooLocalizationRegistry,
+)
+
+RUNS = 7
+
+scenarios = {
+    "interpreter": "pass",
+    "package": "import cookidoo_api",
+    "types": "from cookidoo_api import CookidooLocalizationConfig",
+    "helpers": "from cookidoo_api import get_localization_options",
+    "localizations": "from cookidoo_api import LOCALIZATIONS; LOCALIZATIONS.load()",
+    "client": "from cookidoo_api import Cookidoo",
+}
+
+
+def import_time(statement: str) -> tuple[float, int, bool]:
+    """Run a statement in a fresh interpreter and sum the import times."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}; import sys; print('aiohttp' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+    )
+    # import time: self [us] | cumulative | imported package
+    times = [
+        int(line.split("|")[0].rsplit(":", 1)[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "self [us]" not in line
+    ]
+    return sum(times) / 1000, len(times), result.stdout.strip() == "True"
+
+
+for name, statement in scenarios.items():
+    runs = [import_time(statement) for _ in range(RUNS)]
+    _, modules, aiohttp = runs[0]
+    print(
+        f"{name:<15} {statistics.median(run[0] for run in runs):8.2f} ms"
+        f"  {modules:>4} modules  aiohttp {'imported' if aiohttp else 'not imported'}"
+    )
+
+for name, path in (("prebuilt", None), ("json", LOCALIZATION_FILE_PATH)):
+    load = timeit.timeit(
+        lambda path=path: CookidooLocalizationRegistry(path).load(), number=100
+    )
+    print(f"localizations from {name:<9} {load / 100 * 1e3:8.3f} ms per load")
@@ -0,0 +1,48 @@
+"""Compare the json codecs on the test responses."""
+#!/usr/bin/env python3
+
+from functools import partial
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cookidoo_api.codec import get_json_codec  # noqa: E402
+from cookidoo_api.exceptions import CookidooConfigException  # noqa: E402
+from tests import responses  # noqa: E402
+
+NUMBER = 2000
+
+fixtures = {
+    name.removeprefix("COOKIDOO_TEST_RESPONSE_").lower(): value
+    for name, value in vars(responses).items()
+    if name.startswith("COOKIDOO_TEST_RESPONSE_")
+}
+reference = get_json_codec("json")
+documents = {name: reference.dumps(value) for name, value in fixtures.items()}
+
+for codec_name in ("json", "orjson", "msgspec"):
+    try:
+        codec = get_json_codec(codec_name)
+    except CookidooConfigException:
+        print(f"{codec_name}: not installed, skipping")
+        continue
+
+    print(f"{codec_name}:")
+    total_loads = total_dumps = 0.0
+    for name, document in documents.items():
+        loads = timeit.timeit(partial(codec.loads, document), number=NUMBER)
+        dumps = timeit.timeit(partial(codec.dumps, fixtures[name]), number=NUMBER)
+        total_loads += loads
+        total_dumps += dumps
+        print(
+            f"  {name:<40} {len(document):>7} B"
+            f"  loads {loads / NUMBER * 1e6:8.2f} us"
+            f"  dumps {dumps / NUMBER * 1e6:8.2f} us"
+        )
+    print(
+        f"  {'total':<40} {'':>9}"
+        f"  loads {total_loads / NUMBER * 1e6:8.2f} us"
+        f"  dumps {total_dumps / NUMBER * 1e6:8.2f} us"
+    )
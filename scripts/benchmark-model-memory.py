@@ -0,0 +1,66 @@
+"""Compare the memory of the dicts and the slotted models."""
+#!/usr/bin/env python3
+
+from collections.abc import Callable
+import os
+import sys
+import tracemalloc
+from typing import Any, cast
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cookidoo_api.helpers import (  # noqa: E402
+    cookidoo_ingredient_item_from_json,
+    cookidoo_recipe_details_from_json,
+)
+from cookidoo_api.models import (  # noqa: E402
+    CookidooIngredientItemModel,
+    CookidooRecipeDetailsModel,
+)
+from cookidoo_api.types import ItemJSON, RecipeDetailsJSON  # noqa: E402
+from tests import responses  # noqa: E402
+
+NUMBER = 10000
+
+ingredient_item = cookidoo_ingredient_item_from_json(
+    cast(
+        ItemJSON,
+        responses.COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS["recipes"][0][
+            "recipeIngredientGroups"
+        ][0],
+    )  # type: ignore[index]
+)
+recipe_details = cookidoo_recipe_details_from_json(
+    cast(RecipeDetailsJSON, responses.COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS)
+)
+
+
+def measure(create: Callable[[], Any]) -> float:
+    """Measure the memory of many objects in bytes per object."""
+    tracemalloc.start()
+    objects = [create() for _ in range(NUMBER)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / NUMBER
+
+
+def copy_dict(value: Any) -> Any:
+    """Copy the dicts and lists of a value, sharing the strings like the api."""
+    if isinstance(value, dict):
+        return {key: copy_dict(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_dict(item) for item in value]
+    return value
+
+
+for name, value, model in (
+    ("ingredient item", ingredient_item, CookidooIngredientItemModel),
+    ("recipe details", recipe_details, CookidooRecipeDetailsModel),
+):
+    dicts = measure(lambda value=value: copy_dict(value))
+    models = measure(lambda value=value, model=model: model.from_dict(value))
+    print(
+        f"{name:<16} dict {dicts:8.0f} B  model {models:8.0f} B"
+        f"  saving {1 - models / dicts:6.1%}"
+    )
@@ -0,0 +1,24 @@
+"""Measure the recipe details decoder on the test response."""
+#!/usr/bin/env python3
+
+from functools import partial
+import os
+import sys
+import timeit
+from typing import cast
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cookidoo_api.helpers import cookidoo_recipe_details_from_json  # noqa: E402
+from cookidoo_api.types import RecipeDetailsJSON  # noqa: E402
+from tests.responses import COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS  # noqa: E402
+
+NUMBER = 20000
+
+recipe = cast(RecipeDetailsJSON, COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS)
+best = min(
+    timeit.repeat(
+        partial(cookidoo_recipe_details_from_json, recipe), number=NUMBER, repeat=5
+    )
+)
+print(f"cookidoo_recipe_details_from_json {best / NUMBER * 1e6:8.2f} us")
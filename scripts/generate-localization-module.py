@@ -0,0 +1,41 @@
+"""Generate the prebuilt localization module from the localization json."""
+#!/usr/bin/env python3
+
+# The module is imported instead of parsing the json at runtime,
+# run this script whenever the localization json changes.
+
+import json
+import os
+
+script_dir = os.path.dirname(__file__)
+input_file_path = os.path.join(script_dir, "../cookidoo_api/localization.json")
+output_file_path = os.path.join(script_dir, "../cookidoo_api/_localization_data.py")
+
+with open(input_file_path, encoding="utf-8") as file:
+    localization_data = json.load(file)
+
+lines = [
+    '"""Cookidoo API localization options, generated from localization.json.',
+    "",
+    "Do not edit, run `scripts/generate-localization-module.py` instead.",
+    '"""',
+    "",
+    "# (country_code, language, url)",
+    "OPTIONS = (",
+    *(
+        # json strings are valid python strings, with the quotes of the formatter
+        "    ({}, {}, {}),".format(
+            *(
+                json.dumps(option[key], ensure_ascii=False)
+                for key in ("country_code", "language", "url")
+            )
+        )
+        for option in localization_data
+    ),
+    ")",
+    "",
+]
+
+with open(output_file_path, "w", encoding="utf-8") as file:
+    file.write("\n".join(lines))
+print(f"Successfully generated {len(localization_data)} entries")
@@ -1,20 +1,45 @@
 """Unit tests for cookidoo-api."""
 
 from collections.abc import AsyncGenerator, Generator
+import json
+from typing import Any
 
 from aiohttp import ClientSession
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from dotenv import load_dotenv
 import pytest
+from yarl import URL
 
 from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
 from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.types import CookidooIngredientItem
 
 load_dotenv()
 
 UUID = "00000000-00000000-00000000-00000000"
 
 
+def echo_additional_items(url: URL, **kwargs: Any) -> CallbackResult:
+    """Respond with the edited additional items."""
+    return CallbackResult(
+        payload={
+            "data": [
+                {
+                    "id": item["id"],
+                    "name": item.get("name", item["id"]),
+                    "isOwned": item.get("isOwned", False),
+                }
+                for item in json.loads(kwargs["data"])["additionalItems"]
+            ]
+        }
+    )
+
+
+def ingredient_item(id: str, is_owned: bool) -> CookidooIngredientItem:
+    """Create an ingredient item."""
+    return CookidooIngredientItem(id=id, name=id, is_owned=is_owned, description="")
+
+
 @pytest.fixture(name="session")
 async def aiohttp_client_session() -> AsyncGenerator[ClientSession]:
     """Create  a client session."""
@@ -0,0 +1,138 @@
+"""Unit tests for cookidoo-api."""
+
+from http import HTTPStatus
+from typing import cast
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+from yarl import URL
+
+from cookidoo_api.cache import CookidooRecipeCache, CookidooRecipeCacheEntry
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.types import CookidooRecipeDetails
+from tests.responses import COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+
+load_dotenv()
+
+RECIPE_URL = "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322"
+
+
+def entry(fetched_at: float = 0) -> CookidooRecipeCacheEntry:
+    """Create a cache entry."""
+    return CookidooRecipeCacheEntry(cast(CookidooRecipeDetails, {}), fetched_at)
+
+
+class TestRecipeCache:
+    """Tests for the recipe cache."""
+
+    async def test_lru_eviction(self) -> None:
+        """Test the least recently used recipe is evicted."""
+        cache = CookidooRecipeCache(max_size=2)
+        cache.put(("de-CH", "r1"), entry())
+        cache.put(("de-CH", "r2"), entry())
+        cache.get(("de-CH", "r1"))
+        cache.put(("de-CH", "r3"), entry())
+
+        assert len(cache) == 2
+        assert cache.get(("de-CH", "r2")) is None
+        assert cache.get(("de-CH", "r1")) is not None
+        assert cache.stats()["evictions"] == 1
+
+    async def test_ttl(self) -> None:
+        """Test expired recipes are returned as not fresh."""
+        cache = CookidooRecipeCache(ttl=60)
+        cache.put(("de-CH", "r1"), entry(fetched_at=0))
+
+        cached = cache.get(("de-CH", "r1"))
+        assert cached is not None
+        assert not cache.check(cached)
+        assert cache.stats() == {
+            "size": 1,
+            "hits": 0,
+            "misses": 1,
+            "revalidations": 0,
+            "evictions": 0,
+        }
+
+        cache.revalidated(("de-CH", "r1"))
+        assert cache.check(cache.get(("de-CH", "r1")))
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["revalidations"] == 1
+
+
+class TestCookidooRecipeCache:
+    """Tests for get_recipe_details with a recipe cache."""
+
+    @pytest.fixture(name="cache")
+    def recipe_cache(self) -> CookidooRecipeCache:
+        """Create a recipe cache."""
+        return CookidooRecipeCache()
+
+    @pytest.fixture(name="cookidoo")
+    def cookidoo_with_cache(
+        self, session: ClientSession, cache: CookidooRecipeCache
+    ) -> Cookidoo:
+        """Create Cookidoo instance with a recipe cache."""
+        return Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, recipe_cache=cache)
+
+    async def test_hit(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooRecipeCache
+    ) -> None:
+        """Test a cached recipe is not loaded again."""
+        mocked.get(
+            RECIPE_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+
+        first = await cookidoo.get_recipe_details("r59322")
+        first["name"] = "changed"
+        second = await cookidoo.get_recipe_details("r59322")
+        assert second["name"] == COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS["title"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_revalidation(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooRecipeCache
+    ) -> None:
+        """Test an expired recipe is revalidated with its validators."""
+        cache.ttl = 0
+        mocked.get(
+            RECIPE_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+            headers={"ETag": '"v1"', "Last-Modified": "Sun, 03 Nov 2024 13:26:29 GMT"},
+        )
+        mocked.get(RECIPE_URL, status=HTTPStatus.NOT_MODIFIED)
+
+        first = await cookidoo.get_recipe_details("r59322")
+        second = await cookidoo.get_recipe_details("r59322")
+        assert first == second
+        assert cache.stats()["revalidations"] == 1
+
+        request = mocked.requests[("GET", URL(RECIPE_URL))][1]
+        assert request.kwargs["headers"]["IF-NONE-MATCH"] == '"v1"'
+        assert (
+            request.kwargs["headers"]["IF-MODIFIED-SINCE"]
+            == "Sun, 03 Nov 2024 13:26:29 GMT"
+        )
+
+    async def test_refetch_without_validators(
+        self, mocked: aioresponses, cookidoo: Cookidoo, cache: CookidooRecipeCache
+    ) -> None:
+        """Test an expired recipe without validators is loaded again."""
+        cache.ttl = 0
+        mocked.get(
+            RECIPE_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+
+        await cookidoo.get_recipe_details("r59322")
+        await cookidoo.get_recipe_details("r59322")
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["revalidations"] == 0
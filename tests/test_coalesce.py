@@ -0,0 +1,129 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+import json
+from typing import Any
+
+from aiohttp import ClientSession
+from aioresponses import CallbackResult, aioresponses
+from dotenv import load_dotenv
+import pytest
+from yarl import URL
+
+from cookidoo_api.coalesce import CookidooWriteCoalescer
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException, CookidooRequestException
+from cookidoo_api.types import CookidooAdditionalItem
+from tests.conftest import echo_additional_items, ingredient_item
+
+load_dotenv()
+
+SHOPPING_LIST_URL = "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"
+INGREDIENTS_OWNERSHIP_URL = f"{SHOPPING_LIST_URL}/owned-ingredients/ownership/edit"
+ADDITIONAL_OWNERSHIP_URL = f"{SHOPPING_LIST_URL}/additional-items/ownership/edit"
+ADDITIONAL_URL = f"{SHOPPING_LIST_URL}/additional-items/edit"
+
+
+def echo_ingredients(url: URL, **kwargs: Any) -> CallbackResult:
+    """Respond with the edited ingredient items."""
+    return CallbackResult(
+        payload={
+            "data": [
+                {
+                    "id": item["id"],
+                    "ingredientNotation": item["id"],
+                    "isOwned": item["isOwned"],
+                    "quantity": None,
+                    "unitNotation": "",
+                }
+                for item in json.loads(kwargs["data"])["ingredients"]
+            ]
+        }
+    )
+
+
+def sent(mocked: aioresponses, url: str) -> list[dict[str, Any]]:
+    """Get the bodies sent to an url."""
+    return [
+        json.loads(call.kwargs["data"]) for call in mocked.requests[("POST", URL(url))]
+    ]
+
+
+class TestWriteCoalescer:
+    """Tests for the write coalescer."""
+
+    async def test_coalesce(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test a burst of edits is sent once, the last edit of an item winning."""
+        mocked.post(INGREDIENTS_OWNERSHIP_URL, callback=echo_ingredients)
+        coalescer = CookidooWriteCoalescer(cookidoo, window=0.01)
+
+        first, second, third = await asyncio.gather(
+            coalescer.edit_ingredient_items_ownership([ingredient_item("i1", True)]),
+            coalescer.edit_ingredient_items_ownership(
+                [ingredient_item("i2", True), ingredient_item("i3", True)]
+            ),
+            coalescer.edit_ingredient_items_ownership([ingredient_item("i1", False)]),
+        )
+
+        [body] = sent(mocked, INGREDIENTS_OWNERSHIP_URL)
+        assert [(item["id"], item["isOwned"]) for item in body["ingredients"]] == [
+            ("i2", True),
+            ("i3", True),
+            ("i1", False),
+        ]
+        assert first == third == [ingredient_item("i1", False)]
+        assert second == [ingredient_item("i2", True), ingredient_item("i3", True)]
+
+    async def test_endpoints(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test each endpoint receives its own request."""
+        mocked.post(ADDITIONAL_OWNERSHIP_URL, callback=echo_additional_items)
+        mocked.post(ADDITIONAL_URL, callback=echo_additional_items)
+        coalescer = CookidooWriteCoalescer(cookidoo, window=0.01)
+        item = CookidooAdditionalItem(id="a1", name="Milk", is_owned=True)
+
+        owned, renamed = await asyncio.gather(
+            coalescer.edit_additional_items_ownership([item]),
+            coalescer.edit_additional_items([item]),
+        )
+
+        assert owned == [CookidooAdditionalItem(id="a1", name="a1", is_owned=True)]
+        assert renamed == [CookidooAdditionalItem(id="a1", name="Milk", is_owned=False)]
+        assert len(sent(mocked, ADDITIONAL_OWNERSHIP_URL)) == 1
+        assert len(sent(mocked, ADDITIONAL_URL)) == 1
+
+    async def test_flush(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test the pending edits are sent on flush and on the size limit."""
+        mocked.post(INGREDIENTS_OWNERSHIP_URL, callback=echo_ingredients, repeat=True)
+        coalescer = CookidooWriteCoalescer(cookidoo, window=60, max_size=2)
+
+        edit = asyncio.ensure_future(
+            coalescer.edit_ingredient_items_ownership([ingredient_item("i1", True)])
+        )
+        await asyncio.sleep(0)
+        await coalescer.flush()
+        assert await edit == [ingredient_item("i1", True)]
+
+        assert await coalescer.edit_ingredient_items_ownership(
+            [ingredient_item("i1", False), ingredient_item("i2", False)]
+        ) == [ingredient_item("i1", False), ingredient_item("i2", False)]
+        assert len(sent(mocked, INGREDIENTS_OWNERSHIP_URL)) == 2
+
+    async def test_error(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test the error of the request is raised to every caller."""
+        mocked.post(INGREDIENTS_OWNERSHIP_URL, status=500)
+        coalescer = CookidooWriteCoalescer(cookidoo, window=0.01)
+
+        results = await asyncio.gather(
+            coalescer.edit_ingredient_items_ownership([ingredient_item("i1", True)]),
+            coalescer.edit_ingredient_items_ownership([ingredient_item("i2", True)]),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, CookidooRequestException) for r in results)
+
+    @pytest.mark.parametrize(("window", "max_size"), [(-1, 10), (0.1, 0)])
+    async def test_invalid_config(
+        self, session: ClientSession, window: float, max_size: int
+    ) -> None:
+        """Test invalid windows and sizes."""
+        with pytest.raises(CookidooConfigException):
+            CookidooWriteCoalescer(Cookidoo(session), window, max_size)
@@ -0,0 +1,82 @@
+"""Unit tests for cookidoo-api."""
+
+from http import HTTPStatus
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.codec import STDLIB_JSON_CODEC, get_json_codec
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException, CookidooParseException
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+    COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+)
+
+load_dotenv()
+
+
+class TestCodec:
+    """Tests for the json codecs."""
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    async def test_round_trip(self, name: str) -> None:
+        """Test encoding and decoding a response."""
+        pytest.importorskip(name)
+        codec = get_json_codec(name)
+        assert codec.name == name
+        assert (
+            codec.loads(codec.dumps(COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS))
+            == COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+        )
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    async def test_invalid_json(self, name: str) -> None:
+        """Test invalid json raises a value error."""
+        pytest.importorskip(name)
+        with pytest.raises(ValueError):
+            get_json_codec(name).loads(b"not json")
+
+    async def test_default(self) -> None:
+        """Test the default codec is an installed one."""
+        assert get_json_codec().name in ("orjson", "msgspec", "json")
+
+    async def test_unknown(self) -> None:
+        """Test an unknown codec."""
+        with pytest.raises(CookidooConfigException, match="Unknown json codec"):
+            get_json_codec("yaml")
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    async def test_cookidoo_codec(
+        self, mocked: aioresponses, session: ClientSession, name: str
+    ) -> None:
+        """Test requests are encoded and responses decoded with the codec."""
+        pytest.importorskip(name)
+        codec = get_json_codec(name)
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, json_codec=codec)
+        mocked.post(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+            status=HTTPStatus.OK,
+        )
+        mocked.post(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH/additional-items/add",
+            body="not json",
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.add_additional_items(["Fisch"])
+        assert "Fisch" in (item["name"] for item in data)
+        request = next(iter(mocked.requests.values()))[0]
+        assert codec.loads(request.kwargs["data"]) == {"itemsValue": ["Fisch"]}
+        assert request.kwargs["headers"]["CONTENT-TYPE"] == "application/json"
+
+        with pytest.raises(CookidooParseException):
+            await cookidoo.add_additional_items(["Fisch"])
+
+    async def test_stdlib_compact(self) -> None:
+        """Test the stdlib codec encodes compact json."""
+        assert STDLIB_JSON_CODEC.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
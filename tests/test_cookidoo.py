@@ -1,11 +1,15 @@
 """Unit tests for cookidoo-api."""
 
+import asyncio
 from http import HTTPStatus
+import logging
+from typing import Any, cast
 
-from aiohttp import ClientError
-from aioresponses import aioresponses
+from aiohttp import ClientError, ClientResponse, ClientSession, TCPConnector
+from aioresponses import CallbackResult, aioresponses
 from dotenv import load_dotenv
 import pytest
+from yarl import URL
 
 from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
 from cookidoo_api.cookidoo import Cookidoo
@@ -16,6 +20,8 @@ from cookidoo_api.exceptions import (
     CookidooParseException,
     CookidooRequestException,
 )
+from cookidoo_api.models import CookidooIngredientItemModel
+from cookidoo_api.types import CookidooAuthResponse, CookidooRecipeDetails
 from tests.responses import (
     COOKIDOO_TEST_RESPONSE_ACTIVE_SUBSCRIPTION,
     COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
@@ -141,6 +147,90 @@ class TestLogin:
         assert cookidoo.expires_in > 0
 
 
+TOKEN_URL = "https://eu.login.vorwerk.com/oauth2/token"
+PROFILE_URL = "https://ch.tmmobile.vorwerk-digital.com/community/profile"
+
+
+class TestAutoAuth:
+    """Tests for the auto auth mode."""
+
+    @pytest.fixture(name="cookidoo")
+    async def auto_auth_client(self, session: ClientSession) -> Cookidoo:
+        """Create Cookidoo instance with auto auth."""
+        return Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, auto_auth=True)
+
+    async def test_login_before_first_request(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the first request logs in."""
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        assert cookidoo.auth_data is not None
+        request = mocked.requests[("GET", URL(PROFILE_URL))][0]
+        assert request.kwargs["headers"]["AUTHORIZATION"].startswith("Bearer ")
+
+    async def test_single_refresh_before_expiry(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test concurrent requests refresh an expiring token only once."""
+        cookidoo.auth_data = cast(
+            CookidooAuthResponse,
+            {**COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE, "expires_in": 30},
+        )
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO, repeat=True)
+
+        await asyncio.gather(*(cookidoo.get_user_info() for _ in range(5)))
+        assert len(mocked.requests[("POST", URL(TOKEN_URL))]) == 1
+        assert cookidoo.expires_in > 60
+
+    async def test_retry_after_unauthorized(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a rejected token is refreshed and the request retried once."""
+        cookidoo.auth_data = cast(
+            CookidooAuthResponse, COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE
+        )
+        mocked.get(PROFILE_URL, status=HTTPStatus.UNAUTHORIZED)
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        assert len(mocked.requests[("GET", URL(PROFILE_URL))]) == 2
+
+    async def test_unauthorized_after_retry(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a request is only retried once."""
+        cookidoo.auth_data = cast(
+            CookidooAuthResponse, COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE
+        )
+        mocked.get(PROFILE_URL, status=HTTPStatus.UNAUTHORIZED, repeat=True)
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+
+        with pytest.raises(CookidooAuthException):
+            await cookidoo.get_user_info()
+        assert len(mocked.requests[("GET", URL(PROFILE_URL))]) == 2
+
+    async def test_login_after_failed_refresh(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a failed refresh falls back to a new login."""
+        cookidoo.auth_data = cast(
+            CookidooAuthResponse,
+            {**COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE, "expires_in": 0},
+        )
+        mocked.post(TOKEN_URL, status=HTTPStatus.BAD_REQUEST)
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        assert len(mocked.requests[("POST", URL(TOKEN_URL))]) == 2
+        assert cookidoo.expires_in > 60
+
+
 class TestGetUserInfo:
     """Tests for get_user_info method."""
 
@@ -396,6 +486,217 @@ class TestGetRecipeDetails:
             await cookidoo.get_recipe_details("r907015")
 
 
+class TestGetRecipeDetailsMany:
+    """Tests for get_recipe_details_many and iter_recipe_details methods."""
+
+    async def test_get_recipe_details_many(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a failing recipe does not fail the others."""
+        for id in ("r1", "r3"):
+            mocked.get(
+                f"https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/{id}",
+                payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+                status=HTTPStatus.OK,
+            )
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r2",
+            status=HTTPStatus.NOT_FOUND,
+        )
+
+        data = await cookidoo.get_recipe_details_many(["r1", "r2", "r3"])
+        assert set(data) == {"r1", "r2", "r3"}
+        assert isinstance(data["r2"], CookidooRequestException)
+        assert not isinstance(data["r1"], CookidooException)
+        assert data["r1"]["name"] == COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS["title"]
+
+    async def test_concurrency(
+        self, cookidoo: Cookidoo, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the number of concurrent requests is limited."""
+        in_flight = max_in_flight = 0
+
+        async def get_recipe_details(id: str) -> CookidooRecipeDetails:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return cast(CookidooRecipeDetails, {"id": id})
+
+        monkeypatch.setattr(cookidoo, "get_recipe_details", get_recipe_details)
+
+        ids = [f"r{i}" for i in range(10)]
+        results = [
+            id async for id, _ in cookidoo.iter_recipe_details(ids, concurrency=3)
+        ]
+        assert sorted(results) == sorted(ids)
+        assert max_in_flight == 3
+
+    async def test_invalid_concurrency(self, cookidoo: Cookidoo) -> None:
+        """Test an invalid concurrency."""
+        with pytest.raises(CookidooConfigException):
+            await cookidoo.get_recipe_details_many(["r1"], concurrency=0)
+
+
+class TestGetShoppingList:
+    """Tests for get_shopping_list method."""
+
+    async def test_get_shopping_list(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test for get_shopping_list."""
+
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.get_shopping_list()
+        assert len(data["recipes"]) == 2
+        assert len(data["ingredient_items"]) == sum(
+            len(recipe["ingredients"]) for recipe in data["recipes"]
+        )
+        assert data["additional_items"] == []
+
+    async def test_reuse_snapshot(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test the getters reuse a recent snapshot with a single request."""
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, shopping_list_max_age=60)
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+            status=HTTPStatus.OK,
+        )
+
+        recipes = await cookidoo.get_shopping_list_recipes()
+        ingredient_items = await cookidoo.get_ingredient_items()
+        additional_items = await cookidoo.get_additional_items()
+        assert len(recipes) == 2
+        assert len(ingredient_items) == 14
+        assert additional_items == []
+
+        # the returned items are copies of the snapshot
+        ingredient_items[0]["is_owned"] = not ingredient_items[0]["is_owned"]
+        assert (await cookidoo.get_ingredient_items())[0]["is_owned"] != (
+            ingredient_items[0]["is_owned"]
+        )
+
+    async def test_invalidate_snapshot(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a mutation invalidates the snapshot."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+        mocked.post(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH/recipes/remove",
+            payload=None,
+            status=HTTPStatus.OK,
+        )
+
+        await cookidoo.get_shopping_list(max_age=60)
+        await cookidoo.get_shopping_list(max_age=60)
+        await cookidoo.remove_ingredient_items_for_recipes(["r59322"])
+        await cookidoo.get_shopping_list(max_age=60)
+        assert (
+            len(
+                mocked.requests[
+                    (
+                        "GET",
+                        URL("https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"),
+                    )
+                ]
+            )
+            == 2
+        )
+
+    async def test_snapshot_not_kept_after_write_in_flight(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a read in flight during a write does not keep its snapshot."""
+        loading = asyncio.Event()
+        written = asyncio.Event()
+
+        async def shopping_list(url: URL, **kwargs: Any) -> CallbackResult:
+            loading.set()
+            await written.wait()
+            return CallbackResult(payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS)
+
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            callback=shopping_list,
+            repeat=True,
+        )
+        mocked.post(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH/recipes/remove",
+            payload=None,
+            status=HTTPStatus.OK,
+        )
+
+        read = asyncio.create_task(cookidoo.get_shopping_list(max_age=60))
+        await loading.wait()
+        await cookidoo.remove_ingredient_items_for_recipes(["r59322"])
+        written.set()
+        await read
+        await cookidoo.get_shopping_list(max_age=60)
+        assert (
+            len(
+                mocked.requests[
+                    (
+                        "GET",
+                        URL("https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"),
+                    )
+                ]
+            )
+            == 2
+        )
+
+    async def test_read_after_write_not_joining_older_read(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a read started after a write does not share an older request."""
+        loading = asyncio.Event()
+        written = asyncio.Event()
+        responses = [
+            COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+            {**COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS, "recipes": []},
+        ]
+
+        async def shopping_list(url: URL, **kwargs: Any) -> CallbackResult:
+            payload = responses.pop(0)
+            if responses:
+                loading.set()
+                await written.wait()
+            return CallbackResult(payload=payload)
+
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            callback=shopping_list,
+            repeat=True,
+        )
+        mocked.post(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH/recipes/remove",
+            payload=None,
+            status=HTTPStatus.OK,
+        )
+
+        older = asyncio.create_task(cookidoo.get_shopping_list())
+        await loading.wait()
+        await cookidoo.remove_ingredient_items_for_recipes(["r59322", "r907016"])
+        read = asyncio.create_task(cookidoo.get_shopping_list(max_age=60))
+        await asyncio.sleep(0)
+        written.set()
+        await older
+        assert (await read)["recipes"] == []
+        assert (await cookidoo.get_shopping_list(max_age=60))["recipes"] == []
+
+
 class TestGetShoppingListRecipes:
     """Tests for get_shopping_list_recipes method."""
 
@@ -546,6 +847,105 @@ class TestGetIngredients:
             await cookidoo.get_ingredient_items()
 
 
+class TestIterIngredientItems:
+    """Tests for iter_ingredient_items method."""
+
+    async def test_iter_ingredient_items(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the streamed items are the loaded ones."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+            repeat=True,
+        )
+
+        items = [item async for item in cookidoo.iter_ingredient_items()]
+        assert len(items) == 14
+        assert items == await cookidoo.get_ingredient_items()
+
+    async def test_models(self, mocked: aioresponses) -> None:
+        """Test the items are models if enabled."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+        )
+        async with ClientSession() as session:
+            cookidoo = Cookidoo(session, models=True)
+            items = [item async for item in cookidoo.iter_ingredient_items()]
+        assert all(isinstance(item, CookidooIngredientItemModel) for item in items)
+
+    async def test_request_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test request exceptions."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            exception=ClientError(),
+        )
+
+        with pytest.raises(CookidooRequestException):
+            [item async for item in cookidoo.iter_ingredient_items()]
+
+    @pytest.mark.parametrize(
+        ("status", "body", "exception"),
+        [
+            (HTTPStatus.OK, "not json", CookidooParseException),
+            (HTTPStatus.OK, '{"recipes": [{"id": "r1"}]}', CookidooParseException),
+            (HTTPStatus.UNAUTHORIZED, "{}", CookidooAuthException),
+            (HTTPStatus.BAD_GATEWAY, "", CookidooRequestException),
+        ],
+    )
+    async def test_response_exception(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        status: HTTPStatus,
+        body: str,
+        exception: type[CookidooException],
+    ) -> None:
+        """Test invalid responses."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            status=status,
+            body=body,
+        )
+
+        with pytest.raises(exception):
+            [item async for item in cookidoo.iter_ingredient_items()]
+
+    async def test_caller_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test an error of the caller while handling an item is not converted."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+        )
+
+        with pytest.raises(ValueError, match="caller"):
+            async for _ in cookidoo.iter_ingredient_items():
+                raise ValueError("caller")
+
+    async def test_retry_after_unauthorized(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test a rejected token is refreshed and the stream requested again."""
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, auto_auth=True)
+        cookidoo.auth_data = cast(
+            CookidooAuthResponse, COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE
+        )
+        url = "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"
+        mocked.get(url, status=HTTPStatus.UNAUTHORIZED)
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(url, payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS)
+
+        items = [item async for item in cookidoo.iter_ingredient_items()]
+        assert len(items) == 14
+        assert len(mocked.requests[("GET", URL(url))]) == 2
+        assert len(mocked.requests[("POST", URL(TOKEN_URL))]) == 1
+
+
 class TestAddIngredientsForRecipes:
     """Tests for add_ingredient_items_for_recipes method."""
 
@@ -1321,3 +1721,274 @@ class TestClearShoppingList:
 
         with pytest.raises(exception):
             await cookidoo.clear_shopping_list()
+
+
+class TestRequest:
+    """Tests for the shared request engine."""
+
+    async def test_no_debug_formatting(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test the response and traceback are not formatted without debug logging."""
+        caplog.set_level(logging.INFO, logger="cookidoo_api.cookidoo")
+        monkeypatch.setattr(
+            "cookidoo_api.cookidoo.traceback.format_exc",
+            lambda: pytest.fail("traceback formatted without debug logging"),
+        )
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/community/profile",
+            exception=TimeoutError,
+        )
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+
+    async def test_debug_logging(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test the response is logged with debug logging."""
+        caplog.set_level(logging.DEBUG, logger="cookidoo_api.cookidoo")
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+        )
+
+        await cookidoo.get_user_info()
+        assert "Response from" in caplog.text
+        assert "Test User" in caplog.text
+
+    async def test_single_body_read(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test the body is read once and parsed from the bytes."""
+        caplog.set_level(logging.DEBUG, logger="cookidoo_api.cookidoo")
+        monkeypatch.setattr(
+            ClientResponse, "text", lambda *_: pytest.fail("body decoded as text")
+        )
+        monkeypatch.setattr(
+            ClientResponse, "json", lambda *_: pytest.fail("body decoded as json")
+        )
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.get_recipe_details("r59322")
+        assert data["id"] == COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS["id"]
+        assert str(COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS["title"]) in caplog.text
+
+    async def test_single_flight(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test concurrent identical requests share one request."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+
+        data = await asyncio.gather(
+            *(cookidoo.get_recipe_details("r59322") for _ in range(3))
+        )
+        assert data[0] == data[1] == data[2]
+        assert data[0] is not data[1]
+        assert data[0]["ingredients"] is not data[1]["ingredients"]
+
+    async def test_single_flight_exception(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test concurrent identical requests share one failed request."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322",
+            status=HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+
+        results = await asyncio.gather(
+            *(cookidoo.get_recipe_details("r59322") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(e, CookidooRequestException) for e in results)
+
+    async def test_no_single_flight(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test concurrent identical requests without single flight."""
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, single_flight=False)
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+
+        results = await asyncio.gather(
+            *(cookidoo.get_recipe_details("r59322") for _ in range(2)),
+            return_exceptions=True,
+        )
+        # the second request is not mocked anymore
+        assert [isinstance(e, CookidooRequestException) for e in results].count(
+            True
+        ) == 1
+
+
+class TestCreate:
+    """Tests for the instances owning their session."""
+
+    async def test_create(self, mocked: aioresponses) -> None:
+        """Test the created instance owns a tuned session."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+        )
+
+        async with Cookidoo.create(limit_per_host=4) as cookidoo:
+            session = cookidoo._session
+            assert isinstance(session.connector, TCPConnector)
+            assert session.connector.limit_per_host == 4
+            assert "gzip" in session.headers["ACCEPT-ENCODING"]
+            await cookidoo.get_user_info()
+        assert session.closed
+
+    async def test_shared_ssl_context(self) -> None:
+        """Test the created instances share one ssl context."""
+        async with Cookidoo.create() as first, Cookidoo.create() as second:
+            assert (
+                first._session.connector._ssl  # type: ignore[union-attr]
+                is second._session.connector._ssl  # type: ignore[union-attr]
+            )
+
+    async def test_session_not_owned(self, session: ClientSession) -> None:
+        """Test a session passed to the constructor is left open."""
+        async with Cookidoo(session, DEFAULT_COOKIDOO_CONFIG):
+            pass
+        assert not session.closed
+
+
+class TestForLocale:
+    """Tests for the instances of other localizations."""
+
+    async def test_for_locale(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test an instance of another localization shares the authentication."""
+        mocked.post(
+            "https://eu.login.vorwerk.com/oauth2/token",
+            payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE,
+            status=HTTPStatus.OK,
+        )
+        mocked.get(
+            "https://de.tmmobile.vorwerk-digital.com/recipes/recipe/de-DE/r59322",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+
+        german = cookidoo.for_locale("de-DE")
+        assert german.localization["country_code"] == "de"
+        assert german.api_endpoint == URL("https://de.tmmobile.vorwerk-digital.com")
+        assert cookidoo.localization == DEFAULT_COOKIDOO_CONFIG["localization"]
+
+        await cookidoo.login()
+        assert german.auth_data == cookidoo.auth_data
+        await german.get_recipe_details("r59322")
+        request = mocked.requests[
+            (
+                "GET",
+                URL(
+                    "https://de.tmmobile.vorwerk-digital.com/recipes/recipe/de-DE/r59322"
+                ),
+            )
+        ][0]
+        assert request.kwargs["headers"]["AUTHORIZATION"].startswith("Bearer ")
+
+    async def test_for_locale_once(self, cookidoo: Cookidoo) -> None:
+        """Test the instance of a localization is created once."""
+        german = cookidoo.for_locale("de-DE")
+        assert cookidoo.for_locale("de-DE") is german
+        assert german.for_locale(DEFAULT_COOKIDOO_CONFIG["localization"]) is cookidoo
+        assert cookidoo.for_locale("de-CH") is cookidoo
+
+    async def test_for_locale_unknown(self, cookidoo: Cookidoo) -> None:
+        """Test an unknown localization."""
+        with pytest.raises(CookidooConfigException):
+            cookidoo.for_locale("xx-XX")
+
+
+class TestWatchShoppingList:
+    """Tests for watch_shopping_list method."""
+
+    async def test_watch(
+        self,
+        mocked: aioresponses,
+        cookidoo: Cookidoo,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test only the changes are yielded, the polling adapting to them."""
+        delays: list[float] = []
+        sleep = asyncio.sleep
+
+        async def record(delay: float) -> None:
+            delays.append(delay)
+            await sleep(0)
+
+        monkeypatch.setattr(asyncio, "sleep", record)
+        recipes = cast(list[Any], COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS["recipes"])
+        additional_items = cast(
+            list[Any], COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS["additionalItems"]
+        )
+        first = {**COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS, "additionalItems": []}
+        owned = [
+            {
+                **recipes[0],
+                "recipeIngredientGroups": [
+                    {**item, "isOwned": True} if index == 0 else item
+                    for index, item in enumerate(recipes[0]["recipeIngredientGroups"])
+                ],
+            },
+        ]
+        second = {
+            **COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+            "recipes": owned,
+            "additionalItems": additional_items,
+        }
+        for payload in (
+            first,
+            first,
+            first,
+            {**first, "customerRecipes": [{}]},
+            second,
+        ):
+            mocked.get(
+                "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+                payload=payload,
+            )
+
+        watch = cookidoo.watch_shopping_list(interval=10, max_interval=30, backoff=2)
+        changes = await anext(watch)
+        assert len(changes["added"]) == 14
+        assert not changes["removed"]
+        assert not changes["changed"]
+
+        changes = await anext(watch)
+        assert changes["added"] == {item["id"] for item in additional_items}
+        assert changes["removed"] == {
+            item["id"] for item in recipes[1]["recipeIngredientGroups"]
+        }
+        assert changes["changed"] == {recipes[0]["recipeIngredientGroups"][0]["id"]}
+        assert changes["shopping_list"] == await cookidoo.get_shopping_list(max_age=60)
+        assert delays == [10, 20, 30, 30]
+
+    async def test_invalid_config(self, cookidoo: Cookidoo) -> None:
+        """Test invalid intervals."""
+        with pytest.raises(CookidooConfigException):
+            await anext(cookidoo.watch_shopping_list(interval=60, max_interval=30))
@@ -0,0 +1,125 @@
+"""Unit tests for cookidoo-api."""
+
+from collections.abc import AsyncGenerator
+
+from aiohttp import ClientSession
+from aiohttp.test_utils import TestServer
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooAuthException, CookidooRequestException
+from cookidoo_api.fake_server import TOKEN_PATH, CookidooFakeServer, main
+
+load_dotenv()
+
+
+@pytest.fixture(name="fake_server")
+def fake_cookidoo_server() -> CookidooFakeServer:
+    """Create a fake server."""
+    return CookidooFakeServer()
+
+
+@pytest.fixture(name="base_url")
+async def fake_server_url(fake_server: CookidooFakeServer) -> AsyncGenerator[str]:
+    """Run the fake server on a local port."""
+    async with TestServer(fake_server.app) as server:
+        yield str(server.make_url("")).rstrip("/")
+
+
+def fake_client(session: ClientSession, base_url: str, email: str) -> Cookidoo:
+    """Create Cookidoo instance with auto auth, pointed at the fake server."""
+    return Cookidoo(
+        session,
+        {**DEFAULT_COOKIDOO_CONFIG, "email": email},
+        auto_auth=True,
+        api_endpoint=base_url,
+        token_endpoint=f"{base_url}/{TOKEN_PATH}",
+    )
+
+
+@pytest.fixture(name="cookidoo")
+def fake_cookidoo(session: ClientSession, base_url: str) -> Cookidoo:
+    """Create Cookidoo instance pointed at the fake server."""
+    return fake_client(session, base_url, DEFAULT_COOKIDOO_CONFIG["email"])
+
+
+class TestFakeServer:
+    """Tests for the fake server."""
+
+    async def test_account(self, cookidoo: Cookidoo) -> None:
+        """Test the login, user info, subscription and recipe details."""
+        auth_data = await cookidoo.login()
+        assert auth_data["token_type"] == "bearer"
+        assert (await cookidoo.get_user_info())["username"]
+        subscription = await cookidoo.get_active_subscription()
+        assert subscription is not None
+        assert subscription["active"]
+        details = await cookidoo.get_recipe_details("r907015")
+        assert details["id"] == "r907015"
+        assert details["ingredients"]
+        assert (await cookidoo.get_recipe_details("r907015")) == details
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_recipe_details("unknown")
+
+    async def test_shopping_list(self, cookidoo: Cookidoo) -> None:
+        """Test the shopping list is kept between the requests."""
+        ingredient_items = await cookidoo.add_ingredient_items_for_recipes(
+            ["r907015", "r907016"]
+        )
+        [item] = await cookidoo.edit_ingredient_items_ownership(
+            [{**ingredient_items[0], "is_owned": True}]
+        )
+        assert item["is_owned"]
+        [fleisch, milch] = await cookidoo.add_additional_items(["Fleisch", "Milch"])
+        [fisch] = await cookidoo.edit_additional_items([{**fleisch, "name": "Fisch"}])
+        await cookidoo.edit_additional_items_ownership([{**fisch, "is_owned": True}])
+        await cookidoo.remove_additional_items([milch["id"]])
+        await cookidoo.remove_ingredient_items_for_recipes(["r907016"])
+
+        shopping_list = await cookidoo.get_shopping_list()
+        assert [recipe["id"] for recipe in shopping_list["recipes"]] == ["r907015"]
+        assert shopping_list["ingredient_items"][0] == item
+        assert shopping_list["additional_items"] == [
+            {"id": fleisch["id"], "name": "Fisch", "is_owned": True}
+        ]
+
+        await cookidoo.clear_shopping_list()
+        assert await cookidoo.get_shopping_list_recipes() == []
+        assert await cookidoo.get_additional_items() == []
+
+    async def test_shopping_lists_per_account(
+        self, session: ClientSession, base_url: str, cookidoo: Cookidoo
+    ) -> None:
+        """Test each account has its own shopping list."""
+        other = fake_client(session, base_url, "other@email")
+        await cookidoo.add_additional_items(["Fleisch"])
+
+        assert await other.get_additional_items() == []
+
+    async def test_expired_token(
+        self, cookidoo: Cookidoo, fake_server: CookidooFakeServer
+    ) -> None:
+        """Test an expired token is rejected, then refreshed by auto auth."""
+        await cookidoo.get_user_info()
+        fake_server.expire_tokens()
+
+        await cookidoo.get_user_info()
+        assert fake_server.requests == 5
+
+    @pytest.mark.parametrize(
+        "fake_server",
+        [CookidooFakeServer(passwords={"other@email": "secret"})],
+    )
+    async def test_wrong_password(self, session: ClientSession, base_url: str) -> None:
+        """Test the passwords are checked if given."""
+        with pytest.raises(CookidooAuthException):
+            await fake_client(session, base_url, "other@email").login()
+        with pytest.raises(CookidooAuthException):
+            await fake_client(session, base_url, "unknown@email").login()
+
+    def test_main_arguments(self) -> None:
+        """Test the command line rejects invalid arguments."""
+        with pytest.raises(SystemExit):
+            main(["--port", "not-a-port"])
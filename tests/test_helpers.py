@@ -1,14 +1,17 @@
 """Unit tests for cookidoo-api."""
 
+from copy import deepcopy
 from typing import cast
 
 from dotenv import load_dotenv
 import pytest
 
+from cookidoo_api.exceptions import CookidooConfigException, CookidooParseException
 from cookidoo_api.helpers import (
     cookidoo_recipe_details_from_json,
     get_country_options,
     get_language_options,
+    get_localization,
     get_localization_options,
 )
 from cookidoo_api.types import RecipeDetailsJSON
@@ -34,10 +37,48 @@ class TestLocalization:
         """Test get language options."""
         assert len(await get_language_options()) == 31
 
+    @pytest.mark.parametrize(
+        ("locale", "country_code"), [("de-CH", "ch"), ("en-GB", "gb"), ("fr-BE", "be")]
+    )
+    def test_get_localization(self, locale: str, country_code: str) -> None:
+        """Test get the localization of a language."""
+        localization = get_localization(locale)
+        assert localization["language"] == locale
+        assert localization["country_code"] == country_code
+
+    @pytest.mark.parametrize("locale", ["en", "xx-XX"])
+    def test_get_localization_not_unique(self, locale: str) -> None:
+        """Test get the localization of an ambiguous or unknown language."""
+        with pytest.raises(CookidooConfigException):
+            get_localization(locale)
+
     async def test_cookidoo_recipe_details_from_json_exception(self) -> None:
         """Test get recipe details from json exception."""
         JSON = cast(RecipeDetailsJSON, COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS.copy())
         JSON["times"] = []
 
-        with pytest.raises(StopIteration):
+        with pytest.raises(
+            CookidooParseException, match=r"missing the field times\[type=activeTime\]"
+        ):
+            cookidoo_recipe_details_from_json(JSON)
+
+    async def test_cookidoo_recipe_details_from_json_missing_field(self) -> None:
+        """Test the path of a missing field of the recipe details."""
+        JSON = cast(
+            RecipeDetailsJSON, deepcopy(COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS)
+        )
+        del JSON["inCollections"][0]["recipesCount"]  # type: ignore[misc]
+
+        with pytest.raises(
+            CookidooParseException,
+            match=r"missing the field inCollections\[0\]\.recipesCount",
+        ):
+            cookidoo_recipe_details_from_json(JSON)
+
+    async def test_cookidoo_recipe_details_from_json_invalid_field(self) -> None:
+        """Test an invalid field of the recipe details."""
+        JSON = cast(RecipeDetailsJSON, COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS.copy())
+        JSON["servingSize"] = None  # type: ignore[typeddict-item]
+
+        with pytest.raises(CookidooParseException, match="invalid"):
             cookidoo_recipe_details_from_json(JSON)
@@ -0,0 +1,60 @@
+"""Unit tests for cookidoo-api."""
+
+from pathlib import Path
+import subprocess
+import sys
+
+from dotenv import load_dotenv
+import pytest
+
+import cookidoo_api
+from cookidoo_api import helpers
+from cookidoo_api.localization import (
+    LOCALIZATION_FILE_PATH,
+    CookidooLocalizationRegistry,
+)
+
+load_dotenv()
+
+
+class TestLazyImports:
+    """Tests for the lazy imports of the package."""
+
+    def test_no_client_import(self) -> None:
+        """Test importing the package and the helpers does not import aiohttp."""
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from cookidoo_api import get_localization_options, "
+                "CookidooConfig, LOCALIZATIONS; LOCALIZATIONS.load(); "
+                "assert 'aiohttp' not in sys.modules, 'aiohttp imported'",
+            ],
+            check=True,
+            cwd=Path(__file__).parent.parent,
+        )
+
+    @pytest.mark.parametrize("name", cookidoo_api.__all__)
+    def test_public_names(self, name: str) -> None:
+        """Test the public names are importable."""
+        assert getattr(cookidoo_api, name) is not None
+        assert name in dir(cookidoo_api)
+
+    def test_unknown_name(self) -> None:
+        """Test an unknown name."""
+        with pytest.raises(AttributeError):
+            cookidoo_api.unknown
+
+    def test_deprecated_localization_file_path(self) -> None:
+        """Test the deprecated localization file path is still available."""
+        with pytest.deprecated_call():
+            assert helpers.localization_file_path == LOCALIZATION_FILE_PATH
+        with pytest.raises(AttributeError):
+            helpers.unknown
+
+    def test_prebuilt_localizations(self) -> None:
+        """Test the prebuilt localizations match the json, run the generator if not."""
+        assert (
+            CookidooLocalizationRegistry().options()
+            == CookidooLocalizationRegistry(LOCALIZATION_FILE_PATH).options()
+        )
@@ -0,0 +1,86 @@
+"""Unit tests for cookidoo-api."""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.helpers import get_localization_options
+from cookidoo_api.localization import CookidooLocalizationRegistry
+
+load_dotenv()
+
+
+class TestCookidooLocalizationRegistry:
+    """Tests for the localization registry."""
+
+    def test_lazy_load_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the file is read on first use only."""
+        registry = CookidooLocalizationRegistry()
+        loaded = registry.loaded
+        assert len(registry.options()) == 373
+        assert (loaded, registry.loaded) == (False, True)
+        monkeypatch.setattr(
+            "builtins.open", lambda *_, **__: pytest.fail("file read again")
+        )
+        assert len(registry.options(country="ch")) == 4
+
+    @pytest.mark.parametrize(
+        ("country", "language", "count"),
+        [
+            (None, None, 373),
+            ("ch", None, 4),
+            (None, "en", 38),
+            ("ch", "de-CH", 1),
+            ("ch", "en-GB", 0),
+            ("xx", None, 0),
+        ],
+    )
+    def test_options(
+        self, country: str | None, language: str | None, count: int
+    ) -> None:
+        """Test the options of a country and a language."""
+        assert len(CookidooLocalizationRegistry().options(country, language)) == count
+
+    def test_by_url(self) -> None:
+        """Test the options of a url."""
+        options = CookidooLocalizationRegistry().by_url(
+            "https://cookidoo.be/foundation/fr-BE"
+        )
+        assert sorted(option["country_code"] for option in options) == [
+            "be",
+            "lu",
+            "nl",
+        ]
+
+    def test_sorted_lists(self) -> None:
+        """Test the countries and languages are sorted and unique."""
+        registry = CookidooLocalizationRegistry()
+        assert registry.countries() == sorted(set(registry.countries()))
+        assert len(registry.countries()) == 54
+        assert registry.languages() == sorted(set(registry.languages()))
+        assert len(registry.languages()) == 31
+
+    def test_copies(self) -> None:
+        """Test the returned options can be changed."""
+        registry = CookidooLocalizationRegistry()
+        registry.options()[0]["language"] = "changed"
+        registry.countries().clear()
+        assert registry.options()[0]["language"] != "changed"
+        assert registry.countries()
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test a missing file is reported on first use."""
+        registry = CookidooLocalizationRegistry(str(tmp_path / "missing.json"))
+        with pytest.raises(FileNotFoundError):
+            registry.options()
+
+    def test_get_not_unique(self) -> None:
+        """Test the localization of an ambiguous language."""
+        with pytest.raises(CookidooConfigException):
+            CookidooLocalizationRegistry().get("en")
+
+    async def test_async_wrappers(self) -> None:
+        """Test the async helpers use the shared registry."""
+        assert len(await get_localization_options(country="ch", language="de-CH")) == 1
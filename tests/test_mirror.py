@@ -0,0 +1,232 @@
+"""Unit tests for cookidoo-api."""
+
+import json
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+from yarl import URL
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooRequestException
+from cookidoo_api.mirror import CookidooShoppingListMirror
+from cookidoo_api.types import CookidooAdditionalItem
+from tests.conftest import echo_additional_items
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+    COOKIDOO_TEST_RESPONSE_EDIT_INGREDIENTS_OWNERSHIP,
+    COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS,
+    COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+)
+
+load_dotenv()
+
+SHOPPING_LIST_URL = "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"
+ADDITIONAL_OWNERSHIP_URL = f"{SHOPPING_LIST_URL}/additional-items/ownership/edit"
+REMOVE_ADDITIONAL_URL = f"{SHOPPING_LIST_URL}/additional-items/remove"
+FLEISCH = CookidooAdditionalItem(
+    id="01JBQGAG2VEJM15JWW9C7BQN5W", name="Fleisch", is_owned=False
+)
+VOGEL = CookidooAdditionalItem(
+    id="01JBQGAG2WH9EQ9GHH7XN7NWGP", name="Vogel", is_owned=True
+)
+
+
+async def load(mocked: aioresponses, cookidoo: Cookidoo) -> CookidooShoppingListMirror:
+    """Create a mirror of the additional items."""
+    mocked.get(SHOPPING_LIST_URL, payload=COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS)
+    mirror = CookidooShoppingListMirror(cookidoo)
+    await mirror.load()
+    return mirror
+
+
+class TestShoppingListMirror:
+    """Tests for the shopping list mirror."""
+
+    async def test_optimistic_write(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a write is applied at once and replaced by the response."""
+        mirror = await load(mocked, cookidoo)
+        assert mirror.additional_items == [FLEISCH, VOGEL]
+        mocked.post(ADDITIONAL_OWNERSHIP_URL, callback=echo_additional_items)
+
+        write = mirror.edit_additional_items_ownership([{**FLEISCH, "is_owned": True}])
+        assert mirror.additional_items == [{**FLEISCH, "is_owned": True}, VOGEL]
+        assert mirror.pending == [write]
+
+        await mirror.flush()
+        assert write.status == "flushed"
+        assert mirror.additional_items == [
+            {**FLEISCH, "name": FLEISCH["id"], "is_owned": True},
+            VOGEL,
+        ]
+        assert mirror.stats() == {
+            "pending": 0,
+            "flushed": 1,
+            "failed": 0,
+            "reconciliations": 0,
+        }
+        assert len(mocked.requests) == 2
+
+    async def test_local_ids(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test created items can be edited before they are sent."""
+        mirror = CookidooShoppingListMirror(cookidoo)
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+        )
+        mocked.post(ADDITIONAL_OWNERSHIP_URL, callback=echo_additional_items)
+
+        mirror.add_additional_items(["Fleisch", "Fisch"])
+        [fleisch, fisch] = mirror.additional_items
+        assert fisch["id"].startswith("local:")
+        mirror.edit_additional_items_ownership([{**fisch, "is_owned": True}])
+        assert mirror.additional_items[1]["is_owned"]
+
+        await mirror.flush()
+        [call] = mocked.requests[("POST", URL(ADDITIONAL_OWNERSHIP_URL))]
+        assert [
+            (item["id"], item["isOwned"])
+            for item in json.loads(call.kwargs["data"])["additionalItems"]
+        ] == [("01JBQGDMRNHAM7AMCR6YKPYKJQ", True)]
+        assert [(item["id"], item["is_owned"]) for item in mirror.additional_items] == [
+            ("01JBQGDMRMR7RJW1C8AWDGD6YP", False),
+            ("01JBQGDMRNHAM7AMCR6YKPYKJQ", True),
+        ]
+
+    async def test_failed_write(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test a failed write reloads the list, keeping the pending writes."""
+        mirror = await load(mocked, cookidoo)
+        mocked.post(ADDITIONAL_OWNERSHIP_URL, status=500)
+        mocked.post(f"{SHOPPING_LIST_URL}/additional-items/remove")
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload={
+                **COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS,
+                "additionalItems": [
+                    {"id": "other", "name": "Other", "isOwned": False},
+                    *COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS["additionalItems"][:1],
+                ],
+            },
+        )
+
+        failed = mirror.edit_additional_items_ownership([{**FLEISCH, "is_owned": True}])
+        mirror.remove_additional_items([VOGEL["id"]])
+        assert mirror.additional_items == [{**FLEISCH, "is_owned": True}]
+
+        await mirror.flush()
+        assert failed.status == "failed"
+        assert isinstance(failed.error, CookidooRequestException)
+        assert mirror.failures == [failed]
+        assert mirror.additional_items == [
+            CookidooAdditionalItem(id="other", name="Other", is_owned=False),
+            FLEISCH,
+        ]
+        assert mirror.stats() == {
+            "pending": 0,
+            "flushed": 1,
+            "failed": 1,
+            "reconciliations": 1,
+        }
+
+    async def test_remove_recipes(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test removing recipes removes their ingredient items."""
+        mocked.get(SHOPPING_LIST_URL, payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS)
+        mocked.post(f"{SHOPPING_LIST_URL}/recipes/remove")
+        mirror = CookidooShoppingListMirror(cookidoo)
+        await mirror.load()
+        assert len(mirror.ingredient_items) == 14
+
+        mirror.remove_ingredient_items_for_recipes(["r907016"])
+        assert [recipe["id"] for recipe in mirror.recipes] == ["r59322"]
+        assert len(mirror.ingredient_items) == 7
+        await mirror.flush()
+        assert mirror.stats()["flushed"] == 1
+
+    async def test_ingredient_ownership_in_recipes(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the ownership of an ingredient item is also set in its recipe."""
+        mocked.get(SHOPPING_LIST_URL, payload=COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS)
+        mirror = CookidooShoppingListMirror(cookidoo)
+        await mirror.load()
+        [item, *_] = mirror.ingredient_items
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/owned-ingredients/ownership/edit",
+            payload={
+                "data": [
+                    {
+                        **COOKIDOO_TEST_RESPONSE_EDIT_INGREDIENTS_OWNERSHIP["data"][0],
+                        "id": item["id"],
+                    }
+                ]
+            },
+        )
+
+        mirror.edit_ingredient_items_ownership([{**item, "is_owned": True}])
+        assert mirror.recipes[0]["ingredients"][0] == {**item, "is_owned": True}
+        await mirror.flush()
+        assert mirror.recipes[0]["ingredients"][0] == {**item, "is_owned": True}
+        assert mirror.ingredient_items[0]["is_owned"]
+
+    async def test_unexpected_error(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test an unexpected error fails the write without stopping the mirror."""
+        mirror = await load(mocked, cookidoo)
+        mocked.get(
+            SHOPPING_LIST_URL, payload=COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS
+        )
+        mocked.post(ADDITIONAL_OWNERSHIP_URL, callback=echo_additional_items)
+
+        with patch.object(
+            cookidoo, "remove_additional_items", side_effect=RuntimeError("bug")
+        ):
+            failed = mirror.remove_additional_items([VOGEL["id"]])
+            flushed = mirror.edit_additional_items_ownership(
+                [{**FLEISCH, "is_owned": True}]
+            )
+            await mirror.flush()
+        assert failed.status == "failed"
+        assert isinstance(failed.error, RuntimeError)
+        assert flushed.status == "flushed"
+        assert mirror.additional_items == [FLEISCH, VOGEL]
+        assert mirror.stats()["reconciliations"] == 1
+
+    async def test_edit_then_remove(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test an edited item is not brought back once removed."""
+        mirror = await load(mocked, cookidoo)
+        mocked.post(ADDITIONAL_OWNERSHIP_URL, callback=echo_additional_items)
+        mocked.post(REMOVE_ADDITIONAL_URL)
+
+        mirror.edit_additional_items_ownership([{**FLEISCH, "is_owned": True}])
+        mirror.remove_additional_items([FLEISCH["id"]])
+        await mirror.flush()
+        assert mirror.additional_items == [VOGEL]
+        assert mirror.stats()["flushed"] == 2
+
+    async def test_add_then_remove(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a created item is not brought back once removed."""
+        mirror = CookidooShoppingListMirror(cookidoo)
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+        )
+        mocked.post(REMOVE_ADDITIONAL_URL)
+
+        mirror.add_additional_items(["Fleisch", "Fisch"])
+        [fleisch, _] = mirror.additional_items
+        mirror.remove_additional_items([fleisch["id"]])
+        await mirror.flush()
+        assert [item["name"] for item in mirror.additional_items] == ["Fisch"]
+        [call] = mocked.requests[("POST", URL(REMOVE_ADDITIONAL_URL))]
+        assert json.loads(call.kwargs["data"])["additionalItemIDs"] == [
+            COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS["data"][0]["id"]
+        ]
@@ -0,0 +1,175 @@
+"""Unit tests for cookidoo-api."""
+
+from dataclasses import FrozenInstanceError
+from http import HTTPStatus
+from typing import cast
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.cache import CookidooRecipeCache
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooParseException
+from cookidoo_api.helpers import cookidoo_recipe_details_from_json
+from cookidoo_api.models import (
+    CookidooIngredientItemModel,
+    CookidooIngredientModel,
+    CookidooRecipeDetailsModel,
+    CookidooShoppingListModel,
+    CookidooUserInfoModel,
+)
+from cookidoo_api.types import RecipeDetailsJSON
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ACTIVE_SUBSCRIPTION,
+    COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+    COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+    COOKIDOO_TEST_RESPONSE_USER_INFO,
+)
+
+load_dotenv()
+
+RECIPE = cookidoo_recipe_details_from_json(
+    cast(RecipeDetailsJSON, COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS)
+)
+
+
+class TestCookidooModel:
+    """Tests for the slotted models."""
+
+    def test_round_trip(self) -> None:
+        """Test converting a dict to a model and back."""
+        model = CookidooRecipeDetailsModel.from_dict(RECIPE)
+        assert isinstance(model.ingredients[0], CookidooIngredientModel)
+        assert model.to_dict() == RECIPE
+
+    def test_mapping(self) -> None:
+        """Test the model is a read-only mapping with the keys of the dict."""
+        model = CookidooRecipeDetailsModel.from_dict(RECIPE)
+        assert model["name"] == RECIPE["name"] == model.name
+        assert model["ingredients"][0]["name"] == RECIPE["ingredients"][0]["name"]
+        assert list(model) == list(RECIPE)
+        assert len(model) == len(RECIPE)
+        assert model.get("unknown") is None
+        assert "id" in model
+        with pytest.raises(KeyError):
+            model["unknown"]
+        with pytest.raises(FrozenInstanceError):
+            model.name = "changed"  # type: ignore[misc]
+
+    def test_equality(self) -> None:
+        """Test the model equals its dict and an equal model."""
+        model = CookidooRecipeDetailsModel.from_dict(RECIPE)
+        assert model == RECIPE
+        assert model == CookidooRecipeDetailsModel.from_dict(RECIPE)
+        assert model != {**RECIPE, "name": "changed"}
+        assert model != "recipe"
+
+    def test_copy(self) -> None:
+        """Test the copy of a model is a dict which can be modified."""
+        copied = CookidooRecipeDetailsModel.from_dict(RECIPE).copy()
+        assert type(copied) is dict
+        assert copied == RECIPE
+        copied["ingredients"].append(copied["ingredients"][0])
+
+    def test_slots(self) -> None:
+        """Test the models have no instance dict."""
+        item = CookidooIngredientItemModel("id", "name", False, "description")
+        assert not hasattr(item, "__dict__")
+
+
+class TestModels:
+    """Tests for the instances returning models."""
+
+    @pytest.fixture(name="cookidoo")
+    async def models_client(self, session: ClientSession) -> Cookidoo:
+        """Create Cookidoo instance returning models."""
+        return Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, models=True)
+
+    async def test_get_recipe_details(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the recipe details are a model."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+
+        data = await cookidoo.get_recipe_details("r59322")
+        assert isinstance(data, CookidooRecipeDetailsModel)
+        assert data == RECIPE
+
+    async def test_get_shopping_list(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test the shopping list and its items are models."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+
+        data = await cookidoo.get_shopping_list()
+        assert isinstance(data, CookidooShoppingListModel)
+        items = await cookidoo.get_ingredient_items()
+        assert all(isinstance(item, CookidooIngredientItemModel) for item in items)
+        assert items == list(data["ingredient_items"])
+
+    async def test_cached_models_shared(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test the cached recipes and snapshot are kept as models."""
+        cache = CookidooRecipeCache()
+        cookidoo = Cookidoo(
+            session,
+            DEFAULT_COOKIDOO_CONFIG,
+            models=True,
+            recipe_cache=cache,
+            shopping_list_max_age=60,
+        )
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322",
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+        )
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH",
+            payload=COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES,
+        )
+
+        details = await cookidoo.get_recipe_details("r59322")
+        assert await cookidoo.get_recipe_details("r59322") is details
+        shopping_list = await cookidoo.get_shopping_list(60)
+        assert await cookidoo.get_shopping_list(60) is shopping_list
+        items = await cookidoo.get_ingredient_items()
+        assert items[0] is shopping_list["ingredient_items"][0]
+
+        dicts = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, recipe_cache=cache)
+        data = await dicts.get_recipe_details("r59322")
+        assert type(data) is dict
+        assert data == RECIPE
+
+    async def test_missing_fields(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a missing optional field is None and a missing field a parse error."""
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/community/profile",
+            payload={
+                **COOKIDOO_TEST_RESPONSE_USER_INFO,
+                "userInfo": {"username": "Test User", "picture": ""},
+            },
+        )
+        [subscription] = COOKIDOO_TEST_RESPONSE_ACTIVE_SUBSCRIPTION
+        mocked.get(
+            "https://ch.tmmobile.vorwerk-digital.com/ownership/subscriptions",
+            payload=[{key: val for key, val in subscription.items() if key != "type"}],
+        )
+
+        user_info = await cookidoo.get_user_info()
+        assert user_info == CookidooUserInfoModel("Test User", None, "")
+        with pytest.raises(CookidooParseException):
+            await cookidoo.get_active_subscription()
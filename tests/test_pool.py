@@ -0,0 +1,140 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.pool import CookidooPool
+from tests.responses import COOKIDOO_TEST_RESPONSE_USER_INFO
+
+load_dotenv()
+
+PROFILE_URL = "https://ch.tmmobile.vorwerk-digital.com/community/profile"
+
+
+async def hold(
+    pool: CookidooPool, name: str, order: list[str], release: asyncio.Event
+) -> None:
+    """Take a slot of an account until released."""
+    async with pool[name]._slot:
+        order.append(name)
+        await release.wait()
+
+
+class TestPool:
+    """Tests for the client pool."""
+
+    async def test_accounts(self, session: ClientSession) -> None:
+        """Test adding and removing accounts."""
+        pool = CookidooPool(session)
+        cookidoo = pool.add("a", DEFAULT_COOKIDOO_CONFIG)
+        assert pool["a"] is cookidoo
+        assert "a" in pool
+        assert list(pool) == ["a"]
+        with pytest.raises(CookidooConfigException):
+            pool.add("a", DEFAULT_COOKIDOO_CONFIG)
+        await pool.remove("a")
+        assert len(pool) == 0
+
+    async def test_remove_waits_for_requests(self, session: ClientSession) -> None:
+        """Test removing an account waits for its requests holding a slot."""
+        pool = CookidooPool(session)
+        pool.add("a", DEFAULT_COOKIDOO_CONFIG)
+        order: list[str] = []
+        release = asyncio.Event()
+        request = asyncio.create_task(hold(pool, "a", order, release))
+        await asyncio.sleep(0)
+
+        remove = asyncio.create_task(pool.remove("a"))
+        await asyncio.sleep(0)
+        assert not remove.done()
+        release.set()
+        await asyncio.gather(request, remove)
+        assert "a" not in pool
+
+    @pytest.mark.parametrize(("global_limit", "account_limit"), [(0, 1), (1, 0)])
+    async def test_invalid_concurrency(
+        self, session: ClientSession, global_limit: int, account_limit: int
+    ) -> None:
+        """Test the concurrencies must be positive."""
+        with pytest.raises(CookidooConfigException):
+            CookidooPool(session, global_limit, account_limit)
+
+    async def test_fair_turns(self, session: ClientSession) -> None:
+        """Test the waiting accounts are served in turn."""
+        pool = CookidooPool(session, max_concurrency=1, max_concurrency_per_account=5)
+        for name in ("a", "b"):
+            pool.add(name, DEFAULT_COOKIDOO_CONFIG)
+        order: list[str] = []
+        releases = [asyncio.Event() for _ in range(5)]
+        tasks = []
+        for name, release in zip("aaaab", releases, strict=True):
+            tasks.append(asyncio.create_task(hold(pool, name, order, release)))
+            await asyncio.sleep(0)
+        assert pool.stats() == {
+            "accounts": 2,
+            "active": 1,
+            "waiting": 4,
+            "requests": 1,
+            "wait_time": pool.stats()["wait_time"],
+        }
+
+        for release in releases:
+            release.set()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert order == ["a", "a", "b", "a", "a"]
+        assert pool.stats("a")["requests"] == 4
+        assert pool.stats()["active"] == 0
+
+    async def test_account_limit(self, session: ClientSession) -> None:
+        """Test an account at its limit does not block the others."""
+        pool = CookidooPool(session, max_concurrency=10, max_concurrency_per_account=1)
+        pool.add("a", DEFAULT_COOKIDOO_CONFIG)
+        pool.add("b", DEFAULT_COOKIDOO_CONFIG, max_concurrency=2)
+        order: list[str] = []
+        release = asyncio.Event()
+        tasks = [
+            asyncio.create_task(hold(pool, name, order, release)) for name in "aabb"
+        ]
+        await asyncio.sleep(0)
+        assert order == ["a", "b", "b"]
+        assert pool.stats("a")["waiting"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert order == ["a", "b", "b", "a"]
+
+    async def test_cancelled_waiter(self, session: ClientSession) -> None:
+        """Test a cancelled request gives its turn away."""
+        pool = CookidooPool(session, max_concurrency=1)
+        pool.add("a", DEFAULT_COOKIDOO_CONFIG)
+        order: list[str] = []
+        release = asyncio.Event()
+        first = asyncio.create_task(hold(pool, "a", order, release))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hold(pool, "a", order, release))
+        await asyncio.sleep(0)
+        second.cancel()
+        release.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert order == ["a"]
+        assert pool.stats() == {**pool.stats(), "active": 0, "waiting": 0}
+
+    async def test_requests(self, mocked: aioresponses, session: ClientSession) -> None:
+        """Test the requests of the accounts go through the pool."""
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO, repeat=True)
+        pool = CookidooPool(session, single_flight=False)
+        clients = [pool.add(name, DEFAULT_COOKIDOO_CONFIG) for name in "ab"]
+
+        await asyncio.gather(*(client.get_user_info() for client in clients))
+        await pool.close()
+        assert pool.stats()["requests"] == 2
+        assert pool.stats("b")["requests"] == 1
@@ -0,0 +1,96 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+from http import HTTPStatus
+import time
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.ratelimit import CookidooRateLimiter
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE,
+    COOKIDOO_TEST_RESPONSE_USER_INFO,
+)
+
+load_dotenv()
+
+API_HOST = "ch.tmmobile.vorwerk-digital.com"
+TOKEN_HOST = "eu.login.vorwerk.com"
+
+
+class TestCookidooRateLimiter:
+    """Tests for the rate limiter."""
+
+    def test_burst(self) -> None:
+        """Test the burst is served at once and the next requests are spaced."""
+        limiter = CookidooRateLimiter(rate=10, burst=2)
+        assert limiter.reserve(API_HOST) == 0
+        assert limiter.reserve(API_HOST) == 0
+        assert limiter.reserve(API_HOST) == pytest.approx(0.1, abs=0.01)
+        assert limiter.reserve(API_HOST) == pytest.approx(0.2, abs=0.01)
+
+    def test_buckets_per_host(self) -> None:
+        """Test each host has its own bucket and limits."""
+        limiter = CookidooRateLimiter(rate=10, burst=1, hosts={TOKEN_HOST: (1, 1)})
+        assert limiter.reserve(API_HOST) == 0
+        assert limiter.reserve(TOKEN_HOST) == 0
+        assert limiter.reserve(API_HOST) == pytest.approx(0.1, abs=0.01)
+        assert limiter.reserve(TOKEN_HOST) == pytest.approx(1, abs=0.01)
+
+    def test_refill(self) -> None:
+        """Test the bucket refills over time."""
+        limiter = CookidooRateLimiter(rate=100, burst=1)
+        limiter.reserve(API_HOST)
+        time.sleep(0.02)
+        assert limiter.reserve(API_HOST) == 0
+
+    @pytest.mark.parametrize(("rate", "burst"), [(0, 1), (1, 0.5)])
+    def test_invalid_limits(self, rate: float, burst: float) -> None:
+        """Test invalid limits."""
+        with pytest.raises(CookidooConfigException):
+            CookidooRateLimiter(rate, burst)
+
+    async def test_for_session(self, session: ClientSession) -> None:
+        """Test the limiter is shared per session."""
+        limiter = CookidooRateLimiter.for_session(session)
+        assert CookidooRateLimiter.for_session(session) is limiter
+        async with ClientSession() as other:
+            assert CookidooRateLimiter.for_session(other) is not limiter
+
+    async def test_shared_between_instances(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test the requests of several instances are limited together."""
+        limiter = CookidooRateLimiter(rate=20, burst=1)
+        clients = [
+            Cookidoo(
+                session,
+                DEFAULT_COOKIDOO_CONFIG,
+                single_flight=False,
+                rate_limiter=limiter,
+            )
+            for _ in range(2)
+        ]
+        mocked.get(
+            f"https://{API_HOST}/community/profile",
+            payload=COOKIDOO_TEST_RESPONSE_USER_INFO,
+            status=HTTPStatus.OK,
+            repeat=True,
+        )
+        mocked.post(
+            f"https://{TOKEN_HOST}/oauth2/token",
+            payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE,
+            status=HTTPStatus.OK,
+        )
+
+        start = time.monotonic()
+        await clients[0].login()
+        await asyncio.gather(*(client.get_user_info() for client in clients * 2))
+        # the token host has its own bucket, the api host spaces 3 requests
+        assert time.monotonic() - start >= 0.14
@@ -0,0 +1,191 @@
+"""Unit tests for cookidoo-api."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http import HTTPStatus
+import time
+from typing import Any
+
+from aiohttp import ClientError, ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+from yarl import URL
+
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import (
+    CookidooRequestException,
+    CookidooUnavailableException,
+)
+from cookidoo_api.retry import CookidooCircuitBreaker, CookidooRetryPolicy
+from tests.responses import COOKIDOO_TEST_RESPONSE_USER_INFO
+
+load_dotenv()
+
+PROFILE_URL = "https://ch.tmmobile.vorwerk-digital.com/community/profile"
+HOST = "ch.tmmobile.vorwerk-digital.com"
+NO_BACKOFF = CookidooRetryPolicy(backoff=0, jitter=False)
+
+
+class TestCookidooRetryPolicy:
+    """Tests for the retry policy."""
+
+    def test_exponential_backoff(self) -> None:
+        """Test the delay doubles up to the maximum."""
+        policy = CookidooRetryPolicy(
+            attempts=10, backoff=1, max_backoff=5, jitter=False
+        )
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+        assert policy.delay(10) is None
+
+    def test_jitter(self) -> None:
+        """Test the jittered delay stays within the backoff."""
+        policy = CookidooRetryPolicy(backoff=1)
+        assert all(0 <= (policy.delay(2) or 0) <= 2 for _ in range(100))
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected"),
+        [("3", 3), ("0", 0), ("-1", 0), ("60", None)],
+    )
+    def test_retry_after_seconds(
+        self, retry_after: str, expected: float | None
+    ) -> None:
+        """Test the delay of a `Retry-After` in seconds."""
+        assert CookidooRetryPolicy().delay(1, retry_after) == expected
+
+    def test_retry_after_date(self) -> None:
+        """Test the delay of a `Retry-After` http date."""
+        date = format_datetime(datetime.now(UTC) + timedelta(seconds=10), usegmt=True)
+        assert 8 < (CookidooRetryPolicy().delay(1, date) or 0) <= 10
+
+    def test_invalid_retry_after(self) -> None:
+        """Test an invalid `Retry-After` falls back to the backoff."""
+        assert NO_BACKOFF.delay(1, "soon") == 0
+
+
+class TestCookidooCircuitBreaker:
+    """Tests for the circuit breaker."""
+
+    def test_open_after_threshold(self) -> None:
+        """Test the circuit opens after consecutive failures."""
+        breaker = CookidooCircuitBreaker(failure_threshold=2)
+        breaker.record_failure(HOST)
+        breaker.record_success(HOST)
+        breaker.record_failure(HOST)
+        breaker.before_request(HOST)
+        breaker.record_failure(HOST)
+        assert breaker.is_open(HOST)
+        with pytest.raises(CookidooUnavailableException):
+            breaker.before_request(HOST)
+        breaker.before_request("other.host")
+
+    def test_probe_after_recovery_time(self) -> None:
+        """Test a single request probes the host after the recovery time."""
+        breaker = CookidooCircuitBreaker(failure_threshold=1, recovery_time=0.05)
+        breaker.record_failure(HOST)
+        with pytest.raises(CookidooUnavailableException):
+            breaker.before_request(HOST)
+        time.sleep(0.06)
+        breaker.before_request(HOST)
+        with pytest.raises(CookidooUnavailableException):
+            breaker.before_request(HOST)
+        breaker.record_success(HOST)
+        assert not breaker.is_open(HOST)
+        breaker.before_request(HOST)
+
+
+class TestRetries:
+    """Tests for the retries and the circuit breaker of the requests."""
+
+    async def test_no_retries_by_default(
+        self, mocked: aioresponses, cookidoo: Cookidoo
+    ) -> None:
+        """Test a failed request is not retried without a policy."""
+        mocked.get(PROFILE_URL, status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            {"status": HTTPStatus.SERVICE_UNAVAILABLE},
+            {"status": HTTPStatus.TOO_MANY_REQUESTS, "headers": {"Retry-After": "0"}},
+            {"exception": TimeoutError()},
+            {"exception": ClientError()},
+        ],
+    )
+    async def test_retry(
+        self, mocked: aioresponses, session: ClientSession, failure: dict[str, Any]
+    ) -> None:
+        """Test a failed request is retried."""
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, retry_policy=NO_BACKOFF)
+        mocked.get(PROFILE_URL, **failure)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        assert len(mocked.requests[("GET", URL(PROFILE_URL))]) == 2
+
+    async def test_attempts_exhausted(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test the request fails once all attempts failed."""
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, retry_policy=NO_BACKOFF)
+        mocked.get(PROFILE_URL, status=HTTPStatus.BAD_GATEWAY, repeat=True)
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.get_user_info()
+        assert len(mocked.requests[("GET", URL(PROFILE_URL))]) == 3
+
+    async def test_no_retry_of_post(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test a non idempotent request is not retried."""
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, retry_policy=NO_BACKOFF)
+        mocked.post(
+            "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH/additional-items/add",
+            status=HTTPStatus.SERVICE_UNAVAILABLE,
+            repeat=True,
+        )
+
+        with pytest.raises(CookidooRequestException):
+            await cookidoo.add_additional_items(["Fleisch"])
+        assert len(next(iter(mocked.requests.values()))) == 1
+
+    async def test_fail_fast_when_open(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test requests fail fast once the circuit is open."""
+        breaker = CookidooCircuitBreaker(failure_threshold=2)
+        cookidoo = Cookidoo(
+            session,
+            DEFAULT_COOKIDOO_CONFIG,
+            retry_policy=NO_BACKOFF,
+            circuit_breaker=breaker,
+        )
+        mocked.get(PROFILE_URL, exception=TimeoutError(), repeat=True)
+
+        with pytest.raises(CookidooUnavailableException):
+            await cookidoo.get_user_info()
+        with pytest.raises(CookidooUnavailableException):
+            await cookidoo.get_user_info()
+        assert len(mocked.requests[("GET", URL(PROFILE_URL))]) == 2
+        assert breaker.is_open(HOST)
+
+    async def test_stream_failures_open_circuit(
+        self, mocked: aioresponses, session: ClientSession
+    ) -> None:
+        """Test the failed streamed requests open the circuit."""
+        breaker = CookidooCircuitBreaker(failure_threshold=2)
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, circuit_breaker=breaker)
+        url = "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"
+        mocked.get(url, exception=ClientError(), repeat=True)
+
+        for _ in range(2):
+            with pytest.raises(CookidooRequestException):
+                [item async for item in cookidoo.iter_ingredient_items()]
+        assert breaker.is_open(HOST)
+        with pytest.raises(CookidooUnavailableException):
+            [item async for item in cookidoo.iter_ingredient_items()]
+        assert len(mocked.requests[("GET", URL(url))]) == 2
@@ -0,0 +1,110 @@
+"""Unit tests for cookidoo-api."""
+
+from collections.abc import Generator
+from http import HTTPStatus
+from pathlib import Path
+import time
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.cache import CookidooRecipeCache
+from cookidoo_api.codec import STDLIB_JSON_CODEC
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.exceptions import CookidooConfigException
+from cookidoo_api.store import CookidooRecipeStore, CookidooStoredRecipe
+from tests.responses import COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS
+
+load_dotenv()
+
+RECIPE_URL = "https://ch.tmmobile.vorwerk-digital.com/recipes/recipe/de-CH/r59322"
+
+
+@pytest.fixture(name="store")
+def recipe_store(tmp_path: Path) -> Generator[CookidooRecipeStore]:
+    """Create a recipe store."""
+    store = CookidooRecipeStore(str(tmp_path / "recipes.db"))
+    yield store
+    store.close()
+
+
+class TestRecipeStore:
+    """Tests for the recipe store."""
+
+    async def test_put_get(self, store: CookidooRecipeStore) -> None:
+        """Test storing and loading a recipe."""
+        recipe = CookidooStoredRecipe(b'{"id": "r1"}', 1.0, '"v1"', None)
+        await store.put(("de-CH", "r1"), recipe)
+        assert await store.get(("de-CH", "r1")) == recipe
+        assert await store.get(("de-CH", "r2")) is None
+
+        await store.touch(("de-CH", "r1"), 2.0)
+        stored = await store.get(("de-CH", "r1"))
+        assert stored
+        assert stored.fetched_at == 2.0
+
+    async def test_shared_between_connections(self, store: CookidooRecipeStore) -> None:
+        """Test a recipe written by one connection is read by another."""
+        await store.put(("de-CH", "r1"), CookidooStoredRecipe(b"{}", 1.0))
+        other = CookidooRecipeStore(store.path)
+        try:
+            assert await other.get_many([("de-CH", "r1")])
+        finally:
+            other.close()
+
+
+class TestCookidooRecipeStore:
+    """Tests for get_recipe_details with a recipe store."""
+
+    async def test_restart(
+        self,
+        mocked: aioresponses,
+        session: ClientSession,
+        store: CookidooRecipeStore,
+    ) -> None:
+        """Test a stored recipe is not loaded again after a restart."""
+        mocked.get(
+            RECIPE_URL,
+            payload=COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS,
+            status=HTTPStatus.OK,
+        )
+        first = await Cookidoo(
+            session,
+            DEFAULT_COOKIDOO_CONFIG,
+            recipe_cache=CookidooRecipeCache(store=store),
+        ).get_recipe_details("r59322")
+
+        cache = CookidooRecipeCache(store=store)
+        second = await Cookidoo(
+            session, DEFAULT_COOKIDOO_CONFIG, recipe_cache=cache
+        ).get_recipe_details("r59322")
+        assert first == second
+        assert cache.stats()["hits"] == 1
+
+    async def test_preload(
+        self,
+        session: ClientSession,
+        store: CookidooRecipeStore,
+    ) -> None:
+        """Test preloading stored recipes into memory."""
+        await store.put(
+            ("de-CH", "r59322"),
+            CookidooStoredRecipe(
+                STDLIB_JSON_CODEC.dumps(COOKIDOO_TEST_RESPONSE_GET_RECIPE_DETAILS),
+                time.time(),
+            ),
+        )
+        await store.put(("de-CH", "broken"), CookidooStoredRecipe(b"{}", time.time()))
+        cache = CookidooRecipeCache(store=store)
+        cookidoo = Cookidoo(session, DEFAULT_COOKIDOO_CONFIG, recipe_cache=cache)
+
+        assert await cookidoo.preload_recipe_details(["r59322", "broken", "r1"]) == 1
+        assert len(cache) == 1
+
+    async def test_preload_without_store(self, cookidoo: Cookidoo) -> None:
+        """Test preloading without a store."""
+        with pytest.raises(CookidooConfigException):
+            await cookidoo.preload_recipe_details(["r59322"])
@@ -0,0 +1,74 @@
+"""Unit tests for cookidoo-api."""
+
+from collections.abc import AsyncIterator
+import json
+from typing import Any
+
+from dotenv import load_dotenv
+import pytest
+
+from cookidoo_api.stream import iter_json_array
+from tests.responses import COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES
+
+load_dotenv()
+
+
+async def chunked(document: bytes, size: int) -> AsyncIterator[bytes]:
+    """Split a document in chunks."""
+    for start in range(0, len(document), size):
+        yield document[start : start + size]
+
+
+async def collect(document: bytes, key: str, size: int = 7) -> list[Any]:
+    """Collect the elements of an array of a document."""
+    return [element async for element in iter_json_array(chunked(document, size), key)]
+
+
+class TestIterJsonArray:
+    """Tests for the incremental json array parsing."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 16])
+    async def test_chunk_sizes(self, size: int) -> None:
+        """Test the elements are decoded whatever the chunks."""
+        document = json.dumps(
+            COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES, indent=2
+        )
+        assert (
+            await collect(document.encode(), "recipes", size)
+            == COOKIDOO_TEST_RESPONSE_GET_SHOPPING_LIST_RECIPES["recipes"]
+        )
+
+    async def test_multibyte_characters(self) -> None:
+        """Test characters split between chunks."""
+        document = json.dumps(
+            {"items": ["Rüebli", "Crème fraîche", "🥕"]}, ensure_ascii=False
+        )
+        assert await collect(document.encode(), "items", 1) == [
+            "Rüebli",
+            "Crème fraîche",
+            "🥕",
+        ]
+
+    @pytest.mark.parametrize(
+        ("document", "expected"),
+        [
+            ('{"other": {"items": [0]}, "items": [1, 22, 333]}', [1, 22, 333]),
+            ('{"items": [true, null, "a"], "other": 1}', [True, None, "a"]),
+            ('{"items": []}', []),
+            ('{"other": [1]}', []),
+            ("{}", []),
+            ('  {\n "items" :\t[ 1 ,2 ] }  ', [1, 2]),
+        ],
+    )
+    async def test_documents(self, document: str, expected: list[Any]) -> None:
+        """Test the array is found in the object."""
+        assert await collect(document.encode(), "items", 2) == expected
+
+    @pytest.mark.parametrize(
+        "document",
+        ['{"items": [1, 2', '{"items": [1 2]}', '["items"]', '{"items": [tru]}', ""],
+    )
+    async def test_invalid_documents(self, document: str) -> None:
+        """Test invalid and incomplete documents."""
+        with pytest.raises(ValueError):
+            await collect(document.encode(), "items", 3)
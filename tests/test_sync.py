@@ -0,0 +1,200 @@
+"""Unit tests for cookidoo-api."""
+
+import json
+
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+from yarl import URL
+
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.sync import CookidooShoppingListPlan, CookidooShoppingListSync
+from cookidoo_api.types import (
+    CookidooAdditionalItem,
+    CookidooIngredient,
+    CookidooRecipe,
+    CookidooShoppingList,
+)
+from tests.conftest import ingredient_item
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+    COOKIDOO_TEST_RESPONSE_ADD_INGREDIENTS_FOR_RECIPES,
+    COOKIDOO_TEST_RESPONSE_EDIT_ADDITIONAL_ITEMS_OWNERSHIP,
+    COOKIDOO_TEST_RESPONSE_EDIT_INGREDIENTS_OWNERSHIP,
+    COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS,
+    COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+)
+
+load_dotenv()
+
+SHOPPING_LIST_URL = "https://ch.tmmobile.vorwerk-digital.com/shopping/de-CH"
+
+
+def additional_item(id: str, name: str, is_owned: bool) -> CookidooAdditionalItem:
+    """Create an additional item."""
+    return CookidooAdditionalItem(id=id, name=name, is_owned=is_owned)
+
+
+def recipe(id: str, *ingredient_ids: str) -> CookidooRecipe:
+    """Create a recipe."""
+    return CookidooRecipe(
+        id=id,
+        name=id,
+        ingredients=[
+            CookidooIngredient(id=ingredient_id, name=ingredient_id, description="")
+            for ingredient_id in ingredient_ids
+        ],
+    )
+
+
+CURRENT = CookidooShoppingList(
+    recipes=[recipe("r1", "i1"), recipe("r2", "i2")],
+    ingredient_items=[ingredient_item("i1", False), ingredient_item("i2", True)],
+    additional_items=[
+        additional_item("a1", "Milk", False),
+        additional_item("a2", "Bread", True),
+        additional_item("a3", "Eggs", False),
+    ],
+)
+
+
+class TestPlan:
+    """Tests for the shopping list changes."""
+
+    def test_unchanged(self) -> None:
+        """Test no changes are planned for the current state."""
+        plan = CookidooShoppingListSync.plan(
+            CURRENT,
+            {
+                "recipe_ids": ["r2", "r1"],
+                "additional_items": {"Eggs": False, "Milk": False, "Bread": True},
+                "ingredient_items_ownership": {"i2": True},
+            },
+        )
+        assert plan == CookidooShoppingListPlan()
+        assert plan.calls == 0
+
+    def test_missing_parts(self) -> None:
+        """Test the missing parts of the state are left as they are."""
+        assert CookidooShoppingListSync.plan(CURRENT, {}).calls == 0
+
+    def test_changes(self) -> None:
+        """Test the changes are batched by endpoint."""
+        plan = CookidooShoppingListSync.plan(
+            CURRENT,
+            {
+                "recipe_ids": ["r2", "r3", "r3"],
+                "additional_items": {
+                    "Milk": True,
+                    "Butter": True,
+                    "Jam": False,
+                    "Tea": True,
+                },
+                "ingredient_items_ownership": {"i1": True, "i2": False, "i9": True},
+            },
+        )
+        assert plan == CookidooShoppingListPlan(
+            add_recipe_ids=["r3"],
+            remove_recipe_ids=["r1"],
+            add_additional_items={"Tea": True},
+            rename_additional_items=[
+                additional_item("a2", "Butter", True),
+                additional_item("a3", "Jam", False),
+            ],
+            additional_items_ownership=[additional_item("a1", "Milk", True)],
+            ingredient_items_ownership=[ingredient_item("i2", False)],
+            added_ingredient_items_ownership={"i9": True},
+        )
+        assert plan.calls == 6
+
+    def test_rename_with_other_ownership(self) -> None:
+        """Test renaming an item to a name with another ownership."""
+        plan = CookidooShoppingListSync.plan(
+            CURRENT, {"additional_items": {"Milk": False, "Jam": False}}
+        )
+        renamed = additional_item("a2", "Jam", False)
+        assert plan == CookidooShoppingListPlan(
+            rename_additional_items=[additional_item("a3", "Jam", False)],
+            remove_additional_item_ids=["a2"],
+        )
+        plan = CookidooShoppingListSync.plan(
+            CURRENT, {"additional_items": {"Milk": False, "Eggs": False, "Jam": False}}
+        )
+        assert plan == CookidooShoppingListPlan(
+            rename_additional_items=[renamed],
+            additional_items_ownership=[renamed],
+        )
+        assert plan.calls == 2
+
+    def test_remove_all(self) -> None:
+        """Test emptying the shopping list."""
+        plan = CookidooShoppingListSync.plan(
+            CURRENT,
+            {
+                "recipe_ids": [],
+                "additional_items": {},
+                "ingredient_items_ownership": {"i1": True},
+            },
+        )
+        assert sorted(plan.remove_recipe_ids) == ["r1", "r2"]
+        assert plan.remove_additional_item_ids == ["a1", "a2", "a3"]
+        assert not plan.ingredient_items_ownership
+        assert not plan.added_ingredient_items_ownership
+        assert plan.calls == 2
+
+
+class TestSync:
+    """Tests for the shopping list synchronization."""
+
+    async def test_sync(self, mocked: aioresponses, cookidoo: Cookidoo) -> None:
+        """Test the changes are sent with one request per endpoint."""
+        mocked.get(
+            SHOPPING_LIST_URL,
+            payload={
+                **COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS,
+                "recipes": COOKIDOO_TEST_RESPONSE_GET_INGREDIENTS["recipes"][:1],
+                "additionalItems": COOKIDOO_TEST_RESPONSE_GET_ADDITIONAL_ITEMS[
+                    "additionalItems"
+                ][1:],
+            },
+        )
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/recipes/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_INGREDIENTS_FOR_RECIPES,
+        )
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/additional-items/add",
+            payload=COOKIDOO_TEST_RESPONSE_ADD_ADDITIONAL_ITEMS,
+        )
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/owned-ingredients/ownership/edit",
+            payload=COOKIDOO_TEST_RESPONSE_EDIT_INGREDIENTS_OWNERSHIP,
+        )
+        mocked.post(
+            f"{SHOPPING_LIST_URL}/additional-items/ownership/edit",
+            payload=COOKIDOO_TEST_RESPONSE_EDIT_ADDITIONAL_ITEMS_OWNERSHIP,
+        )
+
+        plan = await CookidooShoppingListSync(cookidoo).sync(
+            {
+                "recipe_ids": ["r907016", "r59322"],
+                "additional_items": {"Vogel": True, "Fleisch": False, "Fisch": True},
+                "ingredient_items_ownership": {"01JBQEYRFQWG8ZQ20SMKB1JP6S": True},
+            }
+        )
+
+        assert plan.calls == 4
+        assert len(mocked.requests) == 5
+        ingredients = mocked.requests[
+            ("POST", URL(f"{SHOPPING_LIST_URL}/owned-ingredients/ownership/edit"))
+        ][0].kwargs["data"]
+        assert [
+            (item["id"], item["isOwned"])
+            for item in json.loads(ingredients)["ingredients"]
+        ] == [("01JBQEYRFQWG8ZQ20SMKB1JP6S", True)]
+        additional = mocked.requests[
+            ("POST", URL(f"{SHOPPING_LIST_URL}/additional-items/ownership/edit"))
+        ][0].kwargs["data"]
+        assert [
+            (item["id"], item["isOwned"])
+            for item in json.loads(additional)["additionalItems"]
+        ] == [("01JBQGDMRNHAM7AMCR6YKPYKJQ", True)]
@@ -0,0 +1,185 @@
+"""Unit tests for cookidoo-api."""
+
+import asyncio
+import os
+from pathlib import Path
+import stat
+import time
+from typing import cast
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+from dotenv import load_dotenv
+import pytest
+from yarl import URL
+
+from cookidoo_api.const import DEFAULT_COOKIDOO_CONFIG
+from cookidoo_api.cookidoo import Cookidoo
+from cookidoo_api.tokens import (
+    CookidooFileTokenStore,
+    CookidooSQLiteTokenStore,
+    CookidooStoredToken,
+    CookidooTokenStore,
+)
+from cookidoo_api.types import CookidooAuthResponse
+from tests.responses import (
+    COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE,
+    COOKIDOO_TEST_RESPONSE_USER_INFO,
+)
+
+load_dotenv()
+
+TOKEN_URL = "https://eu.login.vorwerk.com/oauth2/token"
+PROFILE_URL = "https://ch.tmmobile.vorwerk-digital.com/community/profile"
+AUTH_DATA = cast(CookidooAuthResponse, COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+EMAIL = DEFAULT_COOKIDOO_CONFIG["email"]
+
+
+@pytest.fixture(name="store", params=["file", "sqlite"])
+def token_store(request: pytest.FixtureRequest, tmp_path: Path) -> CookidooTokenStore:
+    """Create a token store of each kind."""
+    if request.param == "file":
+        return CookidooFileTokenStore(str(tmp_path / "tokens"))
+    return CookidooSQLiteTokenStore(str(tmp_path / "tokens.db"))
+
+
+class TestTokenStore:
+    """Tests for the token stores."""
+
+    async def test_round_trip(self, store: CookidooTokenStore) -> None:
+        """Test a saved token is loaded back."""
+        assert await store.load(EMAIL) is None
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, 1000))
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, 2000))
+
+        assert await store.load(EMAIL) == CookidooStoredToken(AUTH_DATA, 2000)
+        assert await store.load("other@email") is None
+
+    async def test_corrupted_file(self, tmp_path: Path) -> None:
+        """Test a corrupted token file is ignored."""
+        store = CookidooFileTokenStore(str(tmp_path))
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, 1000))
+        (token_file,) = tmp_path.glob("*.json")
+        token_file.write_text("{")
+
+        assert await store.load(EMAIL) is None
+
+    async def test_corrupted_row(self, tmp_path: Path) -> None:
+        """Test a corrupted token row is ignored."""
+        store = CookidooSQLiteTokenStore(str(tmp_path / "tokens.db"))
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, 1000))
+        store._connection.execute("UPDATE tokens SET auth_data = '{'")
+
+        assert await store.load(EMAIL) is None
+
+    async def test_sqlite_account_ids(self, tmp_path: Path) -> None:
+        """Test the accounts are stored by their ids, ignoring the case."""
+        store = CookidooSQLiteTokenStore(str(tmp_path / "tokens.db"))
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, 1000))
+
+        assert await store.load(EMAIL.upper()) == CookidooStoredToken(AUTH_DATA, 1000)
+        [(account,)] = store._connection.execute("SELECT account FROM tokens")
+        assert EMAIL not in account
+
+    @pytest.mark.skipif(os.name == "nt", reason="no unix permissions")
+    def test_sqlite_permissions(self, tmp_path: Path) -> None:
+        """Test the database files are only readable by the user."""
+        CookidooSQLiteTokenStore(str(tmp_path / "tokens.db"))
+
+        files = list(tmp_path.glob("tokens.db*"))
+        assert len(files) == 3
+        assert all(stat.S_IMODE(file.stat().st_mode) == 0o600 for file in files)
+
+    async def test_lock_between_stores(self, tmp_path: Path) -> None:
+        """Test the lock of an account is exclusive between store instances."""
+        first = CookidooFileTokenStore(str(tmp_path), poll_interval=0.01)
+        second = CookidooFileTokenStore(str(tmp_path), poll_interval=0.01)
+
+        async with first.lock(EMAIL):
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.1), second.lock(EMAIL):
+                    pass
+            async with second.lock("other@email"):
+                pass
+        async with asyncio.timeout(1), second.lock(EMAIL):
+            pass
+
+
+class TestClientTokenStore:
+    """Tests for the client with a token store."""
+
+    @pytest.fixture(name="cookidoo")
+    async def store_client(
+        self, session: ClientSession, store: CookidooTokenStore
+    ) -> Cookidoo:
+        """Create Cookidoo instance with auto auth and a token store."""
+        return Cookidoo(
+            session, DEFAULT_COOKIDOO_CONFIG, auto_auth=True, token_store=store
+        )
+
+    async def test_stored_token_used(
+        self, mocked: aioresponses, cookidoo: Cookidoo, store: CookidooTokenStore
+    ) -> None:
+        """Test a valid stored token is used without logging in."""
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, int(time.time()) + 3600))
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        assert ("POST", URL(TOKEN_URL)) not in mocked.requests
+        assert cookidoo.expires_in > 3000
+
+    async def test_token_saved_after_login(
+        self, mocked: aioresponses, cookidoo: Cookidoo, store: CookidooTokenStore
+    ) -> None:
+        """Test the token of a login is saved to the store."""
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        stored = await store.load(EMAIL)
+        assert stored is not None
+        assert stored.auth_data["access_token"] == AUTH_DATA["access_token"]
+        assert stored.expires_at > time.time() + 3600
+
+    async def test_expiring_stored_token_refreshed(
+        self, mocked: aioresponses, cookidoo: Cookidoo, store: CookidooTokenStore
+    ) -> None:
+        """Test an expiring stored token is refreshed and saved again."""
+        await store.save(EMAIL, CookidooStoredToken(AUTH_DATA, int(time.time())))
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        with patch.object(
+            cookidoo, "refresh_token", wraps=cookidoo.refresh_token
+        ) as refresh_token:
+            await cookidoo.get_user_info()
+        refresh_token.assert_awaited_once()
+        stored = await store.load(EMAIL)
+        assert stored is not None
+        assert stored.expires_at > time.time() + 3600
+
+    async def test_token_replaced_by_other_process(
+        self,
+        mocked: aioresponses,
+        session: ClientSession,
+        cookidoo: Cookidoo,
+        store: CookidooTokenStore,
+    ) -> None:
+        """Test a token refreshed by another client is loaded instead."""
+        other = Cookidoo(
+            session, DEFAULT_COOKIDOO_CONFIG, auto_auth=True, token_store=store
+        )
+        mocked.post(TOKEN_URL, payload=COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE)
+        await other.login()
+        cookidoo.auth_data = cast(
+            CookidooAuthResponse,
+            {**COOKIDOO_TEST_RESPONSE_AUTH_RESPONSE, "access_token": "stale"},
+        )
+        cookidoo.expires_in = 0
+        mocked.get(PROFILE_URL, payload=COOKIDOO_TEST_RESPONSE_USER_INFO)
+
+        await cookidoo.get_user_info()
+        assert len(mocked.requests[("POST", URL(TOKEN_URL))]) == 1
+        assert cookidoo.auth_data is not None
+        assert cookidoo.auth_data["access_token"] == AUTH_DATA["access_token"]